@@ -43,6 +43,8 @@ import sickrage
 from sickrage.core.api import API
 from sickrage.core.caches.name_cache import NameCache
 from sickrage.core.caches.quicksearch_cache import QuicksearchCache
+from sickrage.core.caches.show_stats_cache import ShowStatsCache
+from sickrage.core.classes import ShowList
 from sickrage.core.common import SD, SKIPPED, WANTED
 from sickrage.core.config import Config
 from sickrage.core.databases.cache import CacheDB
@@ -83,7 +85,7 @@ class Core(object):
         self.daemon = None
         self.io_loop = None
         self.pid = os.getpid()
-        self.showlist = []
+        self._showlist = ShowList()
 
         try:
             self.tz = tz.tzwinlocal() if tz.tzwinlocal else tz.tzlocal()
@@ -153,9 +155,19 @@ class Core(object):
         self.upnp_client = None
         self.oidc_client = None
         self.quicksearch_cache = None
+        self.show_stats_cache = None
+
+    @property
+    def showlist(self):
+        return self._showlist
+
+    @showlist.setter
+    def showlist(self, value):
+        self._showlist = value if isinstance(value, ShowList) else ShowList(value)
 
     def start(self):
         self.started = True
+        startup_time = time.time()
         self.io_loop = IOLoop.current()
 
         # thread name
@@ -193,6 +205,7 @@ class Core(object):
         self.auto_postprocessor = AutoPostProcessor()
         self.upnp_client = UPNPClient()
         self.quicksearch_cache = QuicksearchCache()
+        self.show_stats_cache = ShowStatsCache()
 
         # setup oidc client
         realm = KeycloakRealm(server_url='https://auth.sickrage.ca', realm_name='sickrage')
@@ -258,6 +271,7 @@ class Core(object):
             self.log.error('Failed getting disk space: %s', traceback.format_exc())
 
         # perform database startup actions
+        start_time = time.time()
         for db in [self.main_db, self.cache_db]:
             # initialize database
             db.initialize()
@@ -279,11 +293,20 @@ class Core(object):
             self.main_db.compact()
             self.config.last_db_compact = int(time.time())
 
+        self.log.info("Database startup actions completed in {:.2f}s".format(time.time() - start_time))
+
         # load name cache
+        start_time = time.time()
         self.name_cache.load()
 
+        # load network timezones
+        self.tz_updater.load_network_timezones()
+        self.log.info("Loaded name cache and network timezones in {:.2f}s".format(time.time() - start_time))
+
         # load data for shows from database
-        self.load_shows()
+        start_time = time.time()
+        self.load_shows(header_only=self.config.lazy_load_shows)
+        self.log.info("Loaded {} shows in {:.2f}s".format(len(self.showlist), time.time() - start_time))
 
         if self.config.default_page not in ('schedule', 'history', 'IRC'):
             self.config.default_page = 'home'
@@ -474,6 +497,26 @@ class Core(object):
             id=self.name_cache.name
         )
 
+        # add namecache save job
+        self.scheduler.add_job(
+            self.name_cache.save,
+            IntervalTrigger(
+                minutes=1,
+            ),
+            name=self.name_cache.name + '_SAVE',
+            id=self.name_cache.name + '_SAVE'
+        )
+
+        # add show stats check job
+        self.scheduler.add_job(
+            self.show_stats_cache.check,
+            IntervalTrigger(
+                hours=6,
+            ),
+            name=self.show_stats_cache.name,
+            id=self.show_stats_cache.name
+        )
+
         # start scheduler service
         self.scheduler.start()
 
@@ -484,13 +527,18 @@ class Core(object):
         self.event_queue.start()
 
         # fire off startup events
+        if self.config.lazy_load_shows:
+            self.event_queue.fire_event(self.load_show_details)
         self.event_queue.fire_event(self.name_cache.build_all)
+        self.event_queue.fire_event(self.show_stats_cache.check)
         self.event_queue.fire_event(self.version_updater.run)
         self.event_queue.fire_event(self.tz_updater.run)
 
         # start webserver
         self.wserver.start()
 
+        self.log.info("SiCKRAGE started in {:.2f}s".format(time.time() - startup_time))
+
         # launch browser window
         if all([not sickrage.app.no_launch, sickrage.app.config.launch_browser]):
             self.event_queue.fire_event(lambda: launch_browser(('http', 'https')[sickrage.app.config.enable_https],
@@ -570,22 +618,48 @@ class Core(object):
             except Exception:
                 continue
 
+        # write pending name cache changes
+        self.name_cache.save()
+
         # save config
         self.config.save()
 
-    def load_shows(self):
+    def load_shows(self, header_only=False):
         """
         Populates the showlist and quicksearch cache with shows and episodes from the database
+
+        :param header_only: only load the show records, IMDb info and the quicksearch cache are left to
+                            load_show_details
         """
 
-        self.quicksearch_cache.load()
+        if not header_only:
+            self.quicksearch_cache.load()
 
         for dbData in self.main_db.all('tv_shows'):
-            show = TVShow(int(dbData['indexer']), int(dbData['indexer_id']))
+            show = TVShow(int(dbData['indexer']), int(dbData['indexer_id']), dbData=dbData, skipNFO=header_only)
 
             try:
                 self.log.debug("Loading data for show: [{}]".format(show.name))
                 self.showlist.append(show)
+                if not header_only:
+                    self.quicksearch_cache.add_show(show.indexerid)
+            except Exception as e:
+                self.log.debug("Show error in [%s]: %s" % (show.location, str(e)))
+
+    def load_show_details(self):
+        """
+        Loads the show data skipped by a header only load_shows
+        """
+
+        start_time = time.time()
+
+        self.quicksearch_cache.load()
+
+        for show in self.showlist[:]:
+            try:
+                show.load_imdb_info_from_db()
                 self.quicksearch_cache.add_show(show.indexerid)
             except Exception as e:
                 self.log.debug("Show error in [%s]: %s" % (show.location, str(e)))
+
+        self.log.info("Loaded show details in {:.2f}s".format(time.time() - start_time))
@@ -19,7 +19,7 @@
 
 from __future__ import unicode_literals
 
-import time
+import threading
 from datetime import datetime, timedelta
 
 import sickrage
@@ -29,21 +29,31 @@ from sickrage.core.scene_exceptions import retrieve_exceptions, get_scene_season
 
 
 class NameCache(object):
+    """
+    Maps scene names to indexer ids.
+
+    The in-memory dict is authoritative, changes are queued and written to the cache db in batches by save.
+    """
+
     def __init__(self, *args, **kwargs):
         self.name = "NAMECACHE"
         self.min_time = 10
         self.last_update = {}
         self.cache = {}
+        self.indexer_ids = {}
+        self.lock = threading.RLock()
+        self.save_lock = threading.Lock()
+        self.pending_names = {}
+        self.pending_clears = set()
 
     def should_update(self, show):
         # if we've updated recently then skip the update
-        if datetime.today() - (self.last_update.get(show.name) or datetime.fromtimestamp(
-                int(time.mktime(datetime.today().timetuple())))) < timedelta(minutes=self.min_time):
-            return True
+        last_update = self.last_update.get(show.name)
+        return not last_update or datetime.today() - last_update >= timedelta(minutes=self.min_time)
 
     def put(self, name, indexer_id=0):
         """
-        Adds the show & tvdb id to the scene_names table in cache db
+        Adds the show & tvdb id to the name cache, the scene_names table in cache db is updated on the next save
 
         :param name: The show name to cache
         :param indexer_id: the TVDB id that this show should be cached with (can be None/0 for unknown)
@@ -51,21 +61,20 @@ class NameCache(object):
 
         # standardize the name we're using to account for small differences in providers
         name = full_sanitizeSceneName(name)
+        indexer_id = int(indexer_id or 0)
 
-        self.cache[name] = int(indexer_id)
+        with self.lock:
+            if self.cache.get(name) == indexer_id:
+                return
 
-        dbData = [x for x in sickrage.app.cache_db.get_many('scene_names', name) if x['indexer_id'] == indexer_id]
-        if not len(dbData):
-            # insert name into cache
-            sickrage.app.cache_db.insert({
-                '_t': 'scene_names',
-                'indexer_id': indexer_id,
-                'name': name
-            })
+            self._remove(name)
+            self.cache[name] = indexer_id
+            self.indexer_ids.setdefault(indexer_id, set()).add(name)
+            self.pending_names[name] = indexer_id
 
     def get(self, name):
         """
-        Looks up the given name in the scene_names table in cache db
+        Looks up the given name in the name cache
 
         :param name: The show name to look up.
         :return: the TVDB id that resulted from the cache lookup or None if the show wasn't found in the cache
@@ -74,35 +83,75 @@ class NameCache(object):
         if name in self.cache:
             return int(self.cache[name])
 
+    def _remove(self, name):
+        indexer_id = self.cache.pop(name, None)
+        if indexer_id is not None:
+            self.indexer_ids.get(indexer_id, set()).discard(name)
+            if not self.indexer_ids.get(indexer_id):
+                self.indexer_ids.pop(indexer_id, None)
+
     def clear(self, indexerid=None, name=None):
         """
         Deletes all entries from the cache matching the indexerid or name.
         """
-        if any([indexerid, name]):
-            for x in sickrage.app.cache_db.all('scene_names'):
-                if x['indexer_id'] == indexerid or x['name'] == name:
-                    sickrage.app.cache_db.delete(x)
 
-            for key, value in self.cache.items():
-                if value == indexerid or key == name:
-                    del self.cache[key]
+        with self.lock:
+            if indexerid:
+                for x in self.indexer_ids.pop(indexerid, set()):
+                    self.cache.pop(x, None)
+                    self.pending_names.pop(x, None)
+                self.pending_clears.add(indexerid)
+
+            if name:
+                self._remove(name)
+                self.pending_names[name] = None
 
     def load(self):
-        self.cache = dict([(x['name'], x['indexer_id']) for x in sickrage.app.cache_db.all('scene_names')])
+        with self.lock:
+            self.cache = dict([(x['name'], x['indexer_id']) for x in sickrage.app.cache_db.all('scene_names')])
+            self.indexer_ids = {}
+            for name, indexer_id in self.cache.items():
+                self.indexer_ids.setdefault(indexer_id, set()).add(name)
+            self.pending_names = {}
+            self.pending_clears = set()
 
     def save(self):
-        """Commit cache to database file"""
-        for name, indexer_id in self.cache.items():
-            dbData = [x for x in sickrage.app.cache_db.get_many('scene_names', name) if x['indexer_id'] == indexer_id]
-            if len(dbData):
-                continue
-
-            # insert name into cache
-            sickrage.app.cache_db.insert({
-                '_t': 'scene_names',
-                'indexer_id': indexer_id,
-                'name': name
-            })
+        """Commit pending cache changes to database file"""
+
+        with self.save_lock:
+            with self.lock:
+                pending_names, self.pending_names = self.pending_names, {}
+                pending_clears, self.pending_clears = self.pending_clears, set()
+
+            if not any([pending_names, pending_clears]):
+                return
+
+            try:
+                with sickrage.app.cache_db.bulk():
+                    for indexer_id in pending_clears:
+                        for x in sickrage.app.cache_db.get_many('scene_names_indexer_id', indexer_id):
+                            sickrage.app.cache_db.delete(x)
+
+                    for name, indexer_id in pending_names.items():
+                        for x in sickrage.app.cache_db.get_many('scene_names', name):
+                            sickrage.app.cache_db.delete(x)
+
+                        if indexer_id is not None:
+                            # insert name into cache
+                            sickrage.app.cache_db.insert({
+                                '_t': 'scene_names',
+                                'indexer_id': indexer_id,
+                                'name': name
+                            })
+            except Exception:
+                # queue the changes again, names are written the way they are in memory by the next save
+                with self.lock:
+                    for name in pending_names:
+                        self.pending_names.setdefault(name, self.cache.get(name))
+                    self.pending_clears |= pending_clears
+                raise
+
+            sickrage.app.log.debug("Saved {} name cache changes".format(len(pending_names) + len(pending_clears)))
 
     def build(self, show):
         """Build internal name cache
@@ -113,9 +162,7 @@ class NameCache(object):
         retrieve_exceptions()
 
         if self.should_update(show):
-            self.last_update[show.name] = datetime.fromtimestamp(int(time.mktime(datetime.today().timetuple())))
-
-            self.clear(show.indexerid)
+            self.last_update[show.name] = datetime.today()
 
             show_names = []
             for curSeason in [-1] + get_scene_seasons(show.indexerid):
@@ -124,9 +171,15 @@ class NameCache(object):
                     show_names.append(strip_accents(name))
                     show_names.append(strip_accents(name).replace("'", " "))
 
-            for show_name in set(show_names):
-                self.clear(show_name)
-                self.put(show_name, show.indexerid)
+            show_names = set(full_sanitizeSceneName(x) for x in show_names)
+
+            with self.lock:
+                # only names that changed are queued for saving
+                for name in self.indexer_ids.get(show.indexerid, set()) - show_names:
+                    self.clear(name=name)
+
+                for show_name in show_names:
+                    self.put(show_name, show.indexerid)
 
     def build_all(self):
         for show in sickrage.app.showlist:
@@ -18,82 +18,244 @@
 
 from __future__ import unicode_literals
 
+import bisect
+import threading
+
 import sickrage
 from sickrage.core.media.util import showImage
 
 
+class QuicksearchIndex(object):
+    """
+    Inverted index of the words in quicksearch names.
+
+    Every suffix of every word is kept in a sorted list, so the words containing a term are found with a bisect
+    instead of a scan over every name.
+    """
+
+    def __init__(self):
+        self.names = {}
+        self.words = {}
+        self.suffixes = []
+
+    @staticmethod
+    def _suffixes(word):
+        return [(word[i:], i, word) for i in range(len(word))]
+
+    def build(self, items):
+        """
+        Replaces the contents of the index
+
+        :param items: iterable of (key, name) tuples
+        """
+
+        self.names = {}
+        self.words = {}
+
+        for key, name in items:
+            self.names[key] = (name or '').lower()
+            for word in set(self.names[key].split()):
+                self.words.setdefault(word, set()).add(key)
+
+        self.suffixes = sorted(x for word in self.words for x in self._suffixes(word))
+
+    def add(self, key, name):
+        self.remove(key)
+
+        self.names[key] = (name or '').lower()
+        for word in set(self.names[key].split()):
+            if word not in self.words:
+                self.words[word] = set()
+                for x in self._suffixes(word):
+                    bisect.insort(self.suffixes, x)
+            self.words[word].add(key)
+
+    def remove(self, key):
+        name = self.names.pop(key, None)
+        if name is None:
+            return
+
+        for word in set(name.split()):
+            self.words[word].discard(key)
+            if self.words[word]:
+                continue
+
+            del self.words[word]
+            for x in self._suffixes(word):
+                i = bisect.bisect_left(self.suffixes, x)
+                if i < len(self.suffixes) and self.suffixes[i] == x:
+                    del self.suffixes[i]
+
+    def _matching_words(self, term):
+        """
+        Yields the words containing term, words starting with it come first
+
+        :param term: lower case term without whitespace
+        """
+
+        start = bisect.bisect_left(self.suffixes, (term,))
+        end = bisect.bisect_left(self.suffixes, (term + '\uffff',), start)
+
+        for prefix in (True, False):
+            for i in range(start, end):
+                suffix, offset, word = self.suffixes[i]
+                if (offset == 0) == prefix:
+                    yield word
+
+    def search(self, term, limit=None):
+        """
+        Returns the keys of the names containing term
+
+        :param term: search term, matched case insensitive anywhere in the name
+        :param limit: maximum number of keys to return
+        :return: list of keys, names with a word starting with the term first
+        """
+
+        term = term.lower()
+        results = []
+
+        parts = term.split()
+        if not parts:
+            candidates = iter(self.names)
+        else:
+            # the longest word of the term is the most selective one
+            candidates = (key for word in self._matching_words(max(parts, key=len)) for key in self.words[word])
+
+        seen = set()
+        for key in candidates:
+            if key in seen:
+                continue
+            seen.add(key)
+
+            if term in self.names[key]:
+                results.append(key)
+                if limit and len(results) >= limit:
+                    break
+
+        return results
+
+
 class QuicksearchCache(object):
     def __init__(self):
+        self.lock = threading.RLock()
         self.cache = {
             'shows': {},
             'episodes': {}
         }
+        self.index = {
+            'shows': QuicksearchIndex(),
+            'episodes': QuicksearchIndex()
+        }
+        self.show_episodes = {}
 
     def load(self):
-        for x in sickrage.app.cache_db.all('quicksearch'):
-            if x['category'] == 'shows':
-                self.cache['shows'][x['showid']] = x
-            elif x['category'] == 'episodes':
-                self.cache['episodes'][x['episodeid']] = x
+        with self.lock:
+            for x in sickrage.app.cache_db.all('quicksearch'):
+                if x['category'] == 'shows':
+                    self.cache['shows'][x['showid']] = x
+                elif x['category'] == 'episodes':
+                    self.cache['episodes'][x['episodeid']] = x
+                    self.show_episodes.setdefault(x['showid'], set()).add(x['episodeid'])
+
+            for category in self.cache:
+                self.index[category].build((k, v['name']) for k, v in self.cache[category].items())
 
         sickrage.app.log.debug("Loaded {} shows to QuickSearch cache".format(len(self.cache['shows'])))
         sickrage.app.log.debug("Loaded {} episodes to QuickSearch cache".format(len(self.cache['episodes'])))
 
-    def get_shows(self, term):
-        return [d for d in self.cache['shows'].values() if term.lower() in d['name'].lower()]
+    def _get(self, category, term, limit=None):
+        with self.lock:
+            return [self.cache[category][k] for k in self.index[category].search(term, limit)]
 
-    def get_episodes(self, term):
-        return [d for d in self.cache['episodes'].values() if term.lower() in d['name'].lower()]
+    def get_shows(self, term, limit=None):
+        return self._get('shows', term, limit)
+
+    def get_episodes(self, term, limit=None):
+        return self._get('episodes', term, limit)
 
     def update_show(self, indexerid):
-        self.del_show(indexerid)
-        self.add_show(indexerid)
+        dbData = sickrage.app.main_db.get('tv_shows', indexerid)
+        if not dbData:
+            return
 
-    def add_show(self, indexerid):
-        show_name = sickrage.app.main_db.get('tv_shows', indexerid)['show_name']
+        show_name = dbData['show_name']
+        img = sickrage.app.config.web_root + showImage(indexerid, 'poster_thumb').url
+        episodes = list(sickrage.app.main_db.get_many('tv_episodes', indexerid))
 
-        if indexerid not in self.cache['shows']:
-            sickrage.app.log.debug("Adding show {} to QuickSearch cache".format(show_name))
+        qsData = [{
+            '_t': 'quicksearch',
+            'category': 'shows',
+            'showid': indexerid,
+            'seasons': len(set([e['season'] for e in episodes if e['season'] != 0])),
+            'name': show_name,
+            'img': img
+        }]
 
-            qsData = {
+        for e in episodes:
+            qsData.append({
                 '_t': 'quicksearch',
-                'category': 'shows',
-                'showid': indexerid,
-                'seasons': len(set([e['season'] for e in sickrage.app.main_db.get_many('tv_episodes', indexerid) if e['season'] != 0])),
-                'name': show_name,
-                'img': sickrage.app.config.web_root + showImage(indexerid, 'poster_thumb').url
-            }
-
-            self.cache['shows'][indexerid] = qsData
-            sickrage.app.cache_db.insert(qsData)
-
-            for e in sickrage.app.main_db.get_many('tv_episodes', indexerid):
-                qsData = {
-                    '_t': 'quicksearch',
-                    'category': 'episodes',
-                    'showid': e['showid'],
-                    'episodeid': e['indexerid'],
-                    'season': e['season'],
-                    'episode': e['episode'],
-                    'name': e['name'],
-                    'showname': show_name,
-                    'img': sickrage.app.config.web_root + showImage(e['showid'], 'poster_thumb').url
-                }
-
-                self.cache['episodes'][e['indexerid']] = qsData
-                sickrage.app.cache_db.insert(qsData)
+                'category': 'episodes',
+                'showid': e['showid'],
+                'episodeid': e['indexerid'],
+                'season': e['season'],
+                'episode': e['episode'],
+                'name': e['name'],
+                'showname': show_name,
+                'img': img
+            })
 
-    def del_show(self, indexerid):
-        show_name = sickrage.app.main_db.get('tv_shows', indexerid)['show_name']
+        with self.lock, sickrage.app.cache_db.bulk():
+            # only write the records that changed
+            dbData = {}
+            for x in sickrage.app.cache_db.get_many('quicksearch', indexerid):
+                key = (x['category'], x.get('episodeid'))
+                if key in dbData:
+                    sickrage.app.cache_db.delete(x)
+                else:
+                    dbData[key] = x
+
+            for data in qsData:
+                doc = dbData.pop((data['category'], data.get('episodeid')), None)
+                if doc is None:
+                    sickrage.app.cache_db.insert(data)
+                    doc = data
+                elif any(doc.get(k) != v for k, v in data.items()):
+                    doc.update(data)
+                    sickrage.app.cache_db.update(doc)
+
+                if doc['category'] == 'shows':
+                    self.cache['shows'][indexerid] = doc
+                    self.index['shows'].add(indexerid, doc['name'])
+                else:
+                    self.cache['episodes'][doc['episodeid']] = doc
+                    self.index['episodes'].add(doc['episodeid'], doc['name'])
+
+            for doc in dbData.values():
+                sickrage.app.cache_db.delete(doc)
 
-        sickrage.app.log.debug("Deleting show {} from QuickSearch cache".format(show_name))
+            # drop episodes that no longer exist
+            episodeids = set(e['indexerid'] for e in episodes)
+            for episodeid in self.show_episodes.get(indexerid, set()) - episodeids:
+                self.cache['episodes'].pop(episodeid, None)
+                self.index['episodes'].remove(episodeid)
+            self.show_episodes[indexerid] = episodeids
+
+    def add_show(self, indexerid):
+        if indexerid not in self.cache['shows']:
+            sickrage.app.log.debug("Adding show {} to QuickSearch cache".format(indexerid))
+            self.update_show(indexerid)
+
+    def del_show(self, indexerid):
+        sickrage.app.log.debug("Deleting show {} from QuickSearch cache".format(indexerid))
 
-        if indexerid in self.cache['shows']:
-            del self.cache['shows'][indexerid]
+        with self.lock:
+            self.cache['shows'].pop(indexerid, None)
+            self.index['shows'].remove(indexerid)
 
-        for k, v in self.cache['episodes'].items():
-            if v['showid'] == indexerid:
-                del self.cache['episodes'][k]
+            for episodeid in self.show_episodes.pop(indexerid, set()):
+                self.cache['episodes'].pop(episodeid, None)
+                self.index['episodes'].remove(episodeid)
 
-        # remove from database
-        [sickrage.app.cache_db.delete(x) for x in sickrage.app.cache_db.get_many('quicksearch', indexerid)]
+            # remove from database
+            with sickrage.app.cache_db.bulk():
+                [sickrage.app.cache_db.delete(x) for x in sickrage.app.cache_db.get_many('quicksearch', indexerid)]
@@ -0,0 +1,184 @@
+# Author: echel0n <echel0n@sickrage.ca>
+# URL: https://sickrage.ca
+#
+# This file is part of SickRage.
+#
+# SickRage is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# SickRage is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with SickRage.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+
+import bisect
+import datetime
+import threading
+
+import sickrage
+from sickrage.core.common import Quality, SKIPPED, WANTED, FAILED, UNAIRED
+
+
+class ShowStatsCache(object):
+    """
+    Per-show episode statistics, kept up to date as episodes are saved so the home page doesn't have to read
+    every episode of every show.
+
+    Counts that depend on the current date are answered from sorted airdate lists.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.name = "SHOWSTATSCACHE"
+        self.lock = threading.RLock()
+        self.cache = {}
+
+    @staticmethod
+    def _new_stats():
+        return {
+            'episodes': 0,
+            'ep_snatched': 0,
+            'ep_downloaded': 0,
+            'ep_count': 0,
+            'total_size': 0,
+            'missing_airdates': [],
+            'upcoming_airdates': [],
+            'aired_airdates': [],
+        }
+
+    @staticmethod
+    def _apply(stats, epData, remove=False):
+        """
+        Adds or removes the contribution of a single episode to a show's stats
+
+        :param stats: stats record of the show
+        :param epData: episode database record
+        :param remove: remove the episode instead of adding it
+        """
+
+        sign = (1, -1)[remove]
+
+        stats['episodes'] += sign
+
+        season = epData['season']
+        episode = epData['episode']
+        airdate = epData['airdate']
+        status = epData['status']
+
+        if not (season > 0 and episode > 0 and airdate > 1):
+            return
+
+        if status in Quality.SNATCHED + Quality.SNATCHED_PROPER + Quality.SNATCHED_BEST:
+            stats['ep_snatched'] += sign
+
+        if status in Quality.DOWNLOADED + Quality.ARCHIVED:
+            stats['ep_downloaded'] += sign
+
+        stats['ep_count'] += sign
+        stats['total_size'] += sign * (epData['file_size'] or 0)
+
+        for key, wanted in [('missing_airdates', status in [SKIPPED, WANTED, FAILED]),
+                            ('upcoming_airdates', status in [WANTED, UNAIRED]),
+                            ('aired_airdates', status != UNAIRED)]:
+            if not wanted:
+                continue
+
+            if remove:
+                i = bisect.bisect_left(stats[key], airdate)
+                if i < len(stats[key]) and stats[key][i] == airdate:
+                    del stats[key][i]
+            else:
+                bisect.insort(stats[key], airdate)
+
+    def build(self, indexerid):
+        """
+        Builds the stats record of a show from its episodes in the database
+
+        :param indexerid: show indexer id
+        :return: stats record
+        """
+
+        stats = self._new_stats()
+        for epData in sickrage.app.main_db.get_many('tv_episodes', indexerid):
+            self._apply(stats, epData)
+
+        with self.lock:
+            self.cache[indexerid] = stats
+
+        return stats
+
+    def get(self, indexerid):
+        """
+        Returns the statistics of a show in the format used by the home page
+
+        :param indexerid: show indexer id
+        :return: dict of show statistics, None if the show has no episodes
+        """
+
+        with self.lock:
+            stats = self.cache.get(indexerid) or self.build(indexerid)
+            if not stats['episodes']:
+                return
+
+            today = datetime.date.today().toordinal()
+
+            # next wanted or unaired episode from today onwards
+            i = bisect.bisect_left(stats['upcoming_airdates'], today)
+            ep_airs_next = stats['upcoming_airdates'][i] if i < len(stats['upcoming_airdates']) else None
+
+            # last aired episode before today
+            i = bisect.bisect_left(stats['aired_airdates'], today)
+            ep_airs_prev = stats['aired_airdates'][i - 1] if i > 0 else None
+
+            return {
+                'ep_snatched': stats['ep_snatched'],
+                'ep_downloaded': stats['ep_downloaded'],
+                'ep_total': stats['ep_snatched'] + stats['ep_downloaded'] + bisect.bisect_right(
+                    stats['missing_airdates'], today),
+                'ep_count': stats['ep_count'],
+                'ep_airs_next': ep_airs_next,
+                'ep_airs_prev': ep_airs_prev,
+                'total_size': stats['total_size'],
+            }
+
+    def update_episode(self, indexerid, old=None, new=None):
+        """
+        Updates the stats of a show when one of its episodes changes
+
+        :param indexerid: show indexer id
+        :param old: episode database record before the change, None for new episodes
+        :param new: episode database record after the change, None for deleted episodes
+        """
+
+        with self.lock:
+            # shows that were never read are built from the database on first use
+            if indexerid not in self.cache:
+                return
+
+            if old:
+                self._apply(self.cache[indexerid], old, remove=True)
+            if new:
+                self._apply(self.cache[indexerid], new)
+
+    def remove(self, indexerid):
+        with self.lock:
+            self.cache.pop(indexerid, None)
+
+    def check(self):
+        """
+        Rebuilds the stats of every show and replaces the ones that drifted from the database
+        """
+
+        for show in sickrage.app.showlist:
+            with self.lock:
+                cached = self.cache.get(show.indexerid)
+                stats = self.build(show.indexerid)
+
+                if cached is not None and cached != stats:
+                    sickrage.app.log.debug("Rebuilt episode statistics for show: [{}]".format(show.name))
@@ -28,7 +28,7 @@ from sickrage.core.api.cache import ProviderCacheAPI
 from sickrage.core.common import Quality
 from sickrage.core.exceptions import AuthException, EpisodeNotFoundException
 from sickrage.core.helpers import findCertainShow, show_names, validate_url, is_ip_private, try_int
-from sickrage.core.nameparser import InvalidNameException, NameParser, InvalidShowException
+from sickrage.core.nameparser import NameParser
 from sickrage.core.websession import WebSession
 
 
@@ -77,7 +77,7 @@ class TVCache(object):
                 # set updated
                 self.last_update = datetime.datetime.today()
 
-                [self._parseItem(item) for item in data['entries']]
+                self.add_cache_entries(filter(None, [self._parseItem(item) for item in data['entries']]))
             except AuthException as e:
                 sickrage.app.log.warning("Authentication error: {}".format(e))
                 return False
@@ -112,10 +112,10 @@ class TVCache(object):
         self.check_item(title, url)
 
         if title and url:
-            self.addCacheEntry(self._translateTitle(title), self._translateLinkURL(url), seeders, leechers, size)
-        else:
-            sickrage.app.log.debug(
-                "The data returned from the " + self.provider.name + " feed is incomplete, this result is unusable")
+            return self._translateTitle(title), self._translateLinkURL(url), seeders, leechers, size
+
+        sickrage.app.log.debug(
+            "The data returned from the " + self.provider.name + " feed is incomplete, this result is unusable")
 
     @property
     def last_update(self):
@@ -183,67 +183,105 @@ class TVCache(object):
         return True
 
     def addCacheEntry(self, name, url, seeders, leechers, size):
-        # check for existing entry in cache
-        if len([x for x in sickrage.app.cache_db.get_many('providers', self.providerID) if x.get('url') == url]):
-            return
+        return self.add_cache_entries([(name, url, seeders, leechers, size)])
+
+    def add_cache_entries(self, items):
+        """
+        Adds a batch of search results to the cache, results are parsed and de-duplicated by url before
+        the batch is written
+
+        :param items: list of (name, url, seeders, leechers, size) tuples
+        :return: list of added cache entries
+        """
+        seen_urls = set()
+        new_items = []
+        cache_entries = []
+
+        for name, url, seeders, leechers, size in items:
+            # check for existing entry in batch or cache
+            if url in seen_urls or sickrage.app.cache_db.get('providers_url', (self.providerID, url)):
+                continue
+            seen_urls.add(url)
 
-        # ignore invalid and private IP address urls
-        if not validate_url(url):
-            if not url.startswith('magnet'):
-                return
-        elif is_ip_private(url.split(r'//')[-1].split(r'/')[0]):
-            return
+            # ignore invalid and private IP address urls
+            if not validate_url(url):
+                if not url.startswith('magnet'):
+                    continue
+            elif is_ip_private(url.split(r'//')[-1].split(r'/')[0]):
+                continue
 
-        try:
-            # parse release name
-            parse_result = NameParser(validate_show=True).parse(name)
-            if parse_result.series_name and parse_result.quality != Quality.UNKNOWN:
-                season = parse_result.season_number if parse_result.season_number else 1
-                episodes = parse_result.episode_numbers
-
-                if season and episodes:
-                    # store episodes as a seperated string
-                    episodeText = "|" + "|".join(map(str, episodes)) + "|"
-
-                    # get quality of release
-                    quality = parse_result.quality
-
-                    # get release group
-                    release_group = parse_result.release_group
-
-                    # get version
-                    version = parse_result.version
-
-                    dbData = {
-                        '_t': 'providers',
-                        'provider': self.providerID,
-                        'name': name,
-                        'season': season,
-                        'episodes': episodeText,
-                        'indexerid': parse_result.indexerid,
-                        'url': url,
-                        'time': int(time.mktime(datetime.datetime.today().timetuple())),
-                        'quality': quality,
-                        'release_group': release_group,
-                        'version': version,
-                        'seeders': try_int(seeders),
-                        'leechers': try_int(leechers),
-                        'size': try_int(size, -1)
-                    }
-
-                    # add to internal database
-                    sickrage.app.cache_db.insert(dbData)
-
-                    # add to external provider cache database
-                    if sickrage.app.config.enable_api_providers_cache and not self.provider.private:
-                        try:
-                            sickrage.app.event_queue.fire_event(ProviderCacheAPI().add, data=dbData)
-                        except Exception:
-                            pass
-
-                    sickrage.app.log.debug("SEARCH RESULT:[%s] ADDED TO CACHE!", name)
-        except (InvalidShowException, InvalidNameException):
-            pass
+            new_items.append((name, url, seeders, leechers, size))
+
+        # parse release names
+        parse_results = NameParser(validate_show=True).parse_many([x[0] for x in new_items])
+
+        for name, url, seeders, leechers, size in new_items:
+            if name not in parse_results:
+                continue
+
+            dbData = self._get_cache_entry(parse_results[name], name, url, seeders, leechers, size)
+            if dbData:
+                cache_entries.append(dbData)
+
+        for dbData in cache_entries:
+            # add to internal database
+            sickrage.app.cache_db.insert(dbData)
+
+            # add to external provider cache database
+            if sickrage.app.config.enable_api_providers_cache and not self.provider.private:
+                try:
+                    sickrage.app.event_queue.fire_event(ProviderCacheAPI().add, data=dbData)
+                except Exception:
+                    pass
+
+            sickrage.app.log.debug("SEARCH RESULT:[%s] ADDED TO CACHE!", dbData['name'])
+
+        return cache_entries
+
+    def _get_cache_entry(self, parse_result, name, url, seeders, leechers, size):
+        if parse_result.series_name and parse_result.quality != Quality.UNKNOWN:
+            season = parse_result.season_number if parse_result.season_number else 1
+            episodes = parse_result.episode_numbers
+
+            if season and episodes:
+                # store episodes as a seperated string
+                episodeText = "|" + "|".join(map(str, episodes)) + "|"
+
+                # get quality of release
+                quality = parse_result.quality
+
+                # get release group
+                release_group = parse_result.release_group
+
+                # get version
+                version = parse_result.version
+
+                return {
+                    '_t': 'providers',
+                    'provider': self.providerID,
+                    'name': name,
+                    'season': season,
+                    'episodes': episodeText,
+                    'indexerid': parse_result.indexerid,
+                    'url': url,
+                    'time': int(time.mktime(datetime.datetime.today().timetuple())),
+                    'quality': quality,
+                    'release_group': release_group,
+                    'version': version,
+                    'seeders': try_int(seeders),
+                    'leechers': try_int(leechers),
+                    'size': try_int(size, -1)
+                }
+
+    @staticmethod
+    def _get_episodes(dbData):
+        """
+        Returns the episode numbers of a cache entry, episodes are stored as a "|" seperated string
+
+        :param dbData: cache entry
+        :return: list of episode numbers
+        """
+        return [try_int(x) for x in dbData.get('episodes', '').split('|') if x]
 
     def search_cache(self, ep_obj, manualSearch=False, downCurQuality=False):
         season = ep_obj.scene_season if ep_obj.show.scene else ep_obj.season
@@ -259,13 +297,14 @@ class TVCache(object):
             except Exception:
                 pass
 
-        # get data from internal database
-        dbData += [x for x in sickrage.app.cache_db.get_many('providers', self.providerID)]
+        # get data from internal database, only rows for this show and season can match
+        dbData += [x for x in sickrage.app.cache_db.get_many('providers_season',
+                                                             (self.providerID, ep_obj.show.indexerid, season))]
 
         # for each cache entry
         for curResult in (x for x in dbData if
-                          x.get('indexerid') == ep_obj.show.indexerid and x.get('season') == season and "|{}|".format(
-                              episode) in x.get('episodes', [])):
+                          x.get('indexerid') == ep_obj.show.indexerid and x.get('season') == season and
+                          episode in self._get_episodes(x)):
             result = self.provider.getResult()
 
             # ignore invalid and private IP address urls
@@ -295,8 +334,8 @@ class TVCache(object):
                 continue
 
             try:
-                result.episodes = [result.show.get_episode(curSeason, int(curEp)) for curEp in
-                                   filter(None, curResult["episodes"].split("|"))]
+                result.episodes = [result.show.get_episode(curSeason, curEp) for curEp in
+                                   self._get_episodes(curResult)]
             except EpisodeNotFoundException:
                 continue
 
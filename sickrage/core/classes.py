@@ -22,6 +22,7 @@ from __future__ import unicode_literals
 import datetime
 import re
 import sys
+import threading
 
 from dateutil import parser
 
@@ -184,9 +185,8 @@ class ShowListUI(object):
     def selectSeries(self, allSeries, *args, **kwargs):
         try:
             # try to pick a show that's in my show list
-            showIDList = [int(x.indexerid) for x in sickrage.app.showlist]
             for curShow in allSeries:
-                if int(curShow['id']) in showIDList:
+                if sickrage.app.showlist.find_by_indexerid(int(curShow['id'])):
                     return curShow
         except Exception:
             pass
@@ -270,3 +270,113 @@ class AttrDict(dict):
             del self[name]
         else:
             raise AttributeError("No such attribute: " + name)
+
+
+class ShowList(list):
+    """
+    List of loaded shows that keeps lookup tables by indexer id and lowercase
+    show name, so finding a show doesn't require scanning every loaded show.
+    """
+
+    def __init__(self, shows=None):
+        super(ShowList, self).__init__(shows or [])
+        self.lock = threading.RLock()
+        self._keys = {}
+        self._by_indexerid = {}
+        self._by_name = {}
+        self._reindex()
+
+    def _reindex(self):
+        with self.lock:
+            self._keys = {}
+            self._by_indexerid = {}
+            self._by_name = {}
+            for show in self:
+                self._index(show)
+
+    def _index(self, show):
+        if id(show) in self._keys:
+            return
+
+        indexerid, name = show.indexerid, (show.name or '').lower()
+        self._keys[id(show)] = (indexerid, name)
+        self._by_indexerid.setdefault(indexerid, []).append(show)
+        self._by_name.setdefault(name, []).append(show)
+
+    def _unindex(self, show, force=False):
+        if id(show) not in self._keys or (not force and any(x is show for x in self)):
+            return
+
+        indexerid, name = self._keys.pop(id(show))
+        for table, key in [(self._by_indexerid, indexerid), (self._by_name, name)]:
+            shows = [x for x in table.get(key, []) if x is not show]
+            if shows:
+                table[key] = shows
+            else:
+                table.pop(key, None)
+
+    def find_by_indexerid(self, indexerid):
+        return list(self._by_indexerid.get(indexerid, []))
+
+    def find_by_name(self, name):
+        return list(self._by_name.get((name or '').lower(), []))
+
+    def update_show(self, show):
+        """
+        Re-key a loaded show after its indexer id or name has changed
+        """
+
+        with self.lock:
+            if id(show) in self._keys and self._keys[id(show)] != (show.indexerid, (show.name or '').lower()):
+                self._unindex(show, force=True)
+                self._index(show)
+
+    def append(self, show):
+        with self.lock:
+            super(ShowList, self).append(show)
+            self._index(show)
+
+    def insert(self, index, show):
+        with self.lock:
+            super(ShowList, self).insert(index, show)
+            self._index(show)
+
+    def extend(self, shows):
+        with self.lock:
+            for show in shows:
+                self.append(show)
+
+    def __iadd__(self, shows):
+        self.extend(shows)
+        return self
+
+    def remove(self, show):
+        with self.lock:
+            super(ShowList, self).remove(show)
+            self._unindex(show)
+
+    def pop(self, index=-1):
+        with self.lock:
+            show = super(ShowList, self).pop(index)
+            self._unindex(show)
+            return show
+
+    def __setitem__(self, index, value):
+        with self.lock:
+            super(ShowList, self).__setitem__(index, value)
+            self._reindex()
+
+    def __delitem__(self, index):
+        with self.lock:
+            super(ShowList, self).__delitem__(index)
+            self._reindex()
+
+    def __setslice__(self, i, j, sequence):
+        with self.lock:
+            super(ShowList, self).__setslice__(i, j, sequence)
+            self._reindex()
+
+    def __delslice__(self, i, j):
+        with self.lock:
+            super(ShowList, self).__delslice__(i, j)
+            self._reindex()
@@ -99,6 +99,10 @@ class Config(object):
         self.showupdate_stale = True
         self.root_dirs = ""
         self.cpu_preset = "NORMAL"
+        self.search_queue_workers = 1
+        self.show_queue_workers = 1
+        self.name_parser_cache_size = 1000
+        self.name_parser_cache_ttl = 60
         self.anon_redirect = ""
         self.download_url = ""
         self.trash_remove_show = False
@@ -108,6 +112,7 @@ class Config(object):
         self.default_page = "home"
         self.use_listview = False
         self.processor_follow_symlinks = False
+        self.processor_workers = 1
         self.quality_default = None
         self.status_default = None
         self.status_default_after = None
@@ -146,6 +151,8 @@ class Config(object):
         self.allow_high_priority = False
         self.sab_forced = False
         self.randomize_providers = False
+        self.search_provider_threads = 1
+        self.search_provider_timeout = 120
         self.min_autopostprocessor_freq = 1
         self.min_daily_searcher_freq = 10
         self.min_backlog_searcher_freq = 10
@@ -432,6 +439,7 @@ class Config(object):
         self.calendar_unprotected = False
         self.calendar_icons = False
         self.no_restart = False
+        self.lazy_load_shows = False
         self.allowed_video_file_exts = []
         self.strip_special_file_bits = False
         self.thetvdb_apitoken = ""
@@ -754,6 +762,10 @@ class Config(object):
                 'handle_reverse_proxy': False,
                 'postpone_if_sync_files': True,
                 'cpu_preset': 'NORMAL',
+                'search_queue_workers': 1,
+                'show_queue_workers': 1,
+                'name_parser_cache_size': 1000,
+                'name_parser_cache_ttl': 60,
                 'nfo_rename': True,
                 'naming_anime_multi_ep': 1,
                 'use_nzbs': False,
@@ -773,6 +785,8 @@ class Config(object):
                 'naming_anime_pattern': 'Season %0S/%SN - S%0SE%0E - %EN',
                 'naming_custom_anime': False,
                 'randomize_providers': False,
+                'search_provider_threads': 1,
+                'search_provider_timeout': 120,
                 'web_host': get_lan_ip(),
                 'config_version': self.config_version,
                 'process_automatically': False,
@@ -808,6 +822,7 @@ class Config(object):
                 'git_password': '',
                 'ep_default_deleted_status': 6,
                 'no_restart': False,
+                'lazy_load_shows': False,
                 'allowed_video_file_exts': [
                     'avi', 'mkv', 'mpg', 'mpeg', 'wmv',
                     'ogm', 'mp4', 'iso', 'img', 'divx',
@@ -830,6 +845,7 @@ class Config(object):
                 'calendar_icons': False,
                 'keep_processed_dir': True,
                 'processor_follow_symlinks': False,
+                'processor_workers': 1,
                 'allowed_extensions': 'srt,nfo,srr,sfv',
                 'view_changelog': False,
                 'strip_special_file_bits': True
@@ -1428,6 +1444,10 @@ class Config(object):
         self.ep_default_deleted_status = self.check_setting_int('General', 'ep_default_deleted_status')
         self.download_url = self.check_setting_str('General', 'download_url')
         self.cpu_preset = self.check_setting_str('General', 'cpu_preset')
+        self.search_queue_workers = self.check_setting_int('General', 'search_queue_workers')
+        self.show_queue_workers = self.check_setting_int('General', 'show_queue_workers')
+        self.name_parser_cache_size = self.check_setting_int('General', 'name_parser_cache_size')
+        self.name_parser_cache_ttl = self.check_setting_int('General', 'name_parser_cache_ttl')
         self.anon_redirect = self.check_setting_str('General', 'anon_redirect')
         self.proxy_setting = self.check_setting_str('General', 'proxy_setting')
         self.proxy_indexers = self.check_setting_bool('General', 'proxy_indexers')
@@ -1476,6 +1496,8 @@ class Config(object):
         self.download_unverified_magnet_link = self.check_setting_bool('General', 'download_unverified_magnet_link')
         self.proper_searcher_interval = self.check_setting_str('General', 'check_propers_interval')
         self.randomize_providers = self.check_setting_bool('General', 'randomize_providers')
+        self.search_provider_threads = self.check_setting_int('General', 'search_provider_threads')
+        self.search_provider_timeout = self.check_setting_int('General', 'search_provider_timeout')
         self.allow_high_priority = self.check_setting_bool('General', 'allow_high_priority')
         self.skip_removed_files = self.check_setting_bool('General', 'skip_removed_files')
         self.usenet_retention = self.check_setting_int('General', 'usenet_retention')
@@ -1497,6 +1519,7 @@ class Config(object):
         self.keep_processed_dir = self.check_setting_bool('General', 'keep_processed_dir')
         self.process_method = self.check_setting_str('General', 'process_method')
         self.processor_follow_symlinks = self.check_setting_bool('General', 'processor_follow_symlinks')
+        self.processor_workers = self.check_setting_int('General', 'processor_workers')
         self.delrarcontents = self.check_setting_bool('General', 'del_rar_contents')
         self.delete_non_associated_files = self.check_setting_bool('General', 'delete_non_associated_files')
         self.move_associated_files = self.check_setting_bool('General', 'move_associated_files')
@@ -1511,6 +1534,7 @@ class Config(object):
         self.calendar_unprotected = self.check_setting_bool('General', 'calendar_unprotected')
         self.calendar_icons = self.check_setting_bool('General', 'calendar_icons')
         self.no_restart = self.check_setting_bool('General', 'no_restart')
+        self.lazy_load_shows = self.check_setting_bool('General', 'lazy_load_shows')
         self.allowed_video_file_exts = self.check_setting_list('General', 'allowed_video_file_exts')
         self.extra_scripts = [x.strip() for x in self.check_setting_str('General', 'extra_scripts').split('|') if
                               x.strip()]
@@ -1925,6 +1949,10 @@ class Config(object):
                 'ssl_verify': int(self.ssl_verify),
                 'download_url': self.download_url,
                 'cpu_preset': self.cpu_preset,
+                'search_queue_workers': int(self.search_queue_workers),
+                'show_queue_workers': int(self.show_queue_workers),
+                'name_parser_cache_size': int(self.name_parser_cache_size),
+                'name_parser_cache_ttl': int(self.name_parser_cache_ttl),
                 'anon_redirect': self.anon_redirect,
                 'api_key': self.api_key,
                 'debug': int(self.debug),
@@ -1949,6 +1977,8 @@ class Config(object):
                 'torrent_file_to_magnet': int(self.torrent_file_to_magnet),
                 'download_unverified_magnet_link': int(self.download_unverified_magnet_link),
                 'randomize_providers': int(self.randomize_providers),
+                'search_provider_threads': int(self.search_provider_threads),
+                'search_provider_timeout': int(self.search_provider_timeout),
                 'check_propers_interval': self.proper_searcher_interval,
                 'allow_high_priority': int(self.allow_high_priority),
                 'skip_removed_files': int(self.skip_removed_files),
@@ -2015,10 +2045,12 @@ class Config(object):
                 'calendar_unprotected': int(self.calendar_unprotected),
                 'calendar_icons': int(self.calendar_icons),
                 'no_restart': int(self.no_restart),
+                'lazy_load_shows': int(self.lazy_load_shows),
                 'allowed_video_file_exts': self.allowed_video_file_exts,
                 'display_all_seasons': int(self.display_all_seasons),
                 'random_user_agent': int(self.random_user_agent),
                 'processor_follow_symlinks': int(self.processor_follow_symlinks),
+                'processor_workers': int(self.processor_workers),
                 'delete_non_associated_files': int(self.delete_non_associated_files),
                 'allowed_extensions': self.allowed_extensions,
                 'view_changelog': int(self.view_changelog),
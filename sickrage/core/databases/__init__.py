@@ -27,6 +27,7 @@ import shutil
 import tarfile
 import time
 import traceback
+from contextlib import contextmanager
 from sqlite3 import OperationalError
 
 from CodernityDB.database import RecordDeleted, RecordNotFound
@@ -57,6 +58,9 @@ class srDatabase(object):
         self.db_path = os.path.join(sickrage.app.data_dir, 'database', self.name)
         self.db = SuperThreadSafeDatabase(self.db_path)
 
+        # undo log of the running bulk() block
+        self._bulk = None
+
     def initialize(self):
         # Remove database folder if both exists
         if self.db.exists() and os.path.isfile(self.old_db_path):
@@ -387,13 +391,70 @@ class srDatabase(object):
             pass
 
     def delete(self, *args):
-        return self.db.delete(*args)
+        with self.db.super_lock:
+            if self._bulk is not None:
+                self._bulk.append(('delete', self.db.get('id', args[0]['_id'])))
+            return self.db.delete(*args)
 
     def update(self, *args):
-        return self.db.update(*args)
+        with self.db.super_lock:
+            if self._bulk is not None:
+                self._bulk.append(('update', self.db.get('id', args[0]['_id'])))
+            return self.db.update(*args)
 
     def insert(self, *args):
-        return self.db.insert(*args)
+        with self.db.super_lock:
+            x = self.db.insert(*args)
+            if self._bulk is not None:
+                self._bulk.append(('insert', x))
+            return x
+
+    @contextmanager
+    def bulk(self):
+        """
+        Groups the writes of a block under a single database lock and flush, if the block raises the writes it made
+        are rolled back. Nested blocks are part of the outer one.
+        """
+
+        with self.db.super_lock:
+            if self._bulk is not None:
+                yield self
+                return
+
+            self._bulk = []
+            try:
+                yield self
+            except Exception:
+                undo, self._bulk = self._bulk, None
+                self._rollback(undo)
+                raise
+            finally:
+                self._bulk = None
+
+            self.db.flush()
+
+    def _rollback(self, undo):
+        sickrage.app.log.debug('Rolling back {} {} database writes'.format(len(undo), self.name))
+
+        # deleted ids stay taken in the id index so restored documents get new ones, later undo steps follow them
+        restored = {}
+
+        for action, data in reversed(undo):
+            try:
+                _id = restored.get(data['_id'], data['_id'])
+                if action == 'insert':
+                    self.db.delete(self.db.get('id', _id))
+                elif action == 'update':
+                    data = dict(data, _id=_id, _rev=self.db.get('id', _id)['_rev'])
+                    self.db.update(data)
+                elif action == 'delete':
+                    doc = dict((k, v) for k, v in data.items() if k not in ('_id', '_rev', '_deleted'))
+                    restored[data['_id']] = self.db.insert(doc)['_id']
+            except Exception:
+                sickrage.app.log.debug('Unable to roll back {} of {}: {}'.format(action, data['_id'],
+                                                                                traceback.format_exc()))
+
+        self.db.flush()
 
     def delete_all(self):
         for index_name in self.db.indexes_names.keys():
@@ -407,11 +468,17 @@ class srDatabase(object):
         sickrage.app.log.info('Backing up {} database to {}'.format(self.name, backup_file))
         with io.open(backup_file, 'wb') as f:
             rows = []
+            seen = set()
             for index_name in self.db.indexes_names.keys():
                 if index_name in ['id']:
                     continue
 
+                # secondary indexes share documents with their primary index, only backup each document once
                 for row in self.all(index_name):
+                    if row['_id'] in seen:
+                        continue
+                    seen.add(row['_id'])
+
                     for x in ['_rev', '_id']:
                         del row[x]
                     rows += [row]
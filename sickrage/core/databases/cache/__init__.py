@@ -25,7 +25,7 @@ from sickrage.core.common import Quality
 from sickrage.core.databases import srDatabase
 from sickrage.core.databases.cache.index import CacheLastUpdateIndex, CacheLastSearchIndex, CacheSceneExceptionsIndex, \
     CacheSceneNamesIndex, CacheNetworkTimezonesIndex, CacheSceneExceptionsRefreshIndex, CacheProvidersIndex, \
-    CacheQuicksearchIndex
+    CacheProvidersSeasonIndex, CacheProvidersURLIndex, CacheQuicksearchIndex, CacheSceneNamesIndexerIdIndex
 from sickrage.core.helpers import validate_url, is_ip_private
 
 
@@ -35,9 +35,12 @@ class CacheDB(srDatabase):
         'lastSearch': CacheLastSearchIndex,
         'scene_exceptions': CacheSceneExceptionsIndex,
         'scene_names': CacheSceneNamesIndex,
+        'scene_names_indexer_id': CacheSceneNamesIndexerIdIndex,
         'network_timezones': CacheNetworkTimezonesIndex,
         'scene_exceptions_refresh': CacheSceneExceptionsRefreshIndex,
         'providers': CacheProvidersIndex,
+        'providers_season': CacheProvidersSeasonIndex,
+        'providers_url': CacheProvidersURLIndex,
         'quicksearch': CacheQuicksearchIndex
     }
 
@@ -83,6 +83,21 @@ class CacheSceneNamesIndex(HashIndex):
         return md5(key.encode('utf-8')).hexdigest()
 
 
+class CacheSceneNamesIndexerIdIndex(HashIndex):
+    _version = 1
+
+    def __init__(self, *args, **kwargs):
+        kwargs['key_format'] = 'I'
+        super(CacheSceneNamesIndexerIdIndex, self).__init__(*args, **kwargs)
+
+    def make_key_value(self, data):
+        if data.get('_t') == 'scene_names' and data.get('name') and data.get('indexer_id'):
+            return data.get('indexer_id'), None
+
+    def make_key(self, key):
+        return key
+
+
 class CacheNetworkTimezonesIndex(HashIndex):
     _version = 4
 
@@ -128,6 +143,40 @@ class CacheProvidersIndex(HashIndex):
         return md5(key.encode('utf-8')).hexdigest()
 
 
+class CacheProvidersSeasonIndex(HashIndex):
+    _version = 3
+
+    def __init__(self, *args, **kwargs):
+        kwargs['key_format'] = '32s'
+        super(CacheProvidersSeasonIndex, self).__init__(*args, **kwargs)
+
+    def make_key_value(self, data):
+        if data.get('_t') == 'providers' and data.get('provider') and data.get('indexerid'):
+            # the generated index file has no unicode_literals, each part is encoded before joining
+            return md5(b'-'.join(x.encode('utf-8') if isinstance(x, unicode) else str(x) for x in
+                                 (data.get('provider'), data.get('indexerid'), data.get('season')))).hexdigest(), None
+
+    def make_key(self, key):
+        return md5(b'-'.join(x.encode('utf-8') if isinstance(x, unicode) else str(x) for x in key)).hexdigest()
+
+
+class CacheProvidersURLIndex(HashIndex):
+    _version = 2
+
+    def __init__(self, *args, **kwargs):
+        kwargs['key_format'] = '32s'
+        super(CacheProvidersURLIndex, self).__init__(*args, **kwargs)
+
+    def make_key_value(self, data):
+        if data.get('_t') == 'providers' and data.get('provider') and data.get('url'):
+            # the generated index file has no unicode_literals, each part is encoded before joining
+            return md5(b'-'.join(x.encode('utf-8') if isinstance(x, unicode) else str(x) for x in
+                                 (data.get('provider'), data.get('url')))).hexdigest(), None
+
+    def make_key(self, key):
+        return md5(b'-'.join(x.encode('utf-8') if isinstance(x, unicode) else str(x) for x in key)).hexdigest()
+
+
 class CacheQuicksearchIndex(HashIndex):
     _version = 1
 
@@ -24,7 +24,10 @@ import sickrage
 from sickrage.core.databases import srDatabase
 from sickrage.core.databases.main.index import MainTVShowsIndex, MainTVEpisodesIndex, MainIMDBInfoIndex, \
     MainXEMRefreshIndex, MainSceneNumberingIndex, MainIndexerMappingIndex, MainHistoryIndex, \
-    MainBlacklistIndex, MainWhitelistIndex, MainFailedSnatchHistoryIndex, MainFailedSnatchesIndex, MainVersionIndex
+    MainBlacklistIndex, MainWhitelistIndex, MainFailedSnatchHistoryIndex, MainFailedSnatchesIndex, MainVersionIndex, \
+    MainTVEpisodesSeasonEpisodeIndex, MainTVEpisodesAbsoluteNumberIndex, MainTVEpisodesAirdateIndex, \
+    MainTVEpisodesAirdateRangeIndex, MainTVEpisodesReleaseNameIndex, MainHistoryResourceIndex, MainHistoryBasenameIndex, \
+    MainTVEpisodesStatusAirdateIndex
 
 
 class MainDB(srDatabase):
@@ -34,6 +37,12 @@ class MainDB(srDatabase):
         'version': MainVersionIndex,
         'tv_shows': MainTVShowsIndex,
         'tv_episodes': MainTVEpisodesIndex,
+        'tv_episodes_season_episode': MainTVEpisodesSeasonEpisodeIndex,
+        'tv_episodes_absolute_number': MainTVEpisodesAbsoluteNumberIndex,
+        'tv_episodes_airdate': MainTVEpisodesAirdateIndex,
+        'tv_episodes_airdate_range': MainTVEpisodesAirdateRangeIndex,
+        'tv_episodes_release_name': MainTVEpisodesReleaseNameIndex,
+        'tv_episodes_status_airdate': MainTVEpisodesStatusAirdateIndex,
         'imdb_info': MainIMDBInfoIndex,
         'xem_refresh': MainXEMRefreshIndex,
         'scene_numbering': MainSceneNumberingIndex,
@@ -41,6 +50,8 @@ class MainDB(srDatabase):
         'blacklist': MainBlacklistIndex,
         'whitelist': MainWhitelistIndex,
         'history': MainHistoryIndex,
+        'history_resource': MainHistoryResourceIndex,
+        'history_basename': MainHistoryBasenameIndex,
         'failed_snatch_history': MainFailedSnatchHistoryIndex,
         'failed_snatches': MainFailedSnatchesIndex,
     }
@@ -95,6 +106,75 @@ class MainDB(srDatabase):
                 del show['archive_firstmatch']
                 self.update(show)
 
+    def get_episodes_by_airdate(self, start=None, end=None, statuses=None):
+        """
+        Returns the episodes airing between two dates, ordered by airdate
+
+        :param start: first airdate ordinal, None for no lower bound
+        :param end: airdate ordinal to stop before, None for no upper bound
+        :param statuses: only return episodes with one of these statuses
+        :return: generator of episode database records
+        """
+
+        for dbData in self.get_many('tv_episodes_airdate_range', start=start or 1, end=end, inclusive_end=False):
+            if statuses is None or dbData['status'] in statuses:
+                yield dbData
+
+    def get_episodes_by_status(self, statuses, start=None, end=None, showid=None):
+        """
+        Returns the episodes with one of the statuses airing between two dates
+
+        :param statuses: episode statuses without quality, e.g. WANTED
+        :param start: first airdate ordinal, None for no lower bound
+        :param end: airdate ordinal to stop before, None for no upper bound
+        :param showid: only return episodes of this show
+        :return: generator of episode database records, ordered by status and airdate
+        """
+
+        for status in sorted(set(statuses)):
+            # index keys are the status followed by the 7 digit airdate ordinal
+            for dbData in self.get_many('tv_episodes_status_airdate',
+                                        start=max(status * 10000000 + (start or 0), 1),
+                                        end=status * 10000000 + (end or 10000000), inclusive_end=False):
+                if showid is None or dbData['showid'] == showid:
+                    yield dbData
+
+    def get_episodes_by_release_name(self, release_name):
+        """
+        Returns the episodes that were processed from a release
+
+        :param release_name: release name, matched case insensitive
+        :return: list of episode database records
+        """
+
+        return [x for x in self.get_many('tv_episodes_release_name', release_name)
+                if x['release_name'].lower() == release_name.lower()]
+
+    def get_history_by_resource(self, name):
+        """
+        Returns the history records whose resource, resource file name or resource file name without extension
+        equals name
+
+        :param name: release or file name, matched case insensitive
+        :return: list of history database records, oldest first
+        """
+
+        name = name.lower()
+        dbData = {}
+
+        for index, key in [('history_resource', name), ('history_basename', name),
+                           ('history_basename', name.rpartition('.')[0])]:
+            if not key:
+                continue
+
+            for x in self.get_many(index, key):
+                resource = x['resource'].lower()
+                basename = resource.replace('\\', '/').rsplit('/', 1)[-1]
+                if name in (resource, basename, basename.rpartition('.')[0] or basename):
+                    dbData[x['_id']] = x
+
+        return sorted(dbData.values(), key=lambda x: x['date'])
+
     def cleanup(self):
         self.fix_show_none_types()
         self.fix_episode_none_types()
@@ -105,73 +185,78 @@ class MainDB(srDatabase):
     def fix_show_none_types(self):
         checked = []
 
-        for show in self.all('tv_shows'):
-            if show['indexer_id'] in checked:
-                continue
+        with self.bulk():
+            for show in self.all('tv_shows'):
+                if show['indexer_id'] in checked:
+                    continue
 
-            dirty = False
-            for k, v in show.items():
-                if v is None:
-                    try:
-                        show[k] = ""
-                        dirty = True
-                    except Exception:
-                        pass
+                dirty = False
+                for k, v in show.items():
+                    if v is None:
+                        try:
+                            show[k] = ""
+                            dirty = True
+                        except Exception:
+                            pass
 
-            if dirty:
-                self.update(show)
+                if dirty:
+                    self.update(show)
 
-            checked += [show['indexer_id']]
+                checked += [show['indexer_id']]
 
         del checked
 
     def fix_episode_none_types(self):
         checked = []
 
-        for ep in self.all('tv_episodes'):
-            if ep['showid'] in checked:
-                continue
+        with self.bulk():
+            for ep in self.all('tv_episodes'):
+                if ep['showid'] in checked:
+                    continue
 
-            dirty = False
-            for k, v in ep.items():
-                if v is None:
-                    try:
-                        ep[k] = ""
-                        dirty = True
-                    except Exception:
-                        pass
+                dirty = False
+                for k, v in ep.items():
+                    if v is None:
+                        try:
+                            ep[k] = ""
+                            dirty = True
+                        except Exception:
+                            pass
 
-            if dirty:
-                self.update(ep)
+                if dirty:
+                    self.update(ep)
 
-            checked += [ep['showid']]
+                checked += [ep['showid']]
 
         del checked
 
     def fix_dupe_shows(self):
         found = []
 
-        for show in self.all('tv_shows'):
-            if show['indexer_id'] in found:
-                sickrage.app.log.info("Deleting duplicate show with id: {}".format(show["indexer_id"]))
-                self.delete(show)
-            found += [show['indexer_id']]
+        with self.bulk():
+            for show in self.all('tv_shows'):
+                if show['indexer_id'] in found:
+                    sickrage.app.log.info("Deleting duplicate show with id: {}".format(show["indexer_id"]))
+                    self.delete(show)
+                found += [show['indexer_id']]
 
         del found
 
     def fix_dupe_episodes(self):
         found = []
 
-        for ep in self.all('tv_episodes'):
-            if ep['indexerid'] in found:
-                sickrage.app.log.info("Deleting duplicate episode with id: {}".format(ep["indexerid"]))
-                self.delete(ep)
-            found += [ep['indexerid']]
+        with self.bulk():
+            for ep in self.all('tv_episodes'):
+                if ep['indexerid'] in found:
+                    sickrage.app.log.info("Deleting duplicate episode with id: {}".format(ep["indexerid"]))
+                    self.delete(ep)
+                found += [ep['indexerid']]
 
         del found
 
     def fix_orphaned_episodes(self):
-        for ep in self.all('tv_episodes'):
-            if not self.get('tv_shows', ep['showid']):
-                sickrage.app.log.info("Deleting orphan episode with id: {}".format(ep["indexerid"]))
-                self.delete(ep)
\ No newline at end of file
+        with self.bulk():
+            for ep in self.all('tv_episodes'):
+                if not self.get('tv_shows', ep['showid']):
+                    sickrage.app.log.info("Deleting orphan episode with id: {}".format(ep["indexerid"]))
+                    self.delete(ep)
\ No newline at end of file
@@ -21,6 +21,7 @@ from __future__ import unicode_literals
 from hashlib import md5
 
 from CodernityDB.hash_index import HashIndex
+from CodernityDB.tree_index import TreeBasedIndex
 
 
 class MainVersionIndex(HashIndex):
@@ -201,3 +202,130 @@ class MainFailedSnatchHistoryIndex(HashIndex):
     def make_key_value(self, data):
         if data.get('_t') == 'failed_snatch_history' and data.get('showid'):
             return data.get('showid'), None
+
+
+class MainTVEpisodesSeasonEpisodeIndex(HashIndex):
+    _version = 1
+
+    def __init__(self, *args, **kwargs):
+        kwargs['key_format'] = '32s'
+        super(MainTVEpisodesSeasonEpisodeIndex, self).__init__(*args, **kwargs)
+
+    def make_key_value(self, data):
+        if data.get('_t') == 'tv_episodes' and data.get('showid'):
+            return md5('{}-{}-{}'.format(data.get('showid'), data.get('season'), data.get('episode'))).hexdigest(), None
+
+    def make_key(self, key):
+        return md5('{}-{}-{}'.format(*key)).hexdigest()
+
+
+class MainTVEpisodesAbsoluteNumberIndex(HashIndex):
+    _version = 1
+
+    def __init__(self, *args, **kwargs):
+        kwargs['key_format'] = '32s'
+        super(MainTVEpisodesAbsoluteNumberIndex, self).__init__(*args, **kwargs)
+
+    def make_key_value(self, data):
+        if data.get('_t') == 'tv_episodes' and data.get('showid'):
+            return md5('{}-{}'.format(data.get('showid'), data.get('absolute_number'))).hexdigest(), None
+
+    def make_key(self, key):
+        return md5('{}-{}'.format(*key)).hexdigest()
+
+
+class MainTVEpisodesAirdateIndex(HashIndex):
+    _version = 1
+
+    def __init__(self, *args, **kwargs):
+        kwargs['key_format'] = '32s'
+        super(MainTVEpisodesAirdateIndex, self).__init__(*args, **kwargs)
+
+    def make_key_value(self, data):
+        if data.get('_t') == 'tv_episodes' and data.get('showid'):
+            return md5('{}-{}'.format(data.get('showid'), data.get('airdate'))).hexdigest(), None
+
+    def make_key(self, key):
+        return md5('{}-{}'.format(*key)).hexdigest()
+
+
+class MainTVEpisodesAirdateRangeIndex(TreeBasedIndex):
+    _version = 1
+    custom_header = 'from CodernityDB.tree_index import TreeBasedIndex'
+
+    def __init__(self, *args, **kwargs):
+        kwargs['key_format'] = 'I'
+        super(MainTVEpisodesAirdateRangeIndex, self).__init__(*args, **kwargs)
+
+    def make_key_value(self, data):
+        if data.get('_t') == 'tv_episodes' and data.get('showid') and data.get('airdate'):
+            return data.get('airdate'), None
+
+    def make_key(self, key):
+        return key
+
+
+class MainTVEpisodesReleaseNameIndex(HashIndex):
+    _version = 1
+
+    def __init__(self, *args, **kwargs):
+        kwargs['key_format'] = '32s'
+        super(MainTVEpisodesReleaseNameIndex, self).__init__(*args, **kwargs)
+
+    def make_key_value(self, data):
+        if data.get('_t') == 'tv_episodes' and data.get('showid') and data.get('release_name'):
+            return md5(data.get('release_name').lower().encode('utf-8')).hexdigest(), None
+
+    def make_key(self, key):
+        return md5(key.lower().encode('utf-8')).hexdigest()
+
+
+class MainHistoryResourceIndex(HashIndex):
+    _version = 1
+
+    def __init__(self, *args, **kwargs):
+        kwargs['key_format'] = '32s'
+        super(MainHistoryResourceIndex, self).__init__(*args, **kwargs)
+
+    def make_key_value(self, data):
+        if data.get('_t') == 'history' and data.get('resource'):
+            return md5(data.get('resource').lower().encode('utf-8')).hexdigest(), None
+
+    def make_key(self, key):
+        return md5(key.lower().encode('utf-8')).hexdigest()
+
+
+class MainHistoryBasenameIndex(HashIndex):
+    _version = 1
+
+    def __init__(self, *args, **kwargs):
+        kwargs['key_format'] = '32s'
+        super(MainHistoryBasenameIndex, self).__init__(*args, **kwargs)
+
+    def make_key_value(self, data):
+        if data.get('_t') == 'history' and data.get('resource'):
+            # file name of the resource without its extension
+            basename = data.get('resource').replace('\\', '/').rsplit('/', 1)[-1]
+            return md5((basename.rpartition('.')[0] or basename).lower().encode('utf-8')).hexdigest(), None
+
+    def make_key(self, key):
+        return md5(key.lower().encode('utf-8')).hexdigest()
+
+
+class MainTVEpisodesStatusAirdateIndex(TreeBasedIndex):
+    _version = 1
+    custom_header = 'from CodernityDB.tree_index import TreeBasedIndex'
+
+    def __init__(self, *args, **kwargs):
+        kwargs['key_format'] = 'I'
+        super(MainTVEpisodesStatusAirdateIndex, self).__init__(*args, **kwargs)
+
+    def make_key_value(self, data):
+        if data.get('_t') == 'tv_episodes' and data.get('showid') and data.get('status') >= 0:
+            # status without quality followed by the 7 digit airdate ordinal
+            key = data.get('status') % 100 * 10000000 + (data.get('airdate') or 0)
+            if key:
+                return key, None
+
+    def make_key(self, key):
+        return key
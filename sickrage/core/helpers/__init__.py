@@ -48,8 +48,8 @@ import six
 from bs4 import BeautifulSoup
 
 import sickrage
-from sickrage.core.common import Quality, SKIPPED, WANTED, FAILED, UNAIRED
-from sickrage.core.exceptions import MultipleShowObjectsException
+from sickrage.core.exceptions import MultipleShowObjectsException, NoFreeSpaceException
+from sickrage.core.helpers.transfer import transfer_file
 
 
 def safe_getattr(object, name, default=None):
@@ -381,7 +381,7 @@ def findCertainShow(indexerid, return_show_object=True):
         return None
 
     indexer_ids = [indexerid] if not isinstance(indexerid, list) else indexerid
-    results = [show for show in sickrage.app.showlist if show.indexerid in indexer_ids]
+    results = [show for x in indexer_ids for show in sickrage.app.showlist.find_by_indexerid(x)]
 
     if not results:
         return None
@@ -396,7 +396,7 @@ def findCertainShow(indexerid, return_show_object=True):
 
 
 def search_showlist_by_name(term):
-    results = [show for show in sickrage.app.showlist if show.name.lower() == term.lower()]
+    results = sickrage.app.showlist.find_by_name(term)
 
     if not results:
         return None
@@ -458,17 +458,14 @@ def copy_file(src_file, dest_file):
     """
 
     try:
-        shutil.copyfile(src_file, dest_file)
-    except OSError as e:
+        transfer_file(src_file, dest_file)
+    except NoFreeSpaceException as e:
+        sickrage.app.log.warning(e)
+    except (IOError, OSError) as e:
         if e.errno == errno.ENOSPC:
             sickrage.app.log.warning(e)
         else:
             sickrage.app.log.error(e)
-    else:
-        try:
-            shutil.copymode(src_file, dest_file)
-        except OSError:
-            pass
 
 
 def move_file(src_file, dest_file):
@@ -479,12 +476,19 @@ def move_file(src_file, dest_file):
     :param dest_file: Path of destination file
     """
 
-    try:
+    # directories and moves into a directory are left to shutil
+    if not os.path.isfile(src_file) or os.path.isdir(dest_file):
         shutil.move(src_file, dest_file)
         fix_set_group_id(dest_file)
+        return
+
+    try:
+        os.rename(src_file, dest_file)
     except OSError:
-        copy_file(src_file, dest_file)
-        os.unlink(src_file)
+        # different filesystem, the source is only removed once the copy is complete
+        transfer_file(src_file, dest_file, move=True)
+
+    fix_set_group_id(dest_file)
 
 
 def link(src, dst):
@@ -1568,57 +1572,32 @@ def app_statistics():
         'total_size': 0
     }
 
-    today = datetime.date.today().toordinal()
-
-    status_quality = Quality.SNATCHED + Quality.SNATCHED_PROPER + Quality.SNATCHED_BEST
-    status_download = Quality.DOWNLOADED + Quality.ARCHIVED
-
     max_download_count = 1000
 
     for show in sickrage.app.showlist:
         if sickrage.app.show_queue.is_being_added(show) or sickrage.app.show_queue.is_being_removed(show):
             continue
 
-        for epData in sickrage.app.main_db.get_many('tv_episodes', show.indexerid):
-            if show.indexerid not in show_stat:
-                show_stat[show.indexerid] = {}
-                show_stat[show.indexerid]['ep_snatched'] = 0
-                show_stat[show.indexerid]['ep_downloaded'] = 0
-                show_stat[show.indexerid]['ep_total'] = 0
-                show_stat[show.indexerid]['ep_airs_next'] = None
-                show_stat[show.indexerid]['ep_airs_prev'] = None
-                show_stat[show.indexerid]['total_size'] = 0
-
-            season = epData['season']
-            episode = epData['episode']
-            airdate = epData['airdate']
-            status = epData['status']
-
-            if season > 0 and episode > 0 and airdate > 1:
-                if status in status_quality:
-                    show_stat[show.indexerid]['ep_snatched'] += 1
-                    overall_stats['episodes']['snatched'] += 1
-
-                if status in status_download:
-                    show_stat[show.indexerid]['ep_downloaded'] += 1
-                    overall_stats['episodes']['downloaded'] += 1
-
-                if (airdate <= today and status in [SKIPPED, WANTED, FAILED]) or (
-                        status in status_quality + status_download):
-                    show_stat[show.indexerid]['ep_total'] += 1
-
-                if show_stat[show.indexerid]['ep_total'] > max_download_count:
-                    max_download_count = show_stat[show.indexerid]['ep_total']
-
-                if airdate >= today and status in [WANTED, UNAIRED] and not show_stat[show.indexerid]['ep_airs_next']:
-                    show_stat[show.indexerid]['ep_airs_next'] = airdate
-                elif airdate < today > show_stat[show.indexerid]['ep_airs_prev'] and status != UNAIRED:
-                    show_stat[show.indexerid]['ep_airs_prev'] = airdate
-
-                show_stat[show.indexerid]['total_size'] += epData['file_size']
-
-                overall_stats['episodes']['total'] += 1
-                overall_stats['total_size'] += epData['file_size']
+        stats = sickrage.app.show_stats_cache.get(show.indexerid)
+        if not stats:
+            continue
+
+        show_stat[show.indexerid] = {
+            'ep_snatched': stats['ep_snatched'],
+            'ep_downloaded': stats['ep_downloaded'],
+            'ep_total': stats['ep_total'],
+            'ep_airs_next': stats['ep_airs_next'],
+            'ep_airs_prev': stats['ep_airs_prev'],
+            'total_size': stats['total_size']
+        }
+
+        if stats['ep_total'] > max_download_count:
+            max_download_count = stats['ep_total']
+
+        overall_stats['episodes']['snatched'] += stats['ep_snatched']
+        overall_stats['episodes']['downloaded'] += stats['ep_downloaded']
+        overall_stats['episodes']['total'] += stats['ep_count']
+        overall_stats['total_size'] += stats['total_size']
 
     max_download_count *= 100
 
@@ -0,0 +1,264 @@
+# Author: echel0n <echel0n@sickrage.ca>
+# URL: https://sickrage.ca
+#
+# This file is part of SickRage.
+#
+# SickRage is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# SickRage is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with SickRage.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import shutil
+import sys
+import time
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+import sickrage
+from sickrage.core.exceptions import NoFreeSpaceException
+from sickrage.core.ui import ProgressIndicators
+
+# ioctl that clones the extents of one file into another on btrfs, xfs and other copy-on-write filesystems
+FICLONE = 0x40049409
+
+# bytes handed to the kernel per copy call, progress is updated in between
+CHUNK_SIZE = 64 * 1024 * 1024
+
+# transfers of files this size or larger are reported to the UI
+NOTIFY_SIZE = 1024 * 1024 * 1024
+NOTIFY_INTERVAL = 30
+
+# errors meaning a copy method isn't supported for these files, the next method is tried instead
+UNSUPPORTED_ERRNOS = (errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EBADF, getattr(errno, 'EOPNOTSUPP', None),
+                      getattr(errno, 'ENOTSUP', None))
+
+_libc = None
+if sys.platform.startswith('linux'):
+    try:
+        _libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+    except OSError:
+        pass
+
+
+def _libc_function(name, argtypes):
+    func = getattr(_libc, name, None) if _libc else None
+    if func:
+        func.argtypes = argtypes
+        func.restype = ctypes.c_ssize_t
+    return func
+
+
+_copy_file_range = _libc_function('copy_file_range', [ctypes.c_int, ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p,
+                                                      ctypes.c_size_t, ctypes.c_uint])
+_sendfile = _libc_function('sendfile', [ctypes.c_int, ctypes.c_int, ctypes.c_void_p, ctypes.c_size_t])
+
+
+class FileTransfer(object):
+    """
+    Progress of a file copy, registered with the UI progress indicators while it runs
+    """
+
+    def __init__(self, src_file, dest_file, size, move=False):
+        self.src_file = src_file
+        self.dest_file = dest_file
+        self.size = size
+        self.action = ('Copying', 'Moving')[move]
+        self.method = None
+        self.copied = 0
+        self.start_time = time.time()
+        self.last_report = self.start_time
+
+    @property
+    def throughput(self):
+        """Average speed of the transfer in bytes per second"""
+        return self.copied / max(time.time() - self.start_time, 0.001)
+
+    def percentComplete(self):
+        return int(self.copied * 100 / self.size) if self.size else 100
+
+    def status(self):
+        return "{} {}: {}% at {:.1f} MB/s".format(self.action, os.path.basename(self.src_file), self.percentComplete(),
+                                                  self.throughput / (1024 * 1024))
+
+    def update(self, copied):
+        self.copied += copied
+
+        if self.size >= NOTIFY_SIZE and time.time() - self.last_report >= NOTIFY_INTERVAL:
+            self.last_report = time.time()
+            self._notify(self.status())
+
+    def finish(self):
+        self.copied = self.size
+
+        message = "{} {} done in {:.1f}s using {} at {:.1f} MB/s".format(
+            self.action, os.path.basename(self.src_file), time.time() - self.start_time, self.method,
+            self.throughput / (1024 * 1024))
+        sickrage.app.log.debug(message)
+
+        if self.size >= NOTIFY_SIZE:
+            self._notify(message)
+
+    def _notify(self, message):
+        sickrage.app.log.info(message)
+        if sickrage.app.alerts:
+            sickrage.app.alerts.message(_('File transfer'), message)
+
+
+def free_space(path):
+    """
+    Free space available to the current user
+
+    :param path: Path on the filesystem to check
+    :return: free bytes, None if unknown
+    """
+
+    try:
+        if os.name == 'nt':
+            free = ctypes.c_ulonglong()
+            if ctypes.windll.kernel32.GetDiskFreeSpaceExW(ctypes.c_wchar_p(path), ctypes.byref(free), None, None):
+                return free.value
+        else:
+            st = os.statvfs(path)
+            return st.f_bavail * st.f_frsize
+    except Exception:
+        pass
+
+
+def _reflink(src_fd, dest_fd):
+    if not fcntl or not sys.platform.startswith('linux'):
+        return False
+
+    try:
+        fcntl.ioctl(dest_fd, FICLONE, src_fd)
+    except (IOError, OSError):
+        return False
+
+    return True
+
+
+def _kernel_copy(func):
+    def copy(src_fd, dest_fd, count):
+        if func is _copy_file_range:
+            copied = func(src_fd, None, dest_fd, None, count, 0)
+        else:
+            copied = func(dest_fd, src_fd, None, count)
+
+        if copied < 0:
+            e = ctypes.get_errno()
+            raise OSError(e, os.strerror(e))
+
+        return copied
+
+    return copy
+
+
+def _read_write(src_fd, dest_fd, count):
+    data = os.read(src_fd, min(count, 1024 * 1024))
+    view = memoryview(data)
+    while view:
+        view = view[os.write(dest_fd, view):]
+    return len(data)
+
+
+def _copy_data(src_fd, dest_fd, transfer):
+    methods = [('read/write', _read_write)]
+    if _sendfile:
+        methods.insert(0, ('sendfile', _kernel_copy(_sendfile)))
+    if _copy_file_range:
+        methods.insert(0, ('copy_file_range', _kernel_copy(_copy_file_range)))
+
+    while methods:
+        transfer.method, copy = methods[0]
+        try:
+            while True:
+                copied = copy(src_fd, dest_fd, CHUNK_SIZE)
+                if not copied:
+                    return
+                transfer.update(copied)
+        except OSError as e:
+            # both fds advance as data is copied, so the next method carries on where this one stopped
+            if len(methods) == 1 or e.errno not in UNSUPPORTED_ERRNOS:
+                raise
+            methods.pop(0)
+
+
+def transfer_file(src_file, dest_file, move=False):
+    """
+    Copy a file, cloning it on copy-on-write filesystems and using in-kernel copies everywhere else.
+
+    The data is written to a temporary file next to the destination that is renamed into place when complete,
+    so the destination never holds a partial file.
+
+    :param src_file: Path of source file
+    :param dest_file: Path of destination file
+    :param move: remove the source file once the copy succeeded
+    """
+
+    size = os.path.getsize(src_file)
+    temp_file = dest_file + '.sr_transfer'
+
+    # checked before the temporary file is created, even though a clone wouldn't need the space
+    available = free_space(os.path.dirname(os.path.abspath(dest_file)))
+    if available is not None and available < size:
+        raise NoFreeSpaceException(
+            "Not enough space to copy {} to {}, {} bytes needed but only {} bytes free".format(
+                src_file, dest_file, size, available))
+
+    # getIndicator drops the finished transfers
+    ProgressIndicators.getIndicator('fileTransfers')
+    transfer = FileTransfer(src_file, dest_file, size, move)
+    ProgressIndicators.setIndicator('fileTransfers', transfer)
+
+    src_fd = dest_fd = None
+    try:
+        src_fd = os.open(src_file, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+        dest_fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o666)
+
+        if _reflink(src_fd, dest_fd):
+            transfer.method = 'reflink'
+        else:
+            _copy_data(src_fd, dest_fd, transfer)
+
+        os.close(dest_fd)
+        dest_fd = None
+
+        try:
+            shutil.copymode(src_file, temp_file)
+        except OSError:
+            pass
+
+        if os.name == 'nt' and os.path.exists(dest_file):
+            os.remove(dest_file)
+        os.rename(temp_file, dest_file)
+    except BaseException:
+        if dest_fd is not None:
+            os.close(dest_fd)
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
+        transfer.copied = size
+        raise
+    finally:
+        if src_fd is not None:
+            os.close(src_fd)
+
+    transfer.finish()
+
+    if move:
+        os.unlink(src_file)
@@ -18,12 +18,14 @@
 
 from __future__ import unicode_literals
 
+import copy
 import os
 import re
 import time
 from collections import OrderedDict
 from threading import Lock
 
+from concurrent.futures import ProcessPoolExecutor
 from dateutil import parser
 
 import sickrage
@@ -44,12 +46,20 @@ class NameParser(object):
     NORMAL_REGEX = 1
     ANIME_REGEX = 2
 
+    compiled_regexes_cache = {}
+    compiled_regexes_lock = Lock()
+    digit_regex = re.compile(r'\d')
+
     def __init__(self, file_name=True, showObj=None, naming_pattern=False, validate_show=True):
         self.file_name = file_name
         self.showObj = showObj
         self.naming_pattern = naming_pattern
         self.validate_show = validate_show
 
+        # state shared by the names of a parse_many batch
+        self.show_lookups = None
+        self.regex_matches = None
+
         if self.showObj and not self.showObj.is_anime:
             self._compile_regexes(self.NORMAL_REGEX)
         elif self.showObj and self.showObj.is_anime:
@@ -130,6 +140,15 @@ class NameParser(object):
         return series_name.strip()
 
     def _compile_regexes(self, regexMode):
+        # regexes are compiled once per mode and shared by all parser instances
+        with self.compiled_regexes_lock:
+            if regexMode not in self.compiled_regexes_cache:
+                self.compiled_regexes_cache[regexMode] = self._build_regexes(regexMode)
+
+        self.regex_mode = regexMode
+        self.compiled_regexes = self.compiled_regexes_cache[regexMode]
+
+    def _build_regexes(self, regexMode):
         if regexMode == self.ANIME_REGEX:
             dbg_str = "ANIME"
             uncompiled_regex = [regexes.anime_regexes]
@@ -140,7 +159,7 @@ class NameParser(object):
             dbg_str = "ALL"
             uncompiled_regex = [regexes.normal_regexes, regexes.anime_regexes]
 
-        self.compiled_regexes = []
+        compiled_regexes = []
         for regexItem in uncompiled_regex:
             for cur_pattern_num, (cur_pattern_name, cur_pattern) in enumerate(regexItem):
                 try:
@@ -150,16 +169,29 @@ class NameParser(object):
                         "WARNING: Invalid episode_pattern using %s regexs, %s. %s" % (
                             dbg_str, errormsg, cur_pattern))
                 else:
-                    self.compiled_regexes.append((cur_pattern_num, cur_pattern_name, cur_regex))
+                    # only patterns accepting roman numerals can match a name without any digits
+                    needs_digit = '[ivx]' not in cur_pattern
+                    compiled_regexes.append((cur_pattern_num, cur_pattern_name, cur_regex, needs_digit))
 
-    def _parse_string(self, name, skip_scene_detection=False):
-        if not name:
-            return
+        return compiled_regexes
+
+    def _match_string(self, name):
+        """
+        Runs the compiled regexes against a name, this only depends on the name so it can run in another process
+
+        :param name: name to match
+        :return: best matching ParseResult or None
+        """
 
         matches = []
-        bestResult = None
 
-        for (cur_regex_num, cur_regex_name, cur_regex) in self.compiled_regexes:
+        has_digit = bool(self.digit_regex.search(name))
+
+        for (cur_regex_num, cur_regex_name, cur_regex, needs_digit) in self.compiled_regexes:
+            # skip patterns that can't match this name
+            if needs_digit and not has_digit:
+                continue
+
             match = cur_regex.match(name)
 
             if not match:
@@ -249,14 +281,29 @@ class NameParser(object):
 
         if len(matches):
             # pick best match with highest score based on placement
-            bestResult = max(sorted(matches, reverse=True, key=lambda x: x.which_regex), key=lambda x: x.score)
+            return max(sorted(matches, reverse=True, key=lambda x: x.which_regex), key=lambda x: x.score)
+
+    def _parse_string(self, name, skip_scene_detection=False):
+        if not name:
+            return
 
+        if self.regex_matches is not None and name in self.regex_matches:
+            bestResult = copy.copy(self.regex_matches[name])
+        else:
+            bestResult = self._match_string(name)
+
+        if bestResult:
             bestResult.show = self.showObj
             bestResult.indexerid = self.showObj.indexerid if self.showObj else 0
 
             if not self.naming_pattern:
-                # try and create a show object for this result
-                bestResult.show, bestResult.indexerid = self.get_show(bestResult.series_name)
+                # try and create a show object for this result, batches share their show lookups
+                if self.show_lookups is None:
+                    bestResult.show, bestResult.indexerid = self.get_show(bestResult.series_name)
+                else:
+                    if bestResult.series_name not in self.show_lookups:
+                        self.show_lookups[bestResult.series_name] = self.get_show(bestResult.series_name)
+                    bestResult.show, bestResult.indexerid = self.show_lookups[bestResult.series_name]
 
                 # confirm passed in show object indexer id matches result show object indexer id
                 if self.showObj and bestResult.show:
@@ -283,8 +330,9 @@ class NameParser(object):
             if bestResult.is_air_by_date:
                 airdate = bestResult.air_date.toordinal()
 
-                dbData = [x for x in sickrage.app.main_db.get_many('tv_episodes', bestResult.show.indexerid)
-                          if x['indexer'] == bestResult.show.indexer and x['airdate'] == airdate]
+                dbData = [x for x in sickrage.app.main_db.get_many('tv_episodes_airdate',
+                                                                   (bestResult.show.indexerid, airdate))
+                          if x['indexer'] == bestResult.show.indexer]
 
                 season_number = None
                 episode_numbers = []
@@ -455,6 +503,62 @@ class NameParser(object):
 
         return number
 
+    def _split_name(self, name):
+        # break it into parts if there are any (dirname, file name, extension)
+        dir_name, file_name = os.path.split(name)
+
+        base_file_name = file_name
+        if self.file_name:
+            base_file_name = remove_extension(file_name)
+
+        # use only the direct parent dir
+        return base_file_name, os.path.basename(dir_name)
+
+    def parse_many(self, names, cache_result=True, skip_scene_detection=False, processes=1):
+        """
+        Parses a batch of names, duplicate names are parsed once and show lookups are shared by the whole batch
+
+        :param names: names to parse
+        :param cache_result: add the parse results to the name parser cache
+        :param skip_scene_detection: don't convert scene numbering
+        :param processes: number of processes to run the regexes in, only worth it for very large batches
+        :return: dict of name and ParseResult, names that failed to parse are left out
+        """
+
+        results = OrderedDict()
+
+        self.show_lookups = {}
+        try:
+            names = [x for x in OrderedDict.fromkeys(names) if x]
+
+            if processes > 1 and len(names) > 1:
+                self.regex_matches = self._match_many(names, processes)
+
+            for name in names:
+                try:
+                    results[name] = self.parse(name, cache_result, skip_scene_detection)
+                except (InvalidNameException, InvalidShowException) as e:
+                    sickrage.app.log.debug("{}".format(e))
+        finally:
+            self.show_lookups = None
+            self.regex_matches = None
+
+        return results
+
+    def _match_many(self, names, processes):
+        strings = set()
+        for name in names:
+            strings.update(self._split_name(name))
+        strings = [x for x in strings if x]
+
+        matches = {}
+        chunks = [strings[i::processes] for i in range(processes)]
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            for chunk, results in zip(chunks, executor.map(_match_strings, [self.regex_mode] * processes, chunks)):
+                matches.update(zip(chunk, results))
+
+        return matches
+
     def parse(self, name, cache_result=True, skip_scene_detection=False):
         if self.naming_pattern:
             cache_result = False
@@ -463,12 +567,7 @@ class NameParser(object):
         if cached:
             return cached
 
-        # break it into parts if there are any (dirname, file name, extension)
-        dir_name, file_name = os.path.split(name)
-
-        base_file_name = file_name
-        if self.file_name:
-            base_file_name = remove_extension(file_name)
+        base_file_name, dir_name = self._split_name(name)
 
         # set up a result to use
         final_result = ParseResult(name)
@@ -476,9 +575,6 @@ class NameParser(object):
         # try parsing the file name
         file_name_result = self._parse_string(base_file_name, skip_scene_detection)
 
-        # use only the direct parent dir
-        dir_name = os.path.basename(dir_name)
-
         # parse the dirname for extra info if needed
         dir_name_result = self._parse_string(dir_name, skip_scene_detection)
 
@@ -529,6 +625,16 @@ class NameParser(object):
         return final_result
 
 
+def _match_strings(regex_mode, names):
+    """
+    Process pool worker for NameParser.parse_many, returns the best regex match of each name
+    """
+
+    name_parser = NameParser(naming_pattern=True)
+    name_parser._compile_regexes(regex_mode)
+    return [name_parser._match_string(x) for x in names]
+
+
 class ParseResult(object):
     def __init__(self,
                  original_name,
@@ -622,23 +728,70 @@ class ParseResult(object):
 
 
 class NameParserCache(object):
+    """
+    Least recently used cache of parse results, entries expire after a configurable number of minutes
+    """
+
     def __init__(self):
         self.lock = Lock()
         self.data = OrderedDict()
-        self.max_size = 200
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def max_size(self):
+        return max(sickrage.app.config.name_parser_cache_size, 1)
+
+    @property
+    def ttl(self):
+        return sickrage.app.config.name_parser_cache_ttl * 60
 
     def get(self, key):
         with self.lock:
-            value = self.data.get(key)
-            if value:
-                sickrage.app.log.debug("Using cached parse result for: {}".format(key))
+            try:
+                value, added = self.data.pop(key)
+            except KeyError:
+                self.misses += 1
+                return
+
+            if self.ttl and time.time() - added > self.ttl:
+                self.evictions += 1
+                self.misses += 1
+                return
+
+            # re-insert so the entry becomes the most recently used one
+            self.data[key] = (value, added)
+            self.hits += 1
             return value
 
     def add(self, key, value):
         with self.lock:
-            self.data.update({key: value})
+            self.data.pop(key, None)
+            self.data[key] = (value, time.time())
             while len(self.data) > self.max_size:
-                self.data.pop(list(self.data.keys())[0], None)
+                self.data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self, indexerid=None):
+        """
+        Removes cached parse results, either for a single show or all of them
+
+        :param indexerid: show indexer id or None to clear the whole cache
+        """
+        with self.lock:
+            if indexerid is None:
+                self.data.clear()
+                return
+
+            for key in [k for k, (v, __) in self.data.items() if v.show and v.show.indexerid == indexerid]:
+                del self.data[key]
+
+    @property
+    def stats(self):
+        with self.lock:
+            return {'size': len(self.data), 'max_size': self.max_size, 'hits': self.hits, 'misses': self.misses,
+                    'evictions': self.evictions}
 
 
 name_parser_cache = NameParserCache()
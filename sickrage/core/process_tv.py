@@ -21,19 +21,29 @@ from __future__ import unicode_literals
 import os
 import shutil
 import stat
+import threading
 
 import rarfile
+from concurrent.futures import ThreadPoolExecutor
 
 import sickrage
 from sickrage.core.common import Quality
 from sickrage.core.exceptions import EpisodePostProcessingFailedException, \
     FailedPostProcessingFailedException, NoFreeSpaceException
 from sickrage.core.helpers import is_media_file, is_rar_file, is_hidden_folder, real_path, is_torrent_or_nzb_file, \
-    is_sync_file
+    is_sync_file, remove_extension, remove_non_release_groups
 from sickrage.core.nameparser import InvalidNameException, InvalidShowException, \
     NameParser
 from sickrage.core.processors import failed_processor, post_processor
 
+# (size, mtime) of the video files handled by the last auto post-processing scans, keyed by path
+scanned_files = {}
+scanned_files_lock = threading.Lock()
+
+# locks that keep episodes of the same show from being processed together
+show_locks = {}
+show_locks_lock = threading.Lock()
+
 
 class ProcessResult(object):
     def __init__(self):
@@ -206,7 +216,8 @@ def processDir(dirName, nzbName=None, process_method=None, force=False, is_prior
         video_files = filter(is_media_file, file_names)
         if video_files:
             try:
-                process_media(current_directory, video_files, nzbName, process_method, force, is_priority, result)
+                process_media(current_directory, video_files, nzbName, process_method, force, is_priority, result,
+                              proc_type)
             except NoFreeSpaceException:
                 continue
         else:
@@ -465,19 +476,21 @@ def already_postprocessed(dirName, videofile, force, result):
         return False
 
     # Avoid processing the same dir again if we use a process method <> move
-    if [x for x in sickrage.app.main_db.all('tv_episodes') if
-        x['release_name'] and (x['release_name'] in dirName or x['release_name'] in videofile)]:
+    names = [x for x in dirName.replace('\\', '/').split('/') if x] + [videofile, videofile.rpartition('.')[0]]
+    if any(sickrage.app.main_db.get_episodes_by_release_name(x) for x in set(names) if x):
         return True
 
     # Needed if we have downloaded the same episode @ different quality
     # But we need to make sure we check the history of the episode we're going to PP, and not others
-    np = NameParser(dirName)
-    try:
-        parse_result = np.parse(dirName)
-    except:
-        parse_result = False
+    history = [h for h in sickrage.app.main_db.get_history_by_resource(videofile) if h['resource'].endswith(videofile)]
+    if history:
+        np = NameParser(dirName)
+        try:
+            parse_result = np.parse(dirName)
+        except:
+            parse_result = False
 
-    for h in (h for h in sickrage.app.main_db.all('history') if h['resource'].endswith(videofile)):
+    for h in history:
         for e in (e for e in sickrage.app.main_db.get_many('tv_episodes', h['showid'])
                   if h['season'] == e['season'] and h['episode'] == e['episode']
                      and e['status'] in Quality.DOWNLOADED):
@@ -501,7 +514,50 @@ def already_postprocessed(dirName, videofile, force, result):
     return False
 
 
-def process_media(processPath, videoFiles, nzbName, process_method, force, is_priority, result):
+def file_changed(path):
+    """
+    Check if a file changed since the last time it was scanned and remember its current state
+
+    :param path: Path of the file
+    :return: True if the file is new or its size or modification time changed, False if not
+    """
+
+    try:
+        st = os.stat(path)
+    except OSError:
+        return True
+
+    with scanned_files_lock:
+        if scanned_files.get(path) == (st.st_size, st.st_mtime):
+            return False
+
+        if len(scanned_files) > 10000:
+            scanned_files.clear()
+        scanned_files[path] = (st.st_size, st.st_mtime)
+
+    return True
+
+
+def get_show_lock(processPath, video_file):
+    """
+    Returns the lock of the show a video file belongs to, the file name is parsed the same way the post processor
+    parses it so the post processor gets the result from the name parser cache instead of parsing it again
+
+    :param processPath: Path the file resides in
+    :param video_file: File name
+    :return: lock shared by all episodes of the show, files of unknown shows get a lock of their own
+    """
+
+    try:
+        indexerid = NameParser().parse(remove_non_release_groups(remove_extension(video_file))).indexerid
+    except (InvalidNameException, InvalidShowException):
+        return threading.Lock()
+
+    with show_locks_lock:
+        return show_locks.setdefault(indexerid, threading.Lock())
+
+
+def process_media(processPath, videoFiles, nzbName, process_method, force, is_priority, result, proc_type=None):
     """
     Postprocess mediafiles
 
@@ -512,17 +568,79 @@ def process_media(processPath, videoFiles, nzbName, process_method, force, is_pr
     :param force: Postprocess currently postprocessing file
     :param is_priority: Boolean, is this a priority download
     :param result: Previous results
+    :param proc_type: Type of postprocessing auto or manual, auto skips files that didn't change since the last scan
     """
 
-    processor = None
+    video_files = []
     for cur_video_file in videoFiles:
-        cur_video_file_path = os.path.join(processPath, cur_video_file)
+        if proc_type == 'auto' and not force and not file_changed(os.path.join(processPath, cur_video_file)):
+            result.output += logHelper("Skipping unchanged file: {0}".format(cur_video_file), sickrage.app.log.DEBUG)
+            continue
+
+        video_files.append(cur_video_file)
 
+    workers = min(sickrage.app.config.processor_workers, len(video_files))
+    if workers <= 1:
+        for cur_video_file in video_files:
+            process_video_file(processPath, cur_video_file, nzbName, process_method, force, is_priority, result)
+        return
+
+    def worker(cur_video_file, cur_result):
+        with get_show_lock(processPath, cur_video_file):
+            process_video_file(processPath, cur_video_file, nzbName, process_method, force, is_priority, cur_result)
+
+    results = [ProcessResult() for __ in video_files]
+
+    errors = []
+
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        futures = [executor.submit(worker, x, r) for x, r in zip(video_files, results)]
+        for future in futures:
+            try:
+                future.result()
+            except Exception as e:
+                errors.append(e)
+    finally:
+        executor.shutdown()
+
+    # merge the results in file order
+    for cur_result in results:
+        result.output += cur_result.output
+        result.missed_files += cur_result.missed_files
+        result.agg_result = result.agg_result and cur_result.agg_result
+
+    result.result = all(x.result for x in results)
+
+    # errors are raised once the output of every file is kept, like the first error of a sequential run
+    if errors:
+        raise errors[0]
+
+
+def process_video_file(processPath, cur_video_file, nzbName, process_method, force, is_priority, result):
+    """
+    Postprocess a single media file
+
+    :param processPath: Path to postprocess in
+    :param cur_video_file: Filename to postprocess
+    :param nzbName: Name of NZB file related
+    :param process_method: auto/manual
+    :param force: Postprocess currently postprocessing file
+    :param is_priority: Boolean, is this a priority download
+    :param result: Previous results
+    """
+
+    cur_video_file_path = os.path.join(processPath, cur_video_file)
+
+    succeeded = False
+    try:
         if already_postprocessed(processPath, cur_video_file, force, result):
             result.output += logHelper("Skipping already processed file: {0}".format(cur_video_file),
                                        sickrage.app.log.DEBUG)
-            continue
+            succeeded = True
+            return
 
+        processor = None
         try:
             processor = post_processor.PostProcessor(cur_video_file_path, nzbName, process_method, is_priority)
             result.result = processor.process
@@ -536,12 +654,19 @@ def process_media(processPath, videoFiles, nzbName, process_method, force, is_pr
 
         if result.result:
             result.output += logHelper("Processing succeeded for " + cur_video_file_path)
+            succeeded = True
         else:
             result.output += logHelper(
                 "Processing failed for {0}: {1}".format(cur_video_file_path, process_fail_message),
                 sickrage.app.log.WARNING)
-            result.missed_files.append("{0} : Processing failed: {1}".format(cur_video_file_path, process_fail_message))
+            result.missed_files.append(
+                "{0} : Processing failed: {1}".format(cur_video_file_path, process_fail_message))
             result.agg_result = False
+    finally:
+        # files that failed or raised are retried on the next scan even if they didn't change
+        if not succeeded:
+            with scanned_files_lock:
+                scanned_files.pop(cur_video_file_path, None)
 
 
 def process_failed(dirName, nzbName, result):
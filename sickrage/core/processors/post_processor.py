@@ -30,10 +30,11 @@ from sickrage.core.common import Quality, ARCHIVED, DOWNLOADED
 from sickrage.core.exceptions import EpisodeNotFoundException, EpisodePostProcessingFailedException, \
     NoFreeSpaceException
 from sickrage.core.helpers import findCertainShow, show_names, replaceExtension, makeDir, \
-    chmod_as_parent, move_file, copy_file, hardlink_file, move_and_symlink_file, remove_non_release_groups, \
+    chmod_as_parent, move_file, hardlink_file, move_and_symlink_file, remove_non_release_groups, \
     remove_extension, \
     isFileLocked, verify_freespace, delete_empty_folders, make_dirs, symlink, is_rar_file, glob_escape, touch_file
 from sickrage.core.helpers.anidb import get_anime_episode
+from sickrage.core.helpers.transfer import transfer_file
 from sickrage.core.nameparser import InvalidNameException, InvalidShowException, \
     NameParser
 from sickrage.core.tv.show.history import FailedHistory, History  # memory intensive
@@ -411,7 +412,7 @@ class PostProcessor(object):
 
             self._log("Copying file from " + cur_file_path + " to " + new_file_path, sickrage.app.log.DEBUG)
             try:
-                copy_file(cur_file_path, new_file_path)
+                transfer_file(cur_file_path, new_file_path)
                 chmod_as_parent(new_file_path)
             except (IOError, OSError) as e:
                 self._log("Unable to copy file {} to {}: {}".format(cur_file_path, new_file_path, e),
@@ -527,7 +528,7 @@ class PostProcessor(object):
 
         # search the database for a possible match and return immediately if we find one
         for curName in names:
-            dbData = [x for x in sickrage.app.main_db.all('history') if curName in x['resource']]
+            dbData = sickrage.app.main_db.get_history_by_resource(curName)
             if len(dbData) == 0:
                 continue
 
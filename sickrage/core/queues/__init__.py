@@ -24,9 +24,10 @@ try:
 except ImportError:
     from queue import PriorityQueue, Empty, Queue
 
-import time
 import datetime
+import heapq
 import threading
+import time
 
 import sickrage
 
@@ -50,33 +51,98 @@ class srQueue(threading.Thread):
         self.amActive = False
         self.lock = threading.Lock()
         self.stop = threading.Event()
+        self.wakeup = threading.Event()
+        self.latency = {'count': 0, 'last': 0.0, 'average': 0.0, 'max': 0.0}
 
     def run(self):
         """
-        Process items in this queue
+        Process items in this queue, sleeps until an item is added, an item finishes or the queue is unpaused
         """
 
         while not self.stop.is_set():
+            self.wakeup.wait()
+            self.wakeup.clear()
+
             with self.lock:
                 self.amActive = True
 
                 if not self.is_paused:
-                    if self.current_item:
-                        if self.next_item_priority < self.current_item.priority:
-                            self.current_item = self.get()
-                            self.current_item.start()
-                            self.current_item.join()
+                    # with multiple workers, items sharing a key are never run at the same time
+                    running_keys = set()
+                    if self.max_workers > 1:
+                        running_keys = set(self.item_key(x) for x in self._current_items)
+
+                    for item in self.pending_items():
+                        key = self.item_key(item)
+                        if key is not None and key in running_keys:
+                            continue
+
+                        # start items while we have free workers, a higher priority item may preempt the running
+                        # ones but only one at a time, like the old blocking preemption
+                        running = len(self._current_items)
+                        if running < self.max_workers or (running == self.max_workers and item.priority < min(
+                                x.priority for x in self._current_items)):
+                            self.start_item(self.remove(item))
+                            if self.max_workers > 1:
+                                running_keys.add(key)
+                        else:
+                            break
 
-                    if not self.current_item or not self.current_item.isAlive():
-                        if self.current_item:
-                            self.current_item = None
+                self.amActive = False
 
-                        self.current_item = self.get()
-                        self.current_item.start()
+    @property
+    def max_workers(self):
+        """
+        Number of queue items that are allowed to run at the same time
+        """
+        return 1
 
-                self.amActive = False
+    def item_key(self, item):
+        """
+        Items sharing a key never run at the same time, None means the item can run alongside anything
+
+        :param item: Queue object
+        :return: key
+        """
+        return None
+
+    def pending_items(self):
+        """
+        Items waiting in this queue, highest priority first
+
+        :return: list of Queue objects
+        """
+        with self._queue.mutex:
+            return [item for __, __, item in sorted(self._queue.queue, key=lambda x: x[:2])]
 
-            time.sleep(1)
+    def start_item(self, item):
+        """
+        Starts a queue item, the item is removed from the running items and the queue is woken up again once it
+        has finished running
+
+        :param item: Queue object to start
+        """
+
+        def run_item(run=item.run):
+            try:
+                run()
+            finally:
+                with self.lock:
+                    if item in self._current_items:
+                        self._current_items.remove(item)
+                self.wakeup.set()
+
+        item.run = run_item
+
+        self.current_item = item
+        self.record_latency((datetime.datetime.now() - item.added).total_seconds())
+        item.start()
+
+    def record_latency(self, seconds):
+        self.latency['count'] += 1
+        self.latency['last'] = seconds
+        self.latency['max'] = max(self.latency['max'], seconds)
+        self.latency['average'] += (seconds - self.latency['average']) / self.latency['count']
 
     @property
     def queue(self):
@@ -84,10 +150,11 @@ class srQueue(threading.Thread):
 
     @property
     def next_item_priority(self):
-        try:
-            priority, __, __ = self._queue.queue[0]
-        except IndexError:
-            priority = srQueuePriorities.LOW
+        with self._queue.mutex:
+            try:
+                priority, __, __ = self._queue.queue[0]
+            except IndexError:
+                priority = srQueuePriorities.LOW
 
         return priority
 
@@ -103,10 +170,26 @@ class srQueue(threading.Thread):
         else:
             del self._current_items[0]
 
+    @property
+    def current_items(self):
+        return list(self._current_items)
+
     def get(self, *args, **kwargs):
         __, __, item = self._queue.get(*args, **kwargs)
         return item
 
+    def remove(self, item):
+        """
+        Removes an item from this queue
+
+        :param item: Queue object to remove
+        :return: item
+        """
+        with self._queue.mutex:
+            self._queue.queue[:] = [x for x in self._queue.queue if x[2] is not item]
+            heapq.heapify(self._queue.queue)
+        return item
+
     def put(self, item, *args, **kwargs):
         """
         Adds an item to this queue
@@ -118,11 +201,12 @@ class srQueue(threading.Thread):
         item.name = "{}-{}".format(self.name, item.name)
         item.result_queue = self._result_queue
         self._queue.put((item.priority, time.time(), item), *args, **kwargs)
+        self.wakeup.set()
         return item
 
     @property
     def is_busy(self):
-        return bool(len([x for x in self._current_items if x.isAlive()]))
+        return bool(len(self._current_items))
 
     @property
     def is_paused(self):
@@ -137,9 +221,11 @@ class srQueue(threading.Thread):
         """Unpauses this queue"""
         sickrage.app.log.info("Un-pausing {}".format(self.name))
         self.min_priority = srQueuePriorities.EXTREME
+        self.wakeup.set()
 
     def shutdown(self):
         self.stop.set()
+        self.wakeup.set()
         try:
             self.join(1)
         except:
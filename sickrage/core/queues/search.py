@@ -49,6 +49,16 @@ class SearchQueue(srQueue):
     def __init__(self):
         srQueue.__init__(self, "SEARCHQUEUE")
 
+    @property
+    def max_workers(self):
+        return max(sickrage.app.config.search_queue_workers, 1)
+
+    def item_key(self, item):
+        # searches for the same show are never run at the same time
+        show = getattr(item, 'show', None)
+        if show:
+            return show.indexerid
+
     def is_in_queue(self, show, segment):
         for __, __, cur_item in self.queue:
             if isinstance(cur_item, BacklogQueueItem) and cur_item.show == show and cur_item.segment == segment:
@@ -94,20 +104,21 @@ class SearchQueue(srQueue):
 
     def is_manualsearch_in_progress(self):
         # Only referenced in webviews.py, only current running manualsearch or failedsearch is needed!!
-        if isinstance(self.current_item, (ManualSearchQueueItem, FailedQueueItem)):
-            return True
+        for cur_item in self.current_items:
+            if isinstance(cur_item, (ManualSearchQueueItem, FailedQueueItem)):
+                return True
 
         return False
 
     def is_backlog_in_progress(self):
-        for __, __, cur_item in self.queue + [(None, None, self.current_item)]:
+        for __, __, cur_item in self.queue + [(None, None, x) for x in self.current_items]:
             if isinstance(cur_item, BacklogQueueItem):
                 return True
 
         return False
 
     def is_dailysearch_in_progress(self):
-        for __, __, cur_item in self.queue + [(None, None, self.current_item)]:
+        for __, __, cur_item in self.queue + [(None, None, x) for x in self.current_items]:
             if isinstance(cur_item, DailySearchQueueItem):
                 return True
 
@@ -115,7 +126,7 @@ class SearchQueue(srQueue):
 
     def queue_length(self):
         length = {'backlog': 0, 'daily': 0, 'manual': 0, 'failed': 0}
-        for __, __, cur_item in self.queue + [(None, None, self.current_item)]:
+        for __, __, cur_item in self.queue + [(None, None, x) for x in self.current_items]:
             if isinstance(cur_item, DailySearchQueueItem):
                 length['daily'] += 1
             elif isinstance(cur_item, BacklogQueueItem):
@@ -30,6 +30,7 @@ from sickrage.core.exceptions import CantRefreshShowException, \
     CantRemoveShowException, CantUpdateShowException, EpisodeDeletedException, \
     MultipleShowObjectsException
 from sickrage.core.helpers import scrub, findCertainShow
+from sickrage.core.nameparser import name_parser_cache
 from sickrage.core.queues import srQueue, srQueueItem, srQueuePriorities
 from sickrage.core.scene_numbering import xem_refresh, get_xem_numbering_for_show
 from sickrage.core.traktapi import srTraktAPI
@@ -43,6 +44,16 @@ class ShowQueue(srQueue):
     def __init__(self):
         srQueue.__init__(self, "SHOWQUEUE")
 
+    @property
+    def max_workers(self):
+        return max(sickrage.app.config.show_queue_workers, 1)
+
+    def item_key(self, item):
+        # actions for the same show are never run at the same time
+        if item.show:
+            return item.show.indexerid
+        return getattr(item, 'indexer_id', None)
+
     @property
     def loading_show_list(self):
         return self._get_loading_show_list()
@@ -52,7 +63,7 @@ class ShowQueue(srQueue):
                                   x.action_id in actions] if show else False
 
     def _is_being(self, show, actions):
-        return self.current_item is not None and show == self.current_item.show and self.current_item.action_id in actions
+        return any(show == x.show and x.action_id in actions for x in self.current_items)
 
     def is_in_update_queue(self, show):
         return self._is_in_queue(show, (ShowQueueActions.UPDATE, ShowQueueActions.FORCEUPDATE))
@@ -85,7 +96,7 @@ class ShowQueue(srQueue):
         return self._is_being(show, (ShowQueueActions.SUBTITLE,))
 
     def _get_queue_items(self):
-        return [x for __, __, x in self.queue + [(None, None, self.current_item)] if x]
+        return [x for __, __, x in self.queue] + self.current_items
 
     def _get_loading_show_list(self):
         return [x for x in self._get_queue_items() if x.is_loading]
@@ -159,7 +170,7 @@ class ShowQueue(srQueue):
 
         # remove other queued actions for this show.
         for __, __, x in self.queue:
-            if x and x.show and x != self.current_item and show.indexerid == x.show.indexerid:
+            if x and x.show and x not in self.current_items and show.indexerid == x.show.indexerid:
                 self.queue.remove(x)
 
         return self.put(QueueItemRemove(show=show, full=full))
@@ -208,7 +219,7 @@ class ShowQueueItem(srQueueItem):
         self.show.flush_episodes()
 
     def is_in_queue(self):
-        return self in sickrage.app.show_queue.queue + [sickrage.app.show_queue.current_item]
+        return self in sickrage.app.show_queue._get_queue_items()
 
     @property
     def show_name(self):
@@ -411,6 +422,9 @@ class QueueItemAdd(ShowQueueItem):
         if not findCertainShow(self.indexer_id):
             sickrage.app.showlist.append(self.show)
 
+        # cached parse results may have matched release names to another show
+        name_parser_cache.clear()
+
         try:
             self.show.load_episodes_from_indexer()
         except Exception as e:
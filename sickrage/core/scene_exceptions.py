@@ -23,6 +23,9 @@ import datetime
 import re
 import threading
 import time
+from functools import partial
+
+from concurrent.futures import ThreadPoolExecutor
 
 import sickrage
 from adba.aniDBAbstracter import Anime
@@ -30,14 +33,82 @@ from sickrage.core.helpers import full_sanitizeSceneName, sanitizeSceneName
 from sickrage.core.websession import WebSession
 from sickrage.indexers import IndexerApi
 
-exception_dict = {}
-anidb_exception_dict = {}
-xem_exception_dict = {}
+exceptionLock = threading.Lock()
 
-exceptionsCache = {}
-exceptionsSeasonCache = {}
 
-exceptionLock = threading.Lock()
+class SceneExceptionsCache(object):
+    """
+    In-memory copy of the scene_exceptions table, indexed by show and by normalized name.
+    Built on first use and rebuilt after the scene exceptions change.
+    """
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.shows = None
+        self.names = None
+        self.sanitized_names = None
+
+    def load(self):
+        shows = {}
+        names = {}
+        sanitized_names = {}
+        seen = set()
+
+        for x in sorted(sickrage.app.cache_db.all('scene_exceptions'), key=lambda d: d['season']):
+            indexer_id = int(x['indexer_id'])
+            season = int(x['season'])
+
+            # the same exception can come from more than one source
+            if (indexer_id, x['show_name'], season) in seen:
+                continue
+            seen.add((indexer_id, x['show_name'], season))
+
+            shows.setdefault(indexer_id, {}).setdefault(season, []).append(x['show_name'])
+            names.setdefault(x['show_name'].lower(), []).append((indexer_id, season))
+
+            sanitized_name = sanitizeSceneName(x['show_name']).lower().replace('.', ' ')
+            sanitized_names.setdefault(sanitized_name, []).append((indexer_id, season))
+
+        with self.lock:
+            self.shows = shows
+            self.names = names
+            self.sanitized_names = sanitized_names
+
+    def clear(self):
+        with self.lock:
+            self.shows = self.names = self.sanitized_names = None
+
+    def _get(self):
+        with self.lock:
+            if self.shows is None:
+                self.load()
+            return self.shows, self.names, self.sanitized_names
+
+    def get_show(self, indexer_id):
+        """
+        :param indexer_id: show indexer id
+        :return: dict of season -> list of scene exceptions
+        """
+        shows, __, __ = self._get()
+        return shows.get(indexer_id, {})
+
+    def get_by_name(self, show_name):
+        """
+        :param show_name: show name to look up
+        :return: list of (indexer_id, season) tuples ordered by season, empty if no exception matches
+        """
+        __, names, sanitized_names = self._get()
+
+        show_name = show_name.lower()
+
+        # try the obvious case first
+        if show_name in names:
+            return list(names[show_name])
+
+        return list(sanitized_names.get(show_name, []))
+
+
+exceptions_cache = SceneExceptionsCache()
 
 
 def shouldRefresh(exList):
@@ -57,92 +128,162 @@ def shouldRefresh(exList):
     return int(time.mktime(datetime.datetime.today().timetuple())) > lastRefresh + MAX_REFRESH_AGE_SECS
 
 
-def setLastRefresh(exList):
+def setLastRefresh(exList, headers=None):
     """
     Update last cache update time for shows in list
 
     :param exList: exception list to set refresh time
+    :param headers: response headers of the fetched list, used to send a conditional request next time
     """
     dbData = sickrage.app.cache_db.get('scene_exceptions_refresh', exList)
-    if dbData:
-        dbData['last_refreshed'] = int(time.mktime(datetime.datetime.today().timetuple()))
-        sickrage.app.cache_db.update(dbData)
-    else:
-        sickrage.app.cache_db.insert({
+    if not dbData:
+        dbData = {
             '_t': 'scene_exceptions_refresh',
-            'last_refreshed': int(time.mktime(datetime.datetime.today().timetuple())),
             'list': exList
-        })
+        }
 
+    dbData['last_refreshed'] = int(time.mktime(datetime.datetime.today().timetuple()))
 
-def retrieve_exceptions(get_xem=True, get_anidb=True):
+    if headers is not None:
+        dbData['etag'] = headers.get('ETag')
+        dbData['last_modified'] = headers.get('Last-Modified')
+
+    if '_id' in dbData:
+        sickrage.app.cache_db.update(dbData)
+    else:
+        sickrage.app.cache_db.insert(dbData)
+
+
+def fetch_exceptions_list(exList, url, **kwargs):
     """
-    Looks up the exceptions on github, parses them into a dict, and inserts them into the
-    scene_exceptions table in cache db and also clears the scene name cache.
+    Fetch an exception list, sending the validators of the last fetched copy so an unchanged list is skipped
+
+    :param exList: exception list the url belongs to
+    :param url: url of the exception list
+    :return: response, None if the list is unchanged or could not be fetched
     """
+    headers = {}
 
-    updated_exceptions = False
+    dbData = sickrage.app.cache_db.get('scene_exceptions_refresh', exList)
+    if dbData and dbData.get('etag'):
+        headers['If-None-Match'] = dbData['etag']
+    if dbData and dbData.get('last_modified'):
+        headers['If-Modified-Since'] = dbData['last_modified']
 
-    for indexer in IndexerApi().indexers:
-        indexer_name = IndexerApi(indexer).name
+    try:
+        resp = WebSession(cache=False).get(url, headers=headers, **kwargs)
+    except Exception as e:
+        sickrage.app.log.debug("Unable to get scene exceptions from {}: {}".format(url, e))
+        return
 
-        if shouldRefresh(indexer_name):
-            sickrage.app.log.info("Checking for SiCKRAGE scene exception updates on {}".format(indexer_name))
-            loc = IndexerApi(indexer).config['scene_loc']
+    if resp.status_code == 304:
+        sickrage.app.log.debug("Scene exceptions from {} are unchanged".format(url))
+        setLastRefresh(exList)
+        return
 
-            try:
-                # each exception is on one line with the format indexer_id: 'show name 1', 'show name 2', etc
-                cur_line = None
-                for cur_line in WebSession().get(loc).text.splitlines():
-                    indexer_id, __, aliases = cur_line.partition(':')
-                    if not aliases:
-                        continue
-
-                    # regex out the list of shows, taking \' into account
-                    exception_dict[int(indexer_id)] = [{re.sub(r'\\(.)', r'\1', x): -1} for x in
-                                                       re.findall(r"'(.*?)(?<!\\)',?", aliases)]
-                if cur_line is None:
-                    sickrage.app.log.debug(
-                        "Check scene exceptions update failed. Unable to update from: {}".format(loc))
-                    continue
+    if not resp.ok:
+        sickrage.app.log.debug("Unable to get scene exceptions from {}: HTTP {}".format(url, resp.status_code))
+        return
+
+    return resp
 
-                # refreshed successfully
-                setLastRefresh(indexer_name)
-            except Exception:
-                continue
+
+def retrieve_exceptions(get_xem=True, get_anidb=True):
+    """
+    Looks up the exceptions from all sources at the same time, and writes the exceptions added to or removed from
+    the sources that changed to the scene_exceptions table in cache db.
+    """
+
+    fetchers = [partial(_sickrage_exceptions_fetcher, indexer) for indexer in IndexerApi().indexers]
 
     # XEM scene exceptions
     if get_xem:
-        _xem_exceptions_fetcher()
+        fetchers += [partial(_xem_exceptions_fetcher, indexer) for indexer in IndexerApi().indexers]
 
     # AniDB scene exceptions
     if get_anidb:
-        _anidb_exceptions_fetcher()
+        fetchers += [_anidb_exceptions_fetcher]
 
-    for cur_indexer_id, cur_exception_dict in exception_dict.items():
-        if not len(cur_exception_dict):
-            continue
+    updated_sources = {}
 
-        existing_exceptions = [x["show_name"] for x in
-                               sickrage.app.cache_db.get_many('scene_exceptions', cur_indexer_id)]
+    with ThreadPoolExecutor(max_workers=len(fetchers)) as executor:
+        for future in [executor.submit(fetcher) for fetcher in fetchers]:
+            try:
+                source, exceptions = future.result()
+            except Exception as e:
+                sickrage.app.log.debug("Unable to fetch scene exceptions: {}".format(e))
+                continue
 
-        for cur_exception, curSeason in dict([(key, d[key]) for d in cur_exception_dict for key in d]).items():
-            if cur_exception not in existing_exceptions:
-                updated_exceptions = True
-                sickrage.app.cache_db.insert({
+            if exceptions is not None:
+                updated_sources[source] = exceptions
+
+    update_source_exceptions(updated_sources)
+
+
+def update_source_exceptions(updated_sources):
+    """
+    Writes the differences between the fetched exception sources and the scene_exceptions table in one batch.
+    Exceptions added by the user are never adopted or removed by a source, exceptions stored before sources were
+    recorded are adopted by the first source that returns them.
+
+    :param updated_sources: dict of source -> dict of indexer_id -> set of (show_name, season)
+    """
+
+    if not updated_sources:
+        return
+
+    with exceptionLock:
+        current = {source: {} for source in updated_sources}
+        unsourced = {}
+        user = set()
+
+        for x in sickrage.app.cache_db.all('scene_exceptions'):
+            key = (int(x['indexer_id']), x['show_name'], int(x['season']))
+            if x.get('source') == 'user':
+                user.add(key)
+            elif x.get('source') in current:
+                current[x['source']][key] = x
+            elif not x.get('source'):
+                unsourced[key] = x
+
+        inserts = []
+        updates = []
+        deletes = []
+
+        for source, exceptions in updated_sources.items():
+            fetched = set((indexer_id, show_name, season) for indexer_id, names in exceptions.items()
+                          for show_name, season in names) - user
+
+            deletes += [current[source][key] for key in set(current[source]) - fetched]
+
+            for key in fetched - set(current[source]):
+                if key in unsourced:
+                    # adopt exceptions stored before sources were recorded instead of duplicating them
+                    dbData = unsourced.pop(key)
+                    dbData['source'] = source
+                    updates.append(dbData)
+                    continue
+
+                inserts.append({
                     '_t': 'scene_exceptions',
-                    'indexer_id': cur_indexer_id,
-                    'show_name': cur_exception,
-                    'season': curSeason
+                    'indexer_id': key[0],
+                    'show_name': key[1],
+                    'season': key[2],
+                    'source': source
                 })
 
-    if updated_exceptions:
-        sickrage.app.log.debug("Updated scene exceptions")
+        for dbData in deletes:
+            sickrage.app.cache_db.delete(dbData)
 
-    # cleanup
-    exception_dict.clear()
-    anidb_exception_dict.clear()
-    xem_exception_dict.clear()
+        for dbData in updates:
+            sickrage.app.cache_db.update(dbData)
+
+        for dbData in inserts:
+            sickrage.app.cache_db.insert(dbData)
+
+    if inserts or deletes:
+        sickrage.app.log.debug("Updated scene exceptions, {} added and {} removed".format(len(inserts), len(deletes)))
+        exceptions_cache.clear()
 
 
 def get_scene_exceptions(indexer_id, season=-1):
@@ -150,22 +291,7 @@ def get_scene_exceptions(indexer_id, season=-1):
     Given a indexer_id, return a list of all the scene exceptions.
     """
 
-    exceptionsList = []
-
-    if indexer_id not in exceptionsCache or season not in exceptionsCache[indexer_id]:
-        try:
-            exceptionsList = list(set([cur_exception['show_name'] for cur_exception in
-                                       sickrage.app.cache_db.get_many('scene_exceptions', indexer_id)
-                                       if cur_exception['season'] == season]))
-
-            if not indexer_id in exceptionsCache:
-                exceptionsCache[indexer_id] = {}
-
-            exceptionsCache[indexer_id][season] = exceptionsList
-        except:
-            pass
-    else:
-        exceptionsList = exceptionsCache[indexer_id][season]
+    exceptionsList = list(set(exceptions_cache.get_show(indexer_id).get(season, [])))
 
     if season == 1:  # if we where looking for season 1 we can add generic names
         exceptionsList += get_scene_exceptions(indexer_id, season=-1)
@@ -180,33 +306,16 @@ def get_all_scene_exceptions(indexer_id):
     :param indexer_id: ID to check
     :return: dict of exceptions
     """
-    exceptionsDict = {}
-
-    for cur_exception in sickrage.app.cache_db.get_many('scene_exceptions', indexer_id):
-        if not cur_exception['season'] in exceptionsDict:
-            exceptionsDict[cur_exception['season']] = []
-        exceptionsDict[cur_exception['season']].append(cur_exception['show_name'])
 
-    return exceptionsDict
+    return {season: list(names) for season, names in exceptions_cache.get_show(indexer_id).items()}
 
 
 def get_scene_seasons(indexer_id):
     """
     return a list of season numbers that have scene exceptions
     """
-    exceptionsSeasonList = []
 
-    if indexer_id not in exceptionsSeasonCache:
-        exceptionsSeasonList = list(
-            set([int(x['season']) for x in sickrage.app.cache_db.get_many('scene_exceptions', indexer_id)]))
-        if not indexer_id in exceptionsSeasonCache:
-            exceptionsSeasonCache[indexer_id] = {}
-
-        exceptionsSeasonCache[indexer_id] = exceptionsSeasonList
-    else:
-        exceptionsSeasonList = exceptionsSeasonCache[indexer_id]
-
-    return exceptionsSeasonList
+    return list(exceptions_cache.get_show(indexer_id).keys())
 
 
 def get_scene_exception_by_name(show_name):
@@ -219,26 +328,7 @@ def get_scene_exception_by_name_multiple(show_name):
     is present.
     """
 
-    out = []
-
-    # try the obvious case first
-    exception_result = [x for x in sorted(sickrage.app.cache_db.all('scene_exceptions'), key=lambda d: d['season']) if
-                        x['show_name'].lower() == show_name.lower()]
-    if exception_result:
-        return [(int(x['indexer_id']), int(x['season'])) for x in exception_result]
-
-    for cur_exception in sorted(sickrage.app.cache_db.all('scene_exceptions'), key=lambda d: d['season']):
-        cur_exception_name = cur_exception['show_name']
-        cur_indexer_id = int(cur_exception['indexer_id'])
-        cur_season = int(cur_exception['season'])
-
-        if show_name.lower() in (
-                cur_exception_name.lower(),
-                sanitizeSceneName(cur_exception_name).lower().replace('.', ' ')):
-            sickrage.app.log.debug(
-                "Scene exception lookup got indexer id " + str(cur_indexer_id) + ", using that")
-            out.append((cur_indexer_id, cur_season))
-
+    out = exceptions_cache.get_by_name(show_name)
     if out:
         return out
     return [(None, None)]
@@ -248,85 +338,124 @@ def update_scene_exceptions(indexer_id, scene_exceptions, season=-1):
     """
     Given a indexer_id, and a list of all show scene exceptions, update the db.
     """
-    [sickrage.app.cache_db.delete(x) for x in sickrage.app.cache_db.get_many('scene_exceptions', indexer_id)
-     if x['season'] == season]
-
     sickrage.app.log.info("Updating scene exceptions")
 
+    with sickrage.app.cache_db.bulk():
+        [sickrage.app.cache_db.delete(x) for x in sickrage.app.cache_db.get_many('scene_exceptions', indexer_id)
+         if x['season'] == season]
+
+        for cur_exception in scene_exceptions:
+            sickrage.app.cache_db.insert({
+                '_t': 'scene_exceptions',
+                'indexer_id': indexer_id,
+                'show_name': cur_exception,
+                'season': season,
+                'source': 'user'
+            })
+
     # A change has been made to the scene exception list. Let's clear the cache, to make this visible
-    if indexer_id in exceptionsCache:
-        exceptionsCache[indexer_id] = {}
-    exceptionsCache[indexer_id][season] = scene_exceptions
+    exceptions_cache.clear()
 
-    for cur_exception in scene_exceptions:
-        sickrage.app.cache_db.insert({
-            '_t': 'scene_exceptions',
-            'indexer_id': indexer_id,
-            'show_name': cur_exception,
-            'season': season
-        })
 
+def _sickrage_exceptions_fetcher(indexer):
+    indexer_name = IndexerApi(indexer).name
+    if not shouldRefresh(indexer_name):
+        return indexer_name, None
 
-def _anidb_exceptions_fetcher():
-    if shouldRefresh('anidb'):
-        sickrage.app.log.info("Checking for AniDB scene exception updates")
-        for show in sickrage.app.showlist:
-            if show.is_anime and show.indexer == 1:
-                try:
-                    anime = Anime(None, name=show.name, tvdbid=show.indexerid, autoCorrectName=True)
-                except Exception:
-                    continue
-                else:
-                    if anime.name and anime.name != show.name:
-                        anidb_exception_dict[show.indexerid] = [{anime.name: -1}]
+    sickrage.app.log.info("Checking for SiCKRAGE scene exception updates on {}".format(indexer_name))
+    loc = IndexerApi(indexer).config['scene_loc']
+
+    resp = fetch_exceptions_list(indexer_name, loc)
+    if not resp:
+        return indexer_name, None
+
+    exceptions = {}
+
+    # each exception is on one line with the format indexer_id: 'show name 1', 'show name 2', etc
+    for cur_line in resp.text.splitlines():
+        indexer_id, __, aliases = cur_line.partition(':')
+        if not aliases or not indexer_id.strip().isdigit():
+            continue
+
+        # regex out the list of shows, taking \' into account
+        exceptions[int(indexer_id)] = set((re.sub(r'\\(.)', r'\1', x), -1) for x in
+                                          re.findall(r"'(.*?)(?<!\\)',?", aliases))
 
-        setLastRefresh('anidb')
+    if not exceptions:
+        sickrage.app.log.debug("Check scene exceptions update failed. Unable to update from: {}".format(loc))
+        return indexer_name, None
 
-    for anidb_ex in anidb_exception_dict:
-        if anidb_ex in exception_dict:
-            exception_dict[anidb_ex] = exception_dict[anidb_ex] + anidb_exception_dict[anidb_ex]
-        else:
-            exception_dict[anidb_ex] = anidb_exception_dict[anidb_ex]
+    # refreshed successfully
+    setLastRefresh(indexer_name, resp.headers)
 
-    return anidb_exception_dict
+    return indexer_name, exceptions
 
 
-def _xem_exceptions_fetcher():
-    if shouldRefresh('xem'):
-        sickrage.app.log.info("Checking for XEM scene exception updates")
+def _anidb_exceptions_fetcher():
+    if not shouldRefresh('anidb'):
+        return 'anidb', None
 
-        for indexer in IndexerApi().indexers:
+    sickrage.app.log.info("Checking for AniDB scene exception updates")
 
-            url = "http://thexem.de/map/allNames?origin=%s&seasonNumbers=1" % IndexerApi(indexer).config[
-                'xem_origin']
+    exceptions = {}
 
+    for show in sickrage.app.showlist:
+        if show.is_anime and show.indexer == 1:
             try:
-                parsedJSON = WebSession().get(url, timeout=90).json()
+                anime = Anime(None, name=show.name, tvdbid=show.indexerid, autoCorrectName=True)
             except Exception:
-                sickrage.app.log.debug("Check scene exceptions update failed for " + IndexerApi(
-                    indexer).name + ", Unable to get URL: " + url)
+                # keep what we have for shows we couldn't look up, they would be removed as unpublished otherwise
+                stored = set((x['show_name'], int(x['season'])) for x in
+                             sickrage.app.cache_db.get_many('scene_exceptions', show.indexerid)
+                             if x.get('source') == 'anidb')
+                if stored:
+                    exceptions[show.indexerid] = stored
                 continue
+            else:
+                if anime.name and anime.name != show.name:
+                    exceptions[show.indexerid] = {(anime.name, -1)}
 
-            if parsedJSON['result'] == 'failure':
-                continue
+    setLastRefresh('anidb')
+
+    return 'anidb', exceptions
+
+
+def _xem_exceptions_fetcher(indexer):
+    xem_list = 'xem_{}'.format(IndexerApi(indexer).config['xem_origin'])
+    if not shouldRefresh(xem_list):
+        return xem_list, None
+
+    sickrage.app.log.info("Checking for XEM scene exception updates on {}".format(IndexerApi(indexer).name))
 
-            for indexerid, names in parsedJSON['data'].items():
-                try:
-                    xem_exception_dict[int(indexerid)] = names
-                except Exception as e:
-                    sickrage.app.log.warning(
-                        "XEM: Rejected entry: indexerid:{0}; names:{1}".format(indexerid, names))
-                    sickrage.app.log.debug("XEM: Rejected entry error message:{}".format(e))
+    url = "http://thexem.de/map/allNames?origin=%s&seasonNumbers=1" % IndexerApi(indexer).config['xem_origin']
 
-        setLastRefresh('xem')
+    resp = fetch_exceptions_list(xem_list, url, timeout=90)
+    if not resp:
+        return xem_list, None
+
+    try:
+        parsedJSON = resp.json()
+    except ValueError:
+        sickrage.app.log.debug("Check scene exceptions update failed for " + IndexerApi(
+            indexer).name + ", Unable to parse URL: " + url)
+        return xem_list, None
+
+    if parsedJSON['result'] == 'failure':
+        return xem_list, None
+
+    exceptions = {}
+
+    for indexerid, names in parsedJSON['data'].items():
+        try:
+            exceptions[int(indexerid)] = set((name, int(season)) for x in names for name, season in x.items())
+        except Exception as e:
+            sickrage.app.log.warning(
+                "XEM: Rejected entry: indexerid:{0}; names:{1}".format(indexerid, names))
+            sickrage.app.log.debug("XEM: Rejected entry error message:{}".format(e))
 
-    for xem_ex in xem_exception_dict:
-        if xem_ex in exception_dict:
-            exception_dict[xem_ex] = exception_dict[xem_ex] + xem_exception_dict[xem_ex]
-        else:
-            exception_dict[xem_ex] = xem_exception_dict[xem_ex]
+    setLastRefresh(xem_list, resp.headers)
 
-    return xem_exception_dict
+    return xem_list, exceptions
 
 
 def getSceneSeasons(indexer_id):
@@ -20,6 +20,7 @@
 from __future__ import unicode_literals
 
 import datetime
+import threading
 import time
 import traceback
 
@@ -29,6 +30,85 @@ from sickrage.core.websession import WebSession
 from sickrage.indexers import IndexerApi
 
 
+class SceneNumberingCache(object):
+    """
+    Two-way scene and XEM numbering maps per show, loaded from the database the first time a show is looked up.
+    Scene numbering comes from the scene_numbering table, XEM numbering from the scene fields of tv_episodes.
+    """
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.scene = {}
+        self.xem = {}
+
+    @staticmethod
+    def _build(rows):
+        numbering = {
+            'rows': [],
+            'scene': {},
+            'indexer': {},
+            'scene_absolute': {},
+            'indexer_absolute': {},
+            'indexer_absolute_season': {},
+        }
+
+        # the first matching row wins, same as the database lookups this replaces
+        for x in rows:
+            season, episode = x.get('season'), x.get('episode')
+            scene_season, scene_episode = x.get('scene_season'), x.get('scene_episode')
+            absolute_number, scene_absolute_number = x.get('absolute_number'), x.get('scene_absolute_number')
+
+            numbering['rows'].append((season, episode, scene_season, scene_episode,
+                                      absolute_number, scene_absolute_number))
+
+            if scene_season != 0 and scene_episode != 0:
+                numbering['scene'].setdefault((season, episode), (try_int(scene_season), try_int(scene_episode)))
+
+            numbering['indexer'].setdefault((scene_season, scene_episode), (try_int(season), try_int(episode)))
+
+            if scene_absolute_number != 0:
+                numbering['scene_absolute'].setdefault(absolute_number, try_int(scene_absolute_number))
+
+            numbering['indexer_absolute'].setdefault(scene_absolute_number, try_int(absolute_number))
+            numbering['indexer_absolute_season'].setdefault((scene_absolute_number, scene_season),
+                                                            try_int(absolute_number))
+
+        return numbering
+
+    def get(self, indexer_id, indexer, xem=False):
+        """
+        :param indexer_id: show indexer id
+        :param indexer: show indexer
+        :param xem: return the XEM numbering instead of the scene numbering
+        :return: dict of numbering maps
+        """
+        cache = (self.scene, self.xem)[xem]
+
+        with self.lock:
+            if (indexer_id, indexer) not in cache:
+                cache[(indexer_id, indexer)] = self._build(
+                    x for x in sickrage.app.main_db.get_many(('scene_numbering', 'tv_episodes')[xem], indexer_id)
+                    if x['indexer'] == indexer)
+
+            return cache[(indexer_id, indexer)]
+
+    def clear(self, indexer_id=None, scene=True, xem=True):
+        with self.lock:
+            for cache in [c for c, wanted in [(self.scene, scene), (self.xem, xem)] if wanted]:
+                for key in [k for k in cache if indexer_id is None or k[0] == indexer_id]:
+                    del cache[key]
+
+
+scene_numbering_cache = SceneNumberingCache()
+
+XEM_HAVEMAP_MAX_AGE_SECS = 21600  # 6 hours
+XEM_HAVEMAP_RETRY_SECS = 600  # 10 minutes
+
+# origin -> (expiry time, mapped ids)
+xem_havemap_cache = {}
+xem_havemap_lock = threading.Lock()
+
+
 def get_scene_numbering(indexer_id, indexer, season, episode, fallback_to_xem=True):
     """
     Returns a tuple, (season, episode), with the scene numbering (if there is one),
@@ -67,18 +147,7 @@ def find_scene_numbering(indexer_id, indexer, season, episode):
     if indexer_id is None or season is None or episode is None:
         return season, episode
 
-    indexer_id = int(indexer_id)
-    indexer = int(indexer)
-
-    dbData = [x for x in sickrage.app.main_db.get_many('scene_numbering', indexer_id)
-              if x['indexer'] == indexer
-              and x['season'] == season
-              and x['episode'] == episode
-              and x['scene_season'] != 0
-              and x['scene_episode'] != 0]
-
-    if dbData:
-        return try_int(dbData[0].get("scene_season")), try_int(dbData[0].get("scene_episode"))
+    return scene_numbering_cache.get(int(indexer_id), int(indexer))['scene'].get((season, episode))
 
 
 def get_scene_absolute_numbering(indexer_id, indexer, absolute_number, fallback_to_xem=True):
@@ -121,16 +190,7 @@ def find_scene_absolute_numbering(indexer_id, indexer, absolute_number):
     if indexer_id is None or absolute_number is None:
         return absolute_number
 
-    indexer_id = int(indexer_id)
-    indexer = int(indexer)
-
-    dbData = [x for x in sickrage.app.main_db.get_many('scene_numbering', indexer_id)
-              if x['indexer'] == indexer
-              and x['absolute_number'] == absolute_number
-              and x['scene_absolute_number'] != 0]
-
-    if dbData:
-        return try_int(dbData[0].get('scene_absolute_number'))
+    return scene_numbering_cache.get(int(indexer_id), int(indexer))['scene_absolute'].get(absolute_number)
 
 
 def get_indexer_numbering(indexer_id, indexer, sceneSeason, sceneEpisode, fallback_to_xem=True):
@@ -144,13 +204,10 @@ def get_indexer_numbering(indexer_id, indexer, sceneSeason, sceneEpisode, fallba
     indexer_id = int(indexer_id)
     indexer = int(indexer)
 
-    dbData = [x for x in sickrage.app.main_db.get_many('scene_numbering', indexer_id)
-              if x['indexer'] == indexer
-              and x['scene_season'] == sceneSeason
-              and x['scene_episode'] == sceneEpisode]
+    numbering = scene_numbering_cache.get(indexer_id, indexer)['indexer']
 
-    if dbData:
-        return try_int(dbData[0].get("season")), try_int(dbData[0].get("episode"))
+    if (sceneSeason, sceneEpisode) in numbering:
+        return numbering[(sceneSeason, sceneEpisode)]
     else:
         if fallback_to_xem:
             return get_indexer_numbering_for_xem(indexer_id, indexer, sceneSeason, sceneEpisode)
@@ -168,18 +225,15 @@ def get_indexer_absolute_numbering(indexer_id, indexer, sceneAbsoluteNumber, fal
     indexer_id = int(indexer_id)
     indexer = int(indexer)
 
+    numbering = scene_numbering_cache.get(indexer_id, indexer)
+
     if scene_season is None:
-        dbData = [x for x in sickrage.app.main_db.get_many('scene_numbering', indexer_id)
-                  if x['indexer'] == indexer
-                  and x['scene_absolute_number'] == sceneAbsoluteNumber]
+        numbering, key = numbering['indexer_absolute'], sceneAbsoluteNumber
     else:
-        dbData = [x for x in sickrage.app.main_db.get_many('scene_numbering', indexer_id)
-                  if x['indexer'] == indexer
-                  and x['scene_absolute_number'] == sceneAbsoluteNumber
-                  and x['scene_season'] == scene_season]
+        numbering, key = numbering['indexer_absolute_season'], (sceneAbsoluteNumber, scene_season)
 
-    if dbData:
-        return try_int(dbData[0].get("absolute_number"))
+    if key in numbering:
+        return numbering[key]
     else:
         if fallback_to_xem:
             return get_indexer_absolute_numbering_for_xem(indexer_id, indexer, sceneAbsoluteNumber, scene_season)
@@ -200,7 +254,7 @@ def set_scene_numbering(indexer_id, indexer, season=0, episode=0, absolute_numbe
 
     if season and episode:
         dbData = [x for x in sickrage.app.main_db.get_many('scene_numbering', indexer_id)
-                  if x['index'] == indexer
+                  if x['indexer'] == indexer
                   and x['season'] == season
                   and x['episode'] == episode]
 
@@ -223,7 +277,7 @@ def set_scene_numbering(indexer_id, indexer, season=0, episode=0, absolute_numbe
 
     elif absolute_number:
         dbData = [x for x in sickrage.app.main_db.get_many('scene_numbering', indexer_id)
-                  if x['index'] == indexer
+                  if x['indexer'] == indexer
                   and x['absolute_number'] == absolute_number]
 
         if len(dbData):
@@ -242,6 +296,8 @@ def set_scene_numbering(indexer_id, indexer, season=0, episode=0, absolute_numbe
                 'scene_absolute_number': sceneAbsolute
             })
 
+    scene_numbering_cache.clear(indexer_id, xem=False)
+
     # Reload data from DB so that cache and db are in sync
     show = findCertainShow(indexer_id)
     show.flush_episodes()
@@ -265,15 +321,7 @@ def find_xem_numbering(indexer_id, indexer, season, episode):
 
     xem_refresh(indexer_id, indexer)
 
-    dbData = [x for x in sickrage.app.main_db.get_many('tv_episodes', indexer_id)
-              if x['indexer'] == indexer
-              and x['season'] == season
-              and x['episode'] == episode
-              and x['scene_season'] != 0
-              and x['scene_episode'] != 0]
-
-    if dbData:
-        return try_int(dbData[0].get("scene_season")), try_int(dbData[0].get("scene_episode"))
+    return scene_numbering_cache.get(indexer_id, indexer, xem=True)['scene'].get((season, episode))
 
 
 def find_xem_absolute_numbering(indexer_id, indexer, absolute_number):
@@ -293,13 +341,7 @@ def find_xem_absolute_numbering(indexer_id, indexer, absolute_number):
 
     xem_refresh(indexer_id, indexer)
 
-    dbData = [x for x in sickrage.app.main_db.get_many('tv_episodes', indexer_id)
-              if x['indexer'] == indexer
-              and x['absolute_number'] == absolute_number
-              and x['scene_absolute_number'] != 0]
-
-    if dbData:
-        return try_int(dbData[0].get('scene_absolute_number'))
+    return scene_numbering_cache.get(indexer_id, indexer, xem=True)['scene_absolute'].get(absolute_number)
 
 
 def get_indexer_numbering_for_xem(indexer_id, indexer, sceneSeason, sceneEpisode):
@@ -319,15 +361,8 @@ def get_indexer_numbering_for_xem(indexer_id, indexer, sceneSeason, sceneEpisode
 
     xem_refresh(indexer_id, indexer)
 
-    dbData = [x for x in sickrage.app.main_db.get_many('tv_episodes', indexer_id)
-              if x['indexer'] == indexer
-              and x['scene_season'] == sceneSeason
-              and x['scene_episode'] == sceneEpisode]
-
-    if dbData:
-        return try_int(dbData[0].get("season")), try_int(dbData[0].get("episode"))
-
-    return sceneSeason, sceneEpisode
+    return scene_numbering_cache.get(indexer_id, indexer, xem=True)['indexer'].get(
+        (sceneSeason, sceneEpisode), (sceneSeason, sceneEpisode))
 
 
 def get_indexer_absolute_numbering_for_xem(indexer_id, indexer, sceneAbsoluteNumber, scene_season=None):
@@ -346,20 +381,12 @@ def get_indexer_absolute_numbering_for_xem(indexer_id, indexer, sceneAbsoluteNum
 
     xem_refresh(indexer_id, indexer)
 
-    if scene_season is None:
-        dbData = [x for x in sickrage.app.main_db.get_many('tv_episodes', indexer_id)
-                  if x['indexer'] == indexer
-                  and x['scene_absolute_number'] == sceneAbsoluteNumber]
-    else:
-        dbData = [x for x in sickrage.app.main_db.get_many('tv_episodes', indexer_id)
-                  if x['indexer'] == indexer
-                  and x['scene_absolute_number'] == sceneAbsoluteNumber
-                  and x['scene_season'] == scene_season]
+    numbering = scene_numbering_cache.get(indexer_id, indexer, xem=True)
 
-    if dbData:
-        return try_int(dbData[0].get('absolute_number'))
+    if scene_season is None:
+        return numbering['indexer_absolute'].get(sceneAbsoluteNumber, sceneAbsoluteNumber)
 
-    return sceneAbsoluteNumber
+    return numbering['indexer_absolute_season'].get((sceneAbsoluteNumber, scene_season), sceneAbsoluteNumber)
 
 
 def get_scene_numbering_for_show(indexer_id, indexer):
@@ -375,15 +402,11 @@ def get_scene_numbering_for_show(indexer_id, indexer):
     indexer = int(indexer)
 
     result = {}
-    for dbData in sickrage.app.main_db.get_many('scene_numbering', indexer_id):
-        season = try_int(dbData['season'])
-        episode = try_int(dbData['episode'])
-        scene_season = try_int(dbData['scene_season'])
-        scene_episode = try_int(dbData['scene_episode'])
-        if try_int(dbData['indexer']) != indexer or (scene_season or scene_episode) == 0:
+    for season, episode, scene_season, scene_episode, __, __ in scene_numbering_cache.get(indexer_id, indexer)['rows']:
+        if (try_int(scene_season) or try_int(scene_episode)) == 0:
             continue
 
-        result[(season, episode)] = (scene_season, scene_episode)
+        result[(try_int(season), try_int(episode))] = (try_int(scene_season), try_int(scene_episode))
 
     return result
 
@@ -403,15 +426,12 @@ def get_xem_numbering_for_show(indexer_id, indexer):
     xem_refresh(indexer_id, indexer)
 
     result = {}
-    for dbData in sickrage.app.main_db.get_many('tv_episodes', indexer_id):
-        season = try_int(dbData.get('season'))
-        episode = try_int(dbData.get('episode'))
-        scene_season = try_int(dbData.get('scene_season'))
-        scene_episode = try_int(dbData.get('scene_episode'))
-        if try_int(dbData['indexer']) != indexer or (scene_season or scene_episode) == 0:
+    for season, episode, scene_season, scene_episode, __, __ in scene_numbering_cache.get(indexer_id, indexer,
+                                                                                         xem=True)['rows']:
+        if (try_int(scene_season) or try_int(scene_episode)) == 0:
             continue
 
-        result[(season, episode)] = (scene_season, scene_episode)
+        result[(try_int(season), try_int(episode))] = (try_int(scene_season), try_int(scene_episode))
 
     return result
 
@@ -429,13 +449,12 @@ def get_scene_absolute_numbering_for_show(indexer_id, indexer):
     indexer = int(indexer)
 
     result = {}
-    for dbData in sickrage.app.main_db.get_many('scene_numbering', indexer_id):
-        absolute_number = try_int(dbData.get('absolute_number'))
-        scene_absolute_number = try_int(dbData.get('scene_absolute_number'))
-        if try_int(dbData.get('indexer')) != indexer or scene_absolute_number == 0:
+    for __, __, __, __, absolute_number, scene_absolute_number in scene_numbering_cache.get(indexer_id,
+                                                                                           indexer)['rows']:
+        if try_int(scene_absolute_number) == 0:
             continue
 
-        result[absolute_number] = scene_absolute_number
+        result[try_int(absolute_number)] = try_int(scene_absolute_number)
 
     return result
 
@@ -455,16 +474,46 @@ def get_xem_absolute_numbering_for_show(indexer_id, indexer):
     xem_refresh(indexer_id, indexer)
 
     result = {}
-    for dbData in sickrage.app.main_db.get_many('tv_episodes', indexer_id):
-        absolute_number = try_int(dbData.get('absolute_number'))
-        scene_absolute_number = try_int(dbData.get('scene_absolute_number'))
-        if try_int(dbData['indexer']) != indexer or scene_absolute_number == 0: continue
+    for __, __, __, __, absolute_number, scene_absolute_number in scene_numbering_cache.get(indexer_id, indexer,
+                                                                                           xem=True)['rows']:
+        if try_int(scene_absolute_number) == 0:
+            continue
 
-        result[absolute_number] = scene_absolute_number
+        result[try_int(absolute_number)] = try_int(scene_absolute_number)
 
     return result
 
 
+def get_xem_mapped_ids(indexer):
+    """
+    Returns the ids of the shows XEM has a mapping for, fetched once per origin and cached for a while.
+    Failed fetches are retried after a few minutes, until then the last known ids are used.
+
+    :param indexer: int
+    :return: set of indexer ids, None if XEM could not be reached
+    """
+    origin = IndexerApi(indexer).config['xem_origin']
+
+    with xem_havemap_lock:
+        cached = xem_havemap_cache.get(origin)
+        if cached and time.time() < cached[0]:
+            return cached[1]
+
+        url = "http://thexem.de/map/havemap?origin=%s" % origin
+
+        try:
+            mapped_ids = set(map(int, WebSession().get(url).json()['data']))
+        except Exception:
+            sickrage.app.log.debug("Unable to get XEM mapped shows from {}".format(url))
+            mapped_ids = cached[1] if cached else None
+            xem_havemap_cache[origin] = (time.time() + XEM_HAVEMAP_RETRY_SECS, mapped_ids)
+            return mapped_ids
+
+        xem_havemap_cache[origin] = (time.time() + XEM_HAVEMAP_MAX_AGE_SECS, mapped_ids)
+
+        return mapped_ids
+
+
 def xem_refresh(indexer_id, indexer, force=False):
     """
     Refresh data from xem for a tv show
@@ -481,42 +530,44 @@ def xem_refresh(indexer_id, indexer, force=False):
 
     refresh = True
 
-    dbData = sickrage.app.main_db.get('xem_refresh', indexer_id)
-    if dbData:
-        lastRefresh = try_int(dbData['last_refreshed'])
+    xemData = sickrage.app.main_db.get('xem_refresh', indexer_id)
+    if xemData:
+        lastRefresh = try_int(xemData['last_refreshed'])
         refresh = int(time.mktime(datetime.datetime.today().timetuple())) > lastRefresh + MAX_REFRESH_AGE_SECS
 
-    if refresh or force:
-        sickrage.app.log.debug(
-            'Looking up XEM scene mapping for show %s on %s' % (indexer_id, IndexerApi(indexer).name))
+    if not (refresh or force):
+        return
 
-        # mark refreshed
-        dbData = sickrage.app.main_db.get('xem_refresh', indexer_id)
-        if dbData:
-            dbData['last_refreshed'] = int(time.mktime(datetime.datetime.today().timetuple()))
-            sickrage.app.main_db.update(dbData)
-        else:
-            sickrage.app.main_db.insert({
-                '_t': 'xem_refresh',
-                'indexer': indexer,
-                'last_refreshed': int(time.mktime(datetime.datetime.today().timetuple())),
-                'indexer_id': indexer_id
-            })
+    mapped_ids = get_xem_mapped_ids(indexer)
+    if mapped_ids is None:
+        return
 
-        try:
-            # XEM MAP URL
-            url = "http://thexem.de/map/havemap?origin=%s" % IndexerApi(indexer).config['xem_origin']
+    sickrage.app.log.debug(
+        'Looking up XEM scene mapping for show %s on %s' % (indexer_id, IndexerApi(indexer).name))
 
-            try:
-                parsedJSON = WebSession().get(url).json()
-                if indexer_id not in map(int, parsedJSON['data']):
-                    raise Exception
-            except Exception:
-                for x in sickrage.app.main_db.get_many('tv_episodes', indexer_id):
-                    x['scene_season'], x['scene_episode'], x['scene_absolute_number'] = 0, 0, 0
-                    sickrage.app.main_db.update(x)
-                return
+    # shows refreshed before the mapped flag was stored may still have XEM numbers to clear
+    was_mapped = xemData.get('mapped', True) if xemData else False
+
+    # mark refreshed
+    if not xemData:
+        xemData = {
+            '_t': 'xem_refresh',
+            'indexer': indexer,
+            'indexer_id': indexer_id
+        }
+
+    xemData['last_refreshed'] = int(time.mktime(datetime.datetime.today().timetuple()))
+    xemData['mapped'] = indexer_id in mapped_ids
 
+    if '_id' in xemData:
+        sickrage.app.main_db.update(xemData)
+    else:
+        sickrage.app.main_db.insert(xemData)
+
+    scene_numbers = {}
+
+    try:
+        if indexer_id in mapped_ids:
             # XEM API URL
             url = "http://thexem.de/map/all?id={}&origin={}&destination=scene".format(
                 indexer_id, IndexerApi(indexer).config['xem_origin'])
@@ -530,31 +581,43 @@ def xem_refresh(indexer_id, indexer, force=False):
                     'No XEM data for show "%s on %s"' % (indexer_id, IndexerApi(indexer).name,))
                 return
 
+            origin = IndexerApi(indexer).config['xem_origin']
+
             for entry in parsedJSON['data']:
-                try:
-                    dbData = [x for x in sickrage.app.main_db.get_many('tv_episodes', indexer_id)
-                              if x['season'] == entry[IndexerApi(indexer).config['xem_origin']]['season']
-                              and x['episode'] == entry[IndexerApi(indexer).config['xem_origin']]['episode']][0]
-                except:
+                scene = entry.get('scene_2', entry.get('scene'))  # scene_2 is for doubles
+                if scene:
+                    scene_numbers[(entry[origin]['season'], entry[origin]['episode'])] = (
+                        scene['season'], scene['episode'], scene['absolute'])
+        elif not was_mapped:
+            # nothing to clear for shows that weren't mapped last time either
+            return
+
+        updates = []
+
+        for dbData in sickrage.app.main_db.get_many('tv_episodes', indexer_id):
+            if indexer_id in mapped_ids:
+                if (dbData['season'], dbData['episode']) not in scene_numbers:
                     continue
+                new_numbers = scene_numbers[(dbData['season'], dbData['episode'])]
+            else:
+                new_numbers = (0, 0, 0)
 
-                if 'scene' in entry:
-                    dbData['scene_season'] = entry['scene']['season']
-                    dbData['scene_episode'] = entry['scene']['episode']
-                    dbData['scene_absolute_number'] = entry['scene']['absolute']
-                if 'scene_2' in entry:  # for doubles
-                    dbData['scene_season'] = entry['scene_2']['season']
-                    dbData['scene_episode'] = entry['scene_2']['episode']
-                    dbData['scene_absolute_number'] = entry['scene_2']['absolute']
+            if (dbData['scene_season'], dbData['scene_episode'], dbData['scene_absolute_number']) != new_numbers:
+                dbData['scene_season'], dbData['scene_episode'], dbData['scene_absolute_number'] = new_numbers
+                updates.append(dbData)
 
+        with sickrage.app.main_db.bulk():
+            for dbData in updates:
                 sickrage.app.main_db.update(dbData)
 
-        except Exception as e:
-            sickrage.app.log.warning(
-                "Exception while refreshing XEM data for show {} on {}: {}".format(indexer_id,
-                                                                                   IndexerApi(indexer).name,
-                                                                                   e))
-            sickrage.app.log.debug(traceback.format_exc())
+        if updates:
+            scene_numbering_cache.clear(indexer_id, scene=False)
+    except Exception as e:
+        sickrage.app.log.warning(
+            "Exception while refreshing XEM data for show {} on {}: {}".format(indexer_id,
+                                                                               IndexerApi(indexer).name,
+                                                                               e))
+        sickrage.app.log.debug(traceback.format_exc())
 
 
 def get_absolute_number_from_season_and_episode(show, season, episode):
@@ -570,8 +633,7 @@ def get_absolute_number_from_season_and_episode(show, season, episode):
     absolute_number = None
 
     if season and episode:
-        dbData = [x for x in sickrage.app.main_db.get_many('tv_episodes', show.indexerid)
-                  if x['season'] == season and x['episode'] == episode]
+        dbData = list(sickrage.app.main_db.get_many('tv_episodes_season_episode', (show.indexerid, season, episode)))
 
         if len(dbData) == 1:
             absolute_number = try_int(dbData[0].get("absolute_number"))
@@ -21,8 +21,11 @@ from __future__ import unicode_literals
 
 import re
 import threading
+import time
 from datetime import date, timedelta
 
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+
 import sickrage
 from sickrage.clients import getClientIstance
 from sickrage.clients.nzbget import NZBGet
@@ -305,6 +308,39 @@ def isFirstBestMatch(result):
     return False
 
 
+def search_providers_concurrent(providers, search_func):
+    """
+    Searches providers on a thread pool, results are still handed back in provider order.
+
+    Providers that haven't answered within search_provider_timeout seconds of the searches being started are
+    skipped with empty results.
+
+    :param providers: list of provider objects
+    :param search_func: function searching a single provider and returning its results
+    :return: generator of (provider, results) tuples
+    """
+
+    executor = ThreadPoolExecutor(max_workers=min(sickrage.app.config.search_provider_threads, len(providers)))
+    futures = []
+
+    try:
+        futures = [(providerObj, executor.submit(search_func, providerObj)) for providerObj in providers]
+        deadline = time.time() + sickrage.app.config.search_provider_timeout
+
+        for providerObj, future in futures:
+            try:
+                yield providerObj, future.result(timeout=max(deadline - time.time(), 0))
+            except TimeoutError:
+                sickrage.app.log.warning("Timed out waiting for search results from " + providerObj.name)
+                future.cancel()
+                yield providerObj, {}
+    finally:
+        # cancel pending searches if we stopped early, running searches are left to finish on their own
+        for __, future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
 def searchProviders(show, episodes, manualSearch=False, downCurQuality=False, cacheOnly=False):
     """
     Walk providers for information on shows
@@ -321,11 +357,81 @@ def searchProviders(show, episodes, manualSearch=False, downCurQuality=False, ca
 
     origThreadName = threading.currentThread().getName()
 
-    def perform_searches():
+    def search_provider(providerObj):
+        found_results = {}
         search_results = {}
+
+        search_count = 0
+        search_mode = providerObj.search_mode
+
+        # Always search for episode when manually searching when in sponly
+        if search_mode == 'sponly' and manualSearch == True:
+            search_mode = 'eponly'
+
+        threadName = threading.currentThread().getName()
+
+        while True:
+            search_count += 1
+
+            try:
+                threading.currentThread().setName(origThreadName + "::[" + providerObj.name + "]")
+
+                if len(episodes):
+                    if search_mode == 'eponly':
+                        sickrage.app.log.info("Performing episode search for " + show.name)
+                    else:
+                        sickrage.app.log.info("Performing season pack search for " + show.name)
+
+                # search provider for episodes
+                search_results = providerObj.findSearchResults(show,
+                                                               episodes,
+                                                               search_mode,
+                                                               manualSearch,
+                                                               downCurQuality,
+                                                               cacheOnly)
+            except AuthException as e:
+                sickrage.app.log.warning("Authentication error: {}".format(e))
+                break
+            except Exception as e:
+                sickrage.app.log.error("Error while searching " + providerObj.name + ", skipping: {}".format(e))
+                break
+            finally:
+                threading.currentThread().setName(threadName)
+
+            if len(search_results):
+                # make a list of all the results for this provider
+                for curEp in search_results:
+                    if curEp in found_results:
+                        found_results[curEp] += search_results[curEp]
+                    else:
+                        found_results[curEp] = search_results[curEp]
+
+                    # Sort results by seeders if available
+                    if providerObj.type == 'torrent' or getattr(providerObj, 'torznab', False):
+                        found_results[curEp].sort(key=lambda k: int(k.seeders), reverse=True)
+
+                break
+            elif not providerObj.search_fallback or search_count == 2:
+                break
+
+            if search_mode == 'sponly':
+                sickrage.app.log.debug("Fallback episode search initiated")
+                search_mode = 'eponly'
+            else:
+                sickrage.app.log.debug("Fallback season pack search initiate")
+                search_mode = 'sponly'
+
+        return found_results
+
+    def search_providers_sequential(providers):
+        for providerObj in providers:
+            yield providerObj, search_provider(providerObj)
+
+    def perform_searches():
         found_results = {}
         final_results = []
 
+        providers = []
         for providerID, providerObj in sickrage.app.search_providers.sort(
                 randomize=sickrage.app.config.randomize_providers).items():
 
@@ -344,65 +450,15 @@ def searchProviders(show, episodes, manualSearch=False, downCurQuality=False, ca
                 sickrage.app.log.debug("" + str(show.name) + " is not an anime, skiping")
                 continue
 
-            found_results[providerObj.name] = {}
+            providers.append(providerObj)
 
-            search_count = 0
-            search_mode = providerObj.search_mode
-
-            # Always search for episode when manually searching when in sponly
-            if search_mode == 'sponly' and manualSearch == True:
-                search_mode = 'eponly'
-
-            while True:
-                search_count += 1
-
-                try:
-                    threading.currentThread().setName(origThreadName + "::[" + providerObj.name + "]")
-
-                    if len(episodes):
-                        if search_mode == 'eponly':
-                            sickrage.app.log.info("Performing episode search for " + show.name)
-                        else:
-                            sickrage.app.log.info("Performing season pack search for " + show.name)
-
-                    # search provider for episodes
-                    search_results = providerObj.findSearchResults(show,
-                                                                   episodes,
-                                                                   search_mode,
-                                                                   manualSearch,
-                                                                   downCurQuality,
-                                                                   cacheOnly)
-                except AuthException as e:
-                    sickrage.app.log.warning("Authentication error: {}".format(e))
-                    break
-                except Exception as e:
-                    sickrage.app.log.error("Error while searching " + providerObj.name + ", skipping: {}".format(e))
-                    break
-                finally:
-                    threading.currentThread().setName(origThreadName)
-
-                if len(search_results):
-                    # make a list of all the results for this provider
-                    for curEp in search_results:
-                        if curEp in found_results:
-                            found_results[providerObj.name][curEp] += search_results[curEp]
-                        else:
-                            found_results[providerObj.name][curEp] = search_results[curEp]
-
-                        # Sort results by seeders if available
-                        if providerObj.type == 'torrent' or getattr(providerObj, 'torznab', False):
-                            found_results[providerObj.name][curEp].sort(key=lambda k: int(k.seeders), reverse=True)
-
-                    break
-                elif not providerObj.search_fallback or search_count == 2:
-                    break
+        if sickrage.app.config.search_provider_threads > 1 and len(providers) > 1:
+            provider_results = search_providers_concurrent(providers, search_provider)
+        else:
+            provider_results = search_providers_sequential(providers)
 
-                if search_mode == 'sponly':
-                    sickrage.app.log.debug("Fallback episode search initiated")
-                    search_mode = 'eponly'
-                else:
-                    sickrage.app.log.debug("Fallback season pack search initiate")
-                    search_mode = 'sponly'
+        for providerObj, provider_found_results in provider_results:
+            found_results[providerObj.name] = provider_found_results
 
             # skip to next provider if we have no results to process
             if not len(found_results[providerObj.name]):
@@ -31,14 +31,16 @@ def new_episode_finder():
     curDate += datetime.timedelta(days=1)
     curTime = datetime.datetime.now(sickrage.app.tz)
 
-    show = None
+    shows = {}
 
-    for episode in sickrage.app.main_db.all('tv_episodes'):
-        if not all([episode['status'] == UNAIRED, episode['season'] > 0, episode['airdate'] > 1]):
+    # search delays only push air dates back, so nothing airing after tomorrow can qualify
+    for episode in sickrage.app.main_db.get_episodes_by_status([UNAIRED], start=2, end=curDate.toordinal() + 1):
+        if not all([episode['status'] == UNAIRED, episode['season'] > 0]):
             continue
 
-        if not show or int(episode["showid"]) != show.indexerid:
-            show = helpers.findCertainShow(int(episode["showid"]))
+        if int(episode["showid"]) not in shows:
+            shows[int(episode["showid"])] = helpers.findCertainShow(int(episode["showid"]))
+        show = shows[int(episode["showid"])]
 
         # for when there is orphaned series in the database but not loaded into our showlist
         if not show or show.paused:
@@ -89,6 +89,12 @@ class BacklogSearcher(object):
         # find new released episodes and update their statuses
         new_episode_finder()
 
+        # episodes that could be wanted, grouped by show
+        episodes = {}
+        for dbData in sickrage.app.main_db.get_episodes_by_status([WANTED, DOWNLOADED, SNATCHED, SNATCHED_PROPER],
+                                                                  start=from_date.toordinal(), end=cur_date):
+            episodes.setdefault(dbData['showid'], []).append(dbData)
+
         # go through non air-by-date shows and see if they need any episodes
         for curShow in show_list:
             if curShow.paused:
@@ -97,7 +103,7 @@ class BacklogSearcher(object):
 
             self._last_backlog_search = self._get_last_backlog_search(curShow.indexerid)
 
-            segments = self._get_segments(curShow, from_date)
+            segments = self._get_segments(curShow, from_date, episodes.get(curShow.indexerid, []))
             if segments:
                 sickrage.app.search_queue.put(BacklogQueueItem(curShow, segments))
             else:
@@ -111,14 +117,20 @@ class BacklogSearcher(object):
         self.amActive = False
 
     @staticmethod
-    def _get_segments(show, from_date):
+    def _get_segments(show, from_date, episodes=None):
         anyQualities, bestQualities = Quality.splitQuality(show.quality)
 
+        if episodes is None:
+            episodes = sickrage.app.main_db.get_episodes_by_status([WANTED, DOWNLOADED, SNATCHED, SNATCHED_PROPER],
+                                                                   start=from_date.toordinal(),
+                                                                   end=datetime.date.today().toordinal(),
+                                                                   showid=show.indexerid)
+
         sickrage.app.log.debug("Seeing if we need anything from {}".format(show.name))
 
         # check through the list of statuses to see if we want any
         wanted = []
-        for result in (x for x in sickrage.app.main_db.get_many('tv_episodes', show.indexerid) if
+        for result in (x for x in episodes if
                        x['season'] > 0 and datetime.date.today().toordinal() > x['airdate'] >= from_date.toordinal()):
 
             curStatus, curQuality = Quality.splitCompositeStatus(int(result["status"] or -1))
@@ -50,12 +50,18 @@ class DailySearcher(object):
         # find new released episodes and update their statuses
         new_episode_finder()
 
+        # episodes that could be wanted, grouped by show
+        episodes = {}
+        for dbData in sickrage.app.main_db.get_episodes_by_status([WANTED, DOWNLOADED, SNATCHED, SNATCHED_PROPER],
+                                                                  start=datetime.date.today().toordinal()):
+            episodes.setdefault(dbData['showid'], []).append(dbData)
+
         for curShow in sickrage.app.showlist:
             if curShow.paused:
                 sickrage.app.log.debug("Skipping search for {} because the show is paused".format(curShow.name))
                 continue
 
-            segments = self._get_segments(curShow, datetime.date.today())
+            segments = self._get_segments(curShow, datetime.date.today(), episodes.get(curShow.indexerid, []))
             if segments:
                 sickrage.app.search_queue.put(DailySearchQueueItem(curShow, segments))
             else:
@@ -64,14 +70,19 @@ class DailySearcher(object):
         self.amActive = False
 
     @staticmethod
-    def _get_segments(show, fromDate):
+    def _get_segments(show, fromDate, episodes=None):
         """
         Get a list of episodes that we want to download
         :param show: Show these episodes are from
         :param fromDate: Search from a certain date
+        :param episodes: episode database records to check, defaults to the show's episodes with a searchable status
         :return: list of wanted episodes
         """
 
+        if episodes is None:
+            episodes = sickrage.app.main_db.get_episodes_by_status([WANTED, DOWNLOADED, SNATCHED, SNATCHED_PROPER],
+                                                                   start=fromDate.toordinal(), showid=show.indexerid)
+
         wanted = []
 
         anyQualities, bestQualities = Quality.splitQuality(show.quality)
@@ -80,7 +91,7 @@ class DailySearcher(object):
         sickrage.app.log.debug("Seeing if we need anything from {}".format(show.name))
 
         # check through the list of statuses to see if we want any
-        for dbData in sickrage.app.main_db.get_many('tv_episodes', show.indexerid):
+        for dbData in episodes:
             if dbData['season'] > 0 and dbData['airdate'] >= fromDate.toordinal():
                 curStatus, curQuality = Quality.splitCompositeStatus(int(dbData["status"] or -1))
 
@@ -24,7 +24,7 @@ import threading
 
 import sickrage
 import sickrage.subtitles
-from sickrage.core.common import dateTimeFormat
+from sickrage.core.common import dateTimeFormat, DOWNLOADED
 from sickrage.core.helpers import findCertainShow
 
 
@@ -64,16 +64,19 @@ class SubtitleSearcher(object):
 
         today = datetime.date.today().toordinal()
 
+        # only downloaded episodes of shows with subtitles enabled can qualify
+        shows = dict((s.indexerid, s) for s in sickrage.app.showlist if s.subtitles == 1)
+
         results = []
-        for s in sickrage.app.showlist:
-            for e in (e for e in sickrage.app.main_db.get_many('tv_episodes', s.indexerid)
-                      if s.subtitles == 1
+        if shows:
+            for e in (e for e in sickrage.app.main_db.get_episodes_by_status([DOWNLOADED])
+                      if e['showid'] in shows
                          and e['location'] != ''
                          and e['subtitles'] not in sickrage.subtitles.wanted_languages()
                          and (e['subtitles_searchcount'] <= 2 or (
                         e['subtitles_searchcount'] <= 7 and (today - e['airdate'])))):
                 results += [{
-                    'show_name': s.name,
+                    'show_name': shows[e['showid']].name,
                     'showid': e['showid'],
                     'season': e['season'],
                     'episode': e['episode'],
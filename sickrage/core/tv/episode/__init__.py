@@ -35,7 +35,9 @@ from sickrage.core.helpers import is_media_file, try_int, replaceExtension, \
     safe_getattr, make_dirs, move_file, delete_empty_folders
 from sickrage.core.nameparser import NameParser, InvalidNameException, InvalidShowException
 from sickrage.core.processors.post_processor import PostProcessor
-from sickrage.core.scene_numbering import get_scene_absolute_numbering, get_scene_numbering
+from sickrage.core.scene_numbering import get_scene_absolute_numbering, get_scene_numbering, \
+    scene_numbering_cache
+from sickrage.core.tv.show.coming_episodes import ComingEpisodes
 from sickrage.indexers import IndexerApi
 from sickrage.indexers.exceptions import indexer_seasonnotfound, indexer_error, indexer_episodenotfound
 from sickrage.notifiers import Notifiers
@@ -406,8 +408,8 @@ class TVEpisode(object):
         sickrage.app.log.debug("%s: Loading episode details from DB for episode %s S%02dE%02d" % (
             self.show.indexerid, self.show.name, season or 0, episode or 0))
 
-        dbData = [x for x in sickrage.app.main_db.get_many('tv_episodes', self.show.indexerid)
-                  if x['season'] == season and x['episode'] == episode]
+        dbData = list(sickrage.app.main_db.get_many('tv_episodes_season_episode',
+                                                    (self.show.indexerid, season, episode)))
 
         if len(dbData) > 1:
             for ep in dbData:
@@ -742,9 +744,14 @@ class TVEpisode(object):
         # delete myself from the DB
         sickrage.app.log.debug("Deleting myself from the database")
 
-        [sickrage.app.main_db.delete(x) for x in
-         sickrage.app.main_db.get_many('tv_episodes', self.show.indexerid)
-         if x['season'] == self.season and x['episode'] == self.episode]
+        with sickrage.app.show_stats_cache.lock:
+            for x in sickrage.app.main_db.get_many('tv_episodes_season_episode',
+                                                   (self.show.indexerid, self.season, self.episode)):
+                sickrage.app.main_db.delete(x)
+                sickrage.app.show_stats_cache.update_episode(self.show.indexerid, x)
+                ComingEpisodes.episode_changed(x)
+
+        scene_numbering_cache.clear(self.show.indexerid, scene=False)
 
         data = sickrage.app.notifier_providers['trakt'].trakt_episode_data_generate([(self.season, self.episode)])
         if sickrage.app.config.use_trakt and sickrage.app.config.trakt_sync_watchlist and data:
@@ -801,13 +808,25 @@ class TVEpisode(object):
             "release_group": self.release_group
         }
 
-        for x in sickrage.app.main_db.get_many('tv_episodes', self.show.indexerid):
-            if x['indexerid'] == self.indexerid:
-                x.update(tv_episode)
-                sickrage.app.main_db.update(x)
-                break
-        else:
-            sickrage.app.main_db.insert(tv_episode)
+        # the show stats lock keeps the show stats in step with the database
+        with sickrage.app.show_stats_cache.lock:
+            for x in sickrage.app.main_db.get_many('tv_episodes', self.show.indexerid):
+                if x['indexerid'] == self.indexerid:
+                    old_data = x.copy()
+                    x.update(tv_episode)
+                    sickrage.app.main_db.update(x)
+                    break
+            else:
+                old_data = None
+                sickrage.app.main_db.insert(tv_episode)
+
+            sickrage.app.show_stats_cache.update_episode(self.show.indexerid, old_data, tv_episode)
+            ComingEpisodes.episode_changed(old_data, tv_episode)
+
+        # the XEM numbering map of the show is read from the scene numbers of its episodes
+        if not old_data or any(old_data.get(k) != tv_episode[k] for k in
+                               ['scene_season', 'scene_episode', 'scene_absolute_number']):
+            scene_numbering_cache.clear(self.show.indexerid, scene=False)
 
     def fullPath(self):
         if self.location is None or self.location == "":
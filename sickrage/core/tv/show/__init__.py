@@ -41,14 +41,15 @@ from sickrage.core.common import Quality, SKIPPED, WANTED, UNKNOWN, DOWNLOADED,
 from sickrage.core.exceptions import ShowNotFoundException, \
     EpisodeNotFoundException, EpisodeDeletedException, MultipleShowsInDatabaseException, MultipleShowObjectsException
 from sickrage.core.helpers import list_media_files, is_media_file, try_int, safe_getattr, findCertainShow
-from sickrage.core.nameparser import NameParser, InvalidNameException, InvalidShowException
+from sickrage.core.nameparser import NameParser, InvalidNameException, InvalidShowException, name_parser_cache
+from sickrage.core.scene_numbering import scene_numbering_cache
 from sickrage.indexers import IndexerApi
 from sickrage.indexers.config import INDEXER_TVRAGE
 from sickrage.indexers.exceptions import indexer_attributenotfound
 
 
 class TVShow(object):
-    def __init__(self, indexer, indexerid, lang=""):
+    def __init__(self, indexer, indexerid, lang="", dbData=None, skipNFO=False):
         self.lock = threading.Lock()
 
         self._indexerid = int(indexerid)
@@ -93,7 +94,7 @@ class TVShow(object):
         if findCertainShow(self.indexerid) is not None:
             raise MultipleShowObjectsException("Can't create a show if it already exists")
 
-        self.load_from_db()
+        self.load_from_db(skipNFO=skipNFO, dbData=dbData)
 
     @property
     def name(self):
@@ -104,6 +105,7 @@ class TVShow(object):
         if self._name != value:
             self.dirty = True
         self._name = value
+        sickrage.app.showlist.update_show(self)
 
     @property
     def indexerid(self):
@@ -114,6 +116,7 @@ class TVShow(object):
         if self._indexerid != value:
             self.dirty = True
         self._indexerid = value
+        sickrage.app.showlist.update_show(self)
 
     @property
     def indexer(self):
@@ -511,8 +514,9 @@ class TVShow(object):
     def get_episode(self, season=None, episode=None, file=None, noCreate=False, absolute_number=None):
         # if we get an anime get the real season and episode
         if self.is_anime and all([absolute_number is not None, season is None, episode is None]):
-            dbData = [x for x in sickrage.app.main_db.get_many('tv_episodes', self.indexerid)
-                      if x['absolute_number'] == absolute_number and x['season'] != 0]
+            dbData = [x for x in sickrage.app.main_db.get_many('tv_episodes_absolute_number',
+                                                               (self.indexerid, absolute_number))
+                      if x['season'] != 0]
 
             if len(dbData) == 1:
                 episode = int(dbData[0]["episode"])
@@ -901,10 +905,14 @@ class TVShow(object):
 
         return rootEp
 
-    def load_from_db(self, skipNFO=False):
+    def load_from_db(self, skipNFO=False, dbData=None):
         sickrage.app.log.debug(str(self.indexerid) + ": Loading show info from database")
 
-        dbData = [x for x in sickrage.app.main_db.get_many('tv_shows', self.indexerid)]
+        if dbData is not None:
+            # show record already read by the caller
+            dbData = [dbData]
+        else:
+            dbData = [x for x in sickrage.app.main_db.get_many('tv_shows', self.indexerid)]
 
         if len(dbData) > 1:
             raise MultipleShowsInDatabaseException()
@@ -947,8 +955,11 @@ class TVShow(object):
             self.release_groups = BlackAndWhiteList(self.indexerid)
 
         if not skipNFO:
-            # Get IMDb_info from database
-            self._imdb_info = sickrage.app.main_db.get('imdb_info', self.indexerid)
+            self.load_imdb_info_from_db()
+
+    def load_imdb_info_from_db(self):
+        # Get IMDb_info from database
+        self._imdb_info = sickrage.app.main_db.get('imdb_info', self.indexerid)
 
     def load_from_indexer(self, cache=True, tvapi=None):
 
@@ -1073,7 +1084,17 @@ class TVShow(object):
             sickrage.app.main_db.delete(x)
 
         # remove self from show list
-        sickrage.app.showlist = [x for x in sickrage.app.showlist if int(x.indexerid) != self.indexerid]
+        for x in sickrage.app.showlist.find_by_indexerid(self.indexerid):
+            sickrage.app.showlist.remove(x)
+
+        # remove cached parse results for this show
+        name_parser_cache.clear(self.indexerid)
+
+        # remove episode statistics for this show
+        sickrage.app.show_stats_cache.remove(self.indexerid)
+
+        # remove scene numbering maps for this show
+        scene_numbering_cache.clear(self.indexerid)
 
         # clear the cache
         image_cache_dir = os.path.join(sickrage.app.cache_dir, 'images')
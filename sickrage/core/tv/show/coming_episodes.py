@@ -39,9 +39,25 @@ class ComingEpisodes:
         'show': (lambda a, b: cmp((a['show_name'], a['localtime']), (b['show_name'], b['localtime']))),
     }
 
+    # rendered iCal feed, replaced once an episode shown in it changes
+    ical_cache = None
+    ical_version = 0
+
     def __init__(self):
         pass
 
+    @staticmethod
+    def episode_changed(old=None, new=None):
+        """
+        Invalidates the cached iCal feed when an episode's airdate, status or details change
+
+        :param old: episode database record before the change, None for new episodes
+        :param new: episode database record after the change, None for deleted episodes
+        """
+
+        if not old or not new or any(old.get(k) != new.get(k) for k in ['status', 'airdate', 'name', 'description']):
+            ComingEpisodes.ical_version += 1
+
     @staticmethod
     def get_coming_episodes(categories, sort, group, paused=False):
         """
@@ -94,20 +110,30 @@ class ComingEpisodes:
                          Quality.ARCHIVED + \
                          Quality.IGNORED
 
+        shows = {s.indexerid: s for s in sickrage.app.showlist}
+
         results = []
-        for s in sickrage.app.showlist:
-            for e in sickrage.app.main_db.get_many('tv_episodes', s.indexerid):
-                if e['season'] != 0 and today <= e['airdate'] < next_week and e['status'] not in qualities_list:
-                    results += result(s, e)
-
-                if e['season'] != 0 and e['showid'] not in [int(r['showid']) for r in results] \
-                        and e['airdate'] >= next_week and e['status'] \
-                        not in Quality.DOWNLOADED + Quality.SNATCHED + Quality.SNATCHED_BEST + Quality.SNATCHED_PROPER:
-                    results += result(s, e)
-
-                if e['season'] != 0 and today > e['airdate'] >= recently \
-                        and e['status'] in [WANTED, UNAIRED] and e['status'] not in qualities_list:
-                    results += result(s, e)
+        later_shows = set()
+
+        # episodes come back ordered by airdate, so a show's missed and soon episodes are seen before its later ones
+        for e in sickrage.app.main_db.get_episodes_by_airdate(recently):
+            s = shows.get(int(e['showid']))
+            if not s or e['season'] == 0:
+                continue
+
+            if today <= e['airdate'] < next_week and e['status'] not in qualities_list:
+                results += result(s, e)
+                later_shows.add(s.indexerid)
+
+            if s.indexerid not in later_shows and e['airdate'] >= next_week and e['status'] \
+                    not in Quality.DOWNLOADED + Quality.SNATCHED + Quality.SNATCHED_BEST + Quality.SNATCHED_PROPER:
+                results += result(s, e)
+                later_shows.add(s.indexerid)
+
+            if today > e['airdate'] >= recently \
+                    and e['status'] in [WANTED, UNAIRED] and e['status'] not in qualities_list:
+                results += result(s, e)
+                later_shows.add(s.indexerid)
 
         for index, item in enumerate(results):
             results[index]['localtime'] = srDateTime(
@@ -92,8 +92,9 @@ class History:
         """
 
         date = (datetime.today() - timedelta(days=30)).strftime(History.date_format)
-        for dbData in (x for x in sickrage.app.main_db.all('history') if x['date'] < date):
-            sickrage.app.main_db.delete(dbData)
+        with sickrage.app.main_db.bulk():
+            for dbData in [x for x in sickrage.app.main_db.all('history') if x['date'] < date]:
+                sickrage.app.main_db.delete(dbData)
 
     @staticmethod
     def _logHistoryItem(action, showid, season, episode, quality, resource, provider, version=-1):
@@ -394,8 +395,9 @@ class FailedHistory(object):
     def trimHistory():
         """Trims history table to 1 month of history from today"""
         date = str((datetime.today() - timedelta(days=30)).strftime(History.date_format))
-        for dbData in (x for x in sickrage.app.main_db.all('failed_snatch_history') if x['date'] < date):
-            sickrage.app.main_db.delete(dbData)
+        with sickrage.app.main_db.bulk():
+            for dbData in [x for x in sickrage.app.main_db.all('failed_snatch_history') if x['date'] < date]:
+                sickrage.app.main_db.delete(dbData)
 
     @staticmethod
     def findFailedRelease(epObj):
@@ -19,6 +19,7 @@
 from __future__ import unicode_literals
 
 import datetime
+import threading
 
 import sickrage
 from sickrage.core.websocket import WebSocketMessage
@@ -133,24 +134,27 @@ class ProgressIndicator:
 class ProgressIndicators():
     _pi = {'massUpdate': [],
            'massAdd': [],
-           'dailyShowUpdates': []}
+           'dailyShowUpdates': [],
+           'fileTransfers': []}
+    _lock = threading.Lock()
 
     @staticmethod
     def getIndicator(name):
         if name not in ProgressIndicators._pi:
             return []
 
-        # if any of the progress indicators are done take them off the list
-        for curPI in ProgressIndicators._pi[name]:
-            if curPI is not None and curPI.percentComplete() == 100:
-                ProgressIndicators._pi[name].remove(curPI)
+        with ProgressIndicators._lock:
+            # if any of the progress indicators are done take them off the list
+            ProgressIndicators._pi[name] = [x for x in ProgressIndicators._pi[name] if
+                                            x is None or x.percentComplete() != 100]
 
-        # return the list of progress indicators associated with this name
-        return ProgressIndicators._pi[name]
+            # return the list of progress indicators associated with this name
+            return list(ProgressIndicators._pi[name])
 
     @staticmethod
     def setIndicator(name, indicator):
-        ProgressIndicators._pi[name].append(indicator)
+        with ProgressIndicators._lock:
+            ProgressIndicators._pi[name].append(indicator)
 
 
 class QueueProgressIndicator():
@@ -172,7 +176,7 @@ class QueueProgressIndicator():
         return len([x for x in self.queueItemList if x.is_in_queue()])
 
     def nextName(self):
-        for curItem in [sickrage.app.show_queue.current_item] + sickrage.app.show_queue.queue:
+        for curItem in sickrage.app.show_queue.current_items + [x for __, __, x in sickrage.app.show_queue.queue]:
             if curItem in self.queueItemList:
                 return curItem.name
 
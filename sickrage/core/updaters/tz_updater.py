@@ -27,7 +27,7 @@ from dateutil import tz
 
 import sickrage
 from sickrage.core.helpers import try_int
-from sickrage.core.helpers.encoding import ss
+from sickrage.core.helpers.encoding import ss, to_unicode
 from sickrage.core.websession import WebSession
 
 
@@ -37,6 +37,16 @@ class TimeZoneUpdater(object):
         self.time_regex = re.compile(r'(?P<hour>\d{1,2})(?:[:.]?(?P<minute>\d{2})?)? ?(?P<meridiem>[PA]\.? ?M?)?\b',
                                      re.I)
 
+        # network name -> tzinfo, replaced as a whole whenever the network timezones are updated
+        self.network_timezones = None
+
+        # bumped each time the network timezones are loaded, so output built from them can tell it is outdated
+        self.network_timezones_version = 0
+
+        # show air time string -> (hour, minute)
+        self.air_times = {}
+        self.air_times_max_size = 1000
+
     def run(self):
         # set thread name
         threading.currentThread().setName(self.name)
@@ -82,6 +92,21 @@ class TimeZoneUpdater(object):
         # cleanup
         del network_timezones
 
+        self.load_network_timezones()
+
+    def load_network_timezones(self):
+        """Load the network timezones from the cache database into memory"""
+
+        network_timezones = {}
+
+        for x in sickrage.app.cache_db.all('network_timezones'):
+            network_tz = tz.gettz(x['timezone'])
+            if network_tz:
+                network_timezones[to_unicode(x['network_name'])] = network_tz
+
+        self.network_timezones = network_timezones
+        self.network_timezones_version += 1
+
     # get timezone of a network or return default timezone
     def get_network_timezone(self, network):
         """
@@ -93,23 +118,25 @@ class TimeZoneUpdater(object):
         if network is None:
             return sickrage.app.tz
 
-        try:
-            return tz.gettz(sickrage.app.cache_db.get('network_timezones', network)['timezone'])
-        except Exception:
-            return sickrage.app.tz
+        if self.network_timezones is None:
+            self.load_network_timezones()
 
-    # parse date and time string into local time
-    def parse_date_time(self, d, t, network):
+        return self.network_timezones.get(network, sickrage.app.tz)
+
+    def parse_air_time(self, t):
         """
-        Parse date and time string into local time
-        :param d: date string
+        Parse a show air time string into hours and minutes
+
         :param t: time string
-        :param network: network to use as base
-        :return: datetime object containing local time
+        :return: tuple of hour and minute
         """
 
+        try:
+            return self.air_times[t]
+        except KeyError:
+            pass
+
         parsed_time = self.time_regex.search(t)
-        network_tz = self.get_network_timezone(network)
 
         hr = 0
         m = 0
@@ -129,6 +156,27 @@ class TimeZoneUpdater(object):
             hr = hr if 0 <= hr <= 23 else 0
             m = m if 0 <= m <= 59 else 0
 
+        # shows share a handful of air times, so this only fills up with bad input
+        if len(self.air_times) >= self.air_times_max_size:
+            self.air_times.clear()
+
+        self.air_times[t] = (hr, m)
+
+        return hr, m
+
+    # parse date and time string into local time
+    def parse_date_time(self, d, t, network):
+        """
+        Parse date and time string into local time
+        :param d: date string
+        :param t: time string
+        :param network: network to use as base
+        :return: datetime object containing local time
+        """
+
+        hr, m = self.parse_air_time(t)
+        network_tz = self.get_network_timezone(network)
+
         result = datetime.fromordinal(max(try_int(d), 1))
 
         return result.replace(hour=hr, minute=m, tzinfo=network_tz)
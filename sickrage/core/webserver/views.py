@@ -74,6 +74,7 @@ from sickrage.core.traktapi import srTraktAPI
 from sickrage.core.tv.episode import TVEpisode
 from sickrage.core.tv.show.coming_episodes import ComingEpisodes
 from sickrage.core.tv.show.history import History as HistoryTool
+from sickrage.core.ui import ProgressIndicators
 from sickrage.core.webserver import ApiHandler
 from sickrage.core.webserver.routes import Route
 from sickrage.indexers import IndexerApi
@@ -346,6 +347,22 @@ class CalendarHandler(BaseHandler):
 
         sickrage.app.log.info("Receiving iCal request from %s" % self.request.remote_ip)
 
+        # Limit dates
+        past_date = (datetime.date.today() + datetime.timedelta(weeks=-52)).toordinal()
+        future_date = (datetime.date.today() + datetime.timedelta(weeks=52)).toordinal()
+
+        # Get all the shows that are not paused and are currently on air (from kjoconnor Fork)
+        shows = {x.indexerid: x for x in sickrage.app.showlist if
+                 x.status.lower() in ['continuing', 'returning series'] and x.paused != 1}
+
+        # the feed is rebuilt once an episode changes, the day changes, the network timezones are refreshed or a
+        # show in it changes
+        cache_key = (ComingEpisodes.ical_version, sickrage.app.tz_updater.network_timezones_version,
+                     datetime.date.today(), sickrage.app.config.calendar_icons,
+                     sorted((x.indexerid, x.name, x.airs, x.network, x.runtime) for x in shows.values()))
+        if ComingEpisodes.ical_cache and ComingEpisodes.ical_cache[0] == cache_key:
+            return ComingEpisodes.ical_cache[1]
+
         # Create a iCal string
         ical = 'BEGIN:VCALENDAR\r\n'
         ical += 'VERSION:2.0\r\n'
@@ -353,48 +370,45 @@ class CalendarHandler(BaseHandler):
         ical += 'X-WR-CALDESC:SiCKRAGE\r\n'
         ical += 'PRODID://SiCKRAGE Upcoming Episodes//\r\n'
 
-        # Limit dates
-        past_date = (datetime.date.today() + datetime.timedelta(weeks=-52)).toordinal()
-        future_date = (datetime.date.today() + datetime.timedelta(weeks=52)).toordinal()
+        for episode in sickrage.app.main_db.get_episodes_by_airdate(past_date, future_date):
+            show = shows.get(int(episode['showid']))
+            if not show:
+                continue
 
-        # Get all the shows that are not paused and are currently on air (from kjoconnor Fork)
-        for show in [x for x in sickrage.app.showlist if
-                     x.status.lower() in ['continuing', 'returning series'] and x.paused != 1]:
-            for episode in (x for x in sickrage.app.main_db.get_many('tv_episodes', int(show.indexerid))
-                            if past_date <= x['airdate'] < future_date):
-
-                air_date_time = sickrage.app.tz_updater.parse_date_time(episode['airdate'], show.airs,
-                                                                        show.network).astimezone(utc)
-                air_date_time_end = air_date_time + datetime.timedelta(minutes=try_int(show.runtime, 60))
-
-                # Create event for episode
-                ical += 'BEGIN:VEVENT\r\n'
-                ical += 'DTSTART:' + air_date_time.strftime("%Y%m%d") + 'T' + air_date_time.strftime("%H%M%S") + 'Z\r\n'
-                ical += 'DTEND:' + air_date_time_end.strftime("%Y%m%d") + 'T' + air_date_time_end.strftime(
-                    "%H%M%S") + 'Z\r\n'
-                if sickrage.app.config.calendar_icons:
-                    ical += 'X-GOOGLE-CALENDAR-CONTENT-ICON:https://www.sickrage.ca/favicon.ico\r\n'
-                    ical += 'X-GOOGLE-CALENDAR-CONTENT-DISPLAY:CHIP\r\n'
-                ical += 'SUMMARY: {0} - {1}x{2} - {3}\r\n'.format(
-                    show.name, episode['season'], episode['episode'], episode['name']
-                )
-                ical += 'UID:SiCKRAGE-' + str(datetime.date.today().isoformat()) + '-' + \
-                        show.name.replace(" ", "-") + '-E' + str(episode['episode']) + \
-                        'S' + str(episode['season']) + '\r\n'
-                if episode['description']:
-                    ical += 'DESCRIPTION: {0} on {1} \\n\\n {2}\r\n'.format(
-                        (show.airs or '(Unknown airs)'),
-                        (show.network or 'Unknown network'),
-                        episode['description'].splitlines()[0])
-                else:
-                    ical += 'DESCRIPTION:' + (show.airs or '(Unknown airs)') + ' on ' + (
-                            show.network or 'Unknown network') + '\r\n'
+            air_date_time = sickrage.app.tz_updater.parse_date_time(episode['airdate'], show.airs,
+                                                                    show.network).astimezone(utc)
+            air_date_time_end = air_date_time + datetime.timedelta(minutes=try_int(show.runtime, 60))
+
+            # Create event for episode
+            ical += 'BEGIN:VEVENT\r\n'
+            ical += 'DTSTART:' + air_date_time.strftime("%Y%m%d") + 'T' + air_date_time.strftime("%H%M%S") + 'Z\r\n'
+            ical += 'DTEND:' + air_date_time_end.strftime("%Y%m%d") + 'T' + air_date_time_end.strftime(
+                "%H%M%S") + 'Z\r\n'
+            if sickrage.app.config.calendar_icons:
+                ical += 'X-GOOGLE-CALENDAR-CONTENT-ICON:https://www.sickrage.ca/favicon.ico\r\n'
+                ical += 'X-GOOGLE-CALENDAR-CONTENT-DISPLAY:CHIP\r\n'
+            ical += 'SUMMARY: {0} - {1}x{2} - {3}\r\n'.format(
+                show.name, episode['season'], episode['episode'], episode['name']
+            )
+            ical += 'UID:SiCKRAGE-' + str(datetime.date.today().isoformat()) + '-' + \
+                    show.name.replace(" ", "-") + '-E' + str(episode['episode']) + \
+                    'S' + str(episode['season']) + '\r\n'
+            if episode['description']:
+                ical += 'DESCRIPTION: {0} on {1} \\n\\n {2}\r\n'.format(
+                    (show.airs or '(Unknown airs)'),
+                    (show.network or 'Unknown network'),
+                    episode['description'].splitlines()[0])
+            else:
+                ical += 'DESCRIPTION:' + (show.airs or '(Unknown airs)') + ' on ' + (
+                        show.network or 'Unknown network') + '\r\n'
 
-                ical += 'END:VEVENT\r\n'
+            ical += 'END:VEVENT\r\n'
 
         # Ending the iCal
         ical += 'END:VCALENDAR'
 
+        ComingEpisodes.ical_cache = (cache_key, ical)
+
         return ical
 
 
@@ -560,8 +574,8 @@ class WebRoot(WebHandler):
         return self.redirect('/logout/')
 
     def quicksearch_json(self, term):
-        shows = sickrage.app.quicksearch_cache.get_shows(term)
-        episodes = sickrage.app.quicksearch_cache.get_episodes(term)
+        shows = sickrage.app.quicksearch_cache.get_shows(term, limit=25)
+        episodes = sickrage.app.quicksearch_cache.get_episodes(term, limit=25)
 
         if not len(shows):
             shows = [{
@@ -2059,13 +2073,11 @@ class Home(WebHandler):
             episodes += getEpisodes(searchThread, searchstatus)
 
         # Running Searches
-        searchstatus = 'searching'
-        if sickrage.app.search_queue.is_manualsearch_in_progress():
-            searchThread = sickrage.app.search_queue.current_item
-
-            if searchThread.success:
-                searchstatus = 'finished'
+        for searchThread in sickrage.app.search_queue.current_items:
+            if not isinstance(searchThread, (ManualSearchQueueItem, FailedQueueItem)):
+                continue
 
+            searchstatus = 'finished' if searchThread.success else 'searching'
             episodes += getEpisodes(searchThread, searchstatus)
 
         # Finished Searches
@@ -3513,9 +3525,12 @@ class ManageQueues(Manage):
             dailySearchStatus=sickrage.app.search_queue.is_dailysearch_in_progress(),
             findPropersStatus=sickrage.app.proper_searcher.amActive,
             searchQueueLength=sickrage.app.search_queue.queue_length(),
+            searchQueueLatency=sickrage.app.search_queue.latency,
             postProcessorPaused=sickrage.app.postprocessor_queue.is_paused,
             postProcessorRunning=sickrage.app.postprocessor_queue.is_in_progress,
             postProcessorQueueLength=sickrage.app.postprocessor_queue.queue_length,
+            postProcessorQueueLatency=sickrage.app.postprocessor_queue.latency,
+            fileTransfers=ProgressIndicators.getIndicator('fileTransfers'),
             title=_('Manage Queues'),
             header=_('Manage Queues'),
             topmenu='manage',
@@ -3776,7 +3791,9 @@ class ConfigGeneral(Config):
                     git_reset=None, git_username=None, git_password=None, git_autoissues=None, gui_language=None,
                     display_all_seasons=None, showupdate_stale=None, notify_on_login=None, allowed_video_file_exts=None,
                     enable_api_providers_cache=None, enable_upnp=None, web_external_port=None,
-                    strip_special_file_bits=None, pip2_path=None, **kwargs):
+                    strip_special_file_bits=None, pip2_path=None, search_queue_workers=None,
+                    show_queue_workers=None, name_parser_cache_size=None, name_parser_cache_ttl=None,
+                    lazy_load_shows=None, **kwargs):
 
         results = []
 
@@ -3812,6 +3829,10 @@ class ConfigGeneral(Config):
         sickrage.app.config.launch_browser = checkbox_to_value(launch_browser)
         sickrage.app.config.sort_article = checkbox_to_value(sort_article)
         sickrage.app.config.cpu_preset = cpu_preset
+        sickrage.app.config.search_queue_workers = max(try_int(search_queue_workers, 1), 1)
+        sickrage.app.config.show_queue_workers = max(try_int(show_queue_workers, 1), 1)
+        sickrage.app.config.name_parser_cache_size = max(try_int(name_parser_cache_size, 1000), 1)
+        sickrage.app.config.name_parser_cache_ttl = max(try_int(name_parser_cache_ttl, 60), 0)
         sickrage.app.config.anon_redirect = anon_redirect
         sickrage.app.config.proxy_setting = proxy_setting
         sickrage.app.config.proxy_indexers = checkbox_to_value(proxy_indexers)
@@ -3824,6 +3845,7 @@ class ConfigGeneral(Config):
         sickrage.app.config.calendar_unprotected = checkbox_to_value(calendar_unprotected)
         sickrage.app.config.calendar_icons = checkbox_to_value(calendar_icons)
         sickrage.app.config.no_restart = checkbox_to_value(no_restart)
+        sickrage.app.config.lazy_load_shows = checkbox_to_value(lazy_load_shows)
 
         sickrage.app.config.ssl_verify = checkbox_to_value(ssl_verify)
         sickrage.app.config.coming_eps_missed_range = try_int(coming_eps_missed_range, 7)
@@ -3972,7 +3994,8 @@ class ConfigSearch(Config):
                    nzbget_host=None, nzbget_use_https=None, backlog_frequency=None,
                    dailysearch_frequency=None, nzb_method=None, torrent_method=None, usenet_retention=None,
                    download_propers=None, check_propers_interval=None, allow_high_priority=None, sab_forced=None,
-                   randomize_providers=None, use_failed_snatcher=None, failed_snatch_age=None,
+                   randomize_providers=None, search_provider_threads=None, search_provider_timeout=None,
+                   use_failed_snatcher=None, failed_snatch_age=None,
                    torrent_dir=None, torrent_username=None, torrent_password=None, torrent_host=None,
                    torrent_label=None, torrent_label_anime=None, torrent_path=None, torrent_verify_cert=None,
                    torrent_seed_time=None, torrent_paused=None, torrent_high_bandwidth=None,
@@ -4001,6 +4024,8 @@ class ConfigSearch(Config):
         sickrage.app.config.require_words = require_words if require_words else ""
         sickrage.app.config.ignored_subs_list = ignored_subs_list if ignored_subs_list else ""
         sickrage.app.config.randomize_providers = checkbox_to_value(randomize_providers)
+        sickrage.app.config.search_provider_threads = max(try_int(search_provider_threads, 1), 1)
+        sickrage.app.config.search_provider_timeout = max(try_int(search_provider_timeout, 120), 1)
         sickrage.app.config.enable_rss_cache = checkbox_to_value(enable_rss_cache)
         sickrage.app.config.torrent_file_to_magnet = checkbox_to_value(torrent_file_to_magnet)
         sickrage.app.config.download_unverified_magnet_link = checkbox_to_value(download_unverified_magnet_link)
@@ -4085,7 +4110,7 @@ class ConfigPostProcessing(Config):
                            naming_custom_anime=None, naming_anime_pattern=None,
                            naming_anime_multi_ep=None, autopostprocessor_frequency=None,
                            delete_non_associated_files=None, allowed_extensions=None,
-                           processor_follow_symlinks=None, unpack_dir=None):
+                           processor_follow_symlinks=None, unpack_dir=None, processor_workers=None):
 
         results = []
 
@@ -4128,6 +4153,7 @@ class ConfigPostProcessing(Config):
         sickrage.app.config.nfo_rename = checkbox_to_value(nfo_rename)
         sickrage.app.config.delete_non_associated_files = checkbox_to_value(delete_non_associated_files)
         sickrage.app.config.processor_follow_symlinks = checkbox_to_value(processor_follow_symlinks)
+        sickrage.app.config.processor_workers = max(try_int(processor_workers, 1), 1)
 
         if self.isNamingValid(naming_pattern, naming_multi_ep, anime_type=naming_anime) != "invalid":
             sickrage.app.config.naming_pattern = naming_pattern
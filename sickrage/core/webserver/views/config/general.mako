@@ -984,6 +984,92 @@
                     </div>
                 </div>
 
+                <div class="form-row form-group">
+                    <div class="col-lg-3 col-md-4 col-sm-5">
+                        <label class="component-title">${_('Search queue workers')}</label>
+                    </div>
+                    <div class="col-lg-9 col-md-8 col-sm-7 component-desc">
+                        <div class="input-group">
+                            <div class="input-group-prepend">
+                                <span class="input-group-text">
+                                    <span class="fas fa-search"></span>
+                                </span>
+                            </div>
+                            <input type="number" min="1" step="1" name="search_queue_workers"
+                                   id="search_queue_workers"
+                                   value="${sickrage.app.config.search_queue_workers}"
+                                   title="number of searches to run at the same time, searches for the same show are never run together"
+                                   class="form-control"/>
+                        </div>
+                    </div>
+                </div>
+
+                <div class="form-row form-group">
+                    <div class="col-lg-3 col-md-4 col-sm-5">
+                        <label class="component-title">${_('Show queue workers')}</label>
+                    </div>
+                    <div class="col-lg-9 col-md-8 col-sm-7 component-desc">
+                        <div class="input-group">
+                            <div class="input-group-prepend">
+                                <span class="input-group-text">
+                                    <span class="fas fa-tv"></span>
+                                </span>
+                            </div>
+                            <input type="number" min="1" step="1" name="show_queue_workers"
+                                   id="show_queue_workers"
+                                   value="${sickrage.app.config.show_queue_workers}"
+                                   title="number of show adds, updates and refreshes to run at the same time, actions for the same show are never run together"
+                                   class="form-control"/>
+                        </div>
+                    </div>
+                </div>
+
+                <div class="form-row form-group">
+                    <div class="col-lg-3 col-md-4 col-sm-5">
+                        <label class="component-title">${_('Name parser cache')}</label>
+                    </div>
+                    <div class="col-lg-9 col-md-8 col-sm-7 component-desc">
+                        <div class="form-row">
+                            <div class="col-md-12">
+                                <div class="input-group">
+                                    <div class="input-group-prepend">
+                                        <span class="input-group-text">
+                                            <span class="fas fa-database"></span>
+                                        </span>
+                                    </div>
+                                    <input type="number" min="1" step="1" name="name_parser_cache_size"
+                                           id="name_parser_cache_size"
+                                           value="${sickrage.app.config.name_parser_cache_size}"
+                                           title="number of parsed release names to keep in memory"
+                                           class="form-control"/>
+                                    <div class="input-group-append">
+                                        <span class="input-group-text">${_('entries')}</span>
+                                    </div>
+                                </div>
+                            </div>
+                        </div>
+                        <div class="form-row">
+                            <div class="col-md-12">
+                                <div class="input-group">
+                                    <div class="input-group-prepend">
+                                        <span class="input-group-text">
+                                            <span class="fas fa-clock"></span>
+                                        </span>
+                                    </div>
+                                    <input type="number" min="0" step="1" name="name_parser_cache_ttl"
+                                           id="name_parser_cache_ttl"
+                                           value="${sickrage.app.config.name_parser_cache_ttl}"
+                                           title="minutes before a cached parse result expires, 0 to never expire"
+                                           class="form-control"/>
+                                    <div class="input-group-append">
+                                        <span class="input-group-text">${_('minutes')}</span>
+                                    </div>
+                                </div>
+                            </div>
+                        </div>
+                    </div>
+                </div>
+
                 <div class="form-row form-group">
                     <div class="col-lg-3 col-md-4 col-sm-5">
                         <label class="component-title">${_('Anonymous redirect')}</label>
@@ -1048,6 +1134,21 @@
 
                 </div>
 
+                <div class="form-row form-group">
+
+                    <div class="col-lg-3 col-md-4 col-sm-5">
+                        <label class="component-title">${_('Fast startup')}</label>
+                    </div>
+                    <div class="col-lg-9 col-md-8 col-sm-7 component-desc">
+                        <label for="lazy_load_shows">
+                            <input type="checkbox" class="toggle color-primary is-material" name="lazy_load_shows"
+                                   id="lazy_load_shows" ${('', 'checked')[bool(sickrage.app.config.lazy_load_shows)]}/>
+                            ${_('Load only basic show info at startup and the rest in the background (takes effect on restart).')}
+                        </label>
+                    </div>
+
+                </div>
+
                 <div class="form-row form-group">
 
                     <div class="col-lg-3 col-md-4 col-sm-5">
@@ -363,6 +363,17 @@
                         </label>
                     </div>
                 </div>
+                <div class="form-row form-group">
+                    <div class="col-lg-3 col-md-4 col-sm-5">
+                        <label class="component-title">${_('Post-processing workers')}</label>
+                    </div>
+                    <div class="col-lg-9 col-md-8 col-sm-7 component-desc">
+                        <input type="number" min="1" step="1" name="processor_workers" id="processor_workers"
+                               value="${sickrage.app.config.processor_workers}"
+                               title="number of episodes to process at the same time, episodes of the same show are never processed together"
+                               class="form-control"/>
+                    </div>
+                </div>
                 <div class="form-row form-group">
                     <div class="col-lg-3 col-md-4 col-sm-5">
                         <label class="component-title">${_('Delete Failed')}</label>
@@ -33,6 +33,54 @@
                         </label>
                     </div>
                 </div>
+                <div class="form-row form-group">
+                    <div class="col-lg-3 col-md-4 col-sm-5">
+                        <label class="component-title">${_('Concurrent provider searches')}</label>
+                    </div>
+                    <div class="col-lg-9 col-md-8 col-sm-7 component-desc">
+                        <div class="input-group">
+                            <div class="input-group-prepend">
+                                <span class="input-group-text">
+                                    <span class="fas fa-search"></span>
+                                </span>
+                            </div>
+                            <input type="number" min="1" step="1" name="search_provider_threads"
+                                   id="search_provider_threads"
+                                   value="${sickrage.app.config.search_provider_threads}"
+                                   title="number of providers to search at the same time, 1 searches them one by one"
+                                   class="form-control"/>
+                            <div class="input-group-append">
+                                <span class="input-group-text">
+                                    providers
+                                </span>
+                            </div>
+                        </div>
+                    </div>
+                </div>
+                <div class="form-row form-group">
+                    <div class="col-lg-3 col-md-4 col-sm-5">
+                        <label class="component-title">${_('Provider search timeout')}</label>
+                    </div>
+                    <div class="col-lg-9 col-md-8 col-sm-7 component-desc">
+                        <div class="input-group">
+                            <div class="input-group-prepend">
+                                <span class="input-group-text">
+                                    <span class="fas fa-clock"></span>
+                                </span>
+                            </div>
+                            <input type="number" min="1" step="1" name="search_provider_timeout"
+                                   id="search_provider_timeout"
+                                   value="${sickrage.app.config.search_provider_timeout}"
+                                   title="how long to wait for provider results when searching concurrently"
+                                   class="form-control"/>
+                            <div class="input-group-append">
+                                <span class="input-group-text">
+                                    seconds
+                                </span>
+                            </div>
+                        </div>
+                    </div>
+                </div>
                 <div class="form-row form-group">
                     <div class="col-lg-3 col-md-4 col-sm-5">
                         <label class="component-title">${_('Download propers')}</label>
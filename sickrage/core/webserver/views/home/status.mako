@@ -5,6 +5,7 @@
     from sickrage.core.queues.show import ShowQueueActions
     from sickrage.core.common import dateTimeFormat
     from sickrage.core.helpers import pretty_time_delta
+    from sickrage.core.nameparser import name_parser_cache
 %>
 <%block name="content">
     <%
@@ -122,38 +123,38 @@
                         </tr>
                         </thead>
                         <tbody>
-                            % if sickrage.app.show_queue.current_item is not None:
+                            % for current_item in sickrage.app.show_queue.current_items:
                                 <tr>
                                 % try:
-                                    <% showindexerid = sickrage.app.show_queue.current_item.show.indexerid %>
+                                    <% showindexerid = current_item.show.indexerid %>
                                     <td>${showindexerid}</td>
                                 % except Exception:
                                     <td></td>
                                 % endtry
                                 % try:
-                                    <% showname = sickrage.app.show_queue.current_item.show.name %>
+                                    <% showname = current_item.show.name %>
                                     <td>${showname}</td>
                                 % except Exception:
-                                    % if sickrage.app.show_queue.current_item.action_id == ShowQueueActions.ADD:
-                                        <td>${sickrage.app.show_queue.current_item.showDir}</td>
+                                    % if current_item.action_id == ShowQueueActions.ADD:
+                                        <td>${current_item.showDir}</td>
                                     % else:
                                         <td></td>
                                     % endif
                                 % endtry
-                                    <td>${sickrage.app.show_queue.current_item.is_alive()}</td>
-                                    % if sickrage.app.show_queue.current_item.priority == 10:
+                                    <td>${current_item.is_alive()}</td>
+                                    % if current_item.priority == 10:
                                         <td>${_('LOW')}</td>
-                                    % elif sickrage.app.show_queue.current_item.priority == 20:
+                                    % elif current_item.priority == 20:
                                         <td>${_('NORMAL')}</td>
-                                    % elif sickrage.app.show_queue.current_item.priority == 30:
+                                    % elif current_item.priority == 30:
                                         <td>${_('HIGH')}</td>
                                     % else:
-                                        <td>${sickrage.app.show_queue.current_item.priority}</td>
+                                        <td>${current_item.priority}</td>
                                     % endif
-                                    <td>${sickrage.app.show_queue.current_item.added.strftime(dateTimeFormat)}</td>
-                                    <td>${ShowQueueActions.names[sickrage.app.show_queue.current_item.action_id]}</td>
+                                    <td>${current_item.added.strftime(dateTimeFormat)}</td>
+                                    <td>${ShowQueueActions.names[current_item.action_id]}</td>
                                 </tr>
-                            % endif
+                            % endfor
                             % for __, __, item in sickrage.app.show_queue.queue:
                                 <tr>
                                 % try:
@@ -193,6 +194,39 @@
         </div>
     </div>
 
+    <div class="row">
+        <div class="col-lg-10 mx-auto">
+            <div class="card mb-3">
+                <div class="card-header">
+                    <h3>${_('Name Parser Cache')}</h3>
+                </div>
+                <div class="card-body">
+                    <% cache_stats = name_parser_cache.stats %>
+                    <table id="nameParserCacheStatusTable" class="table" width="100%">
+                        <thead class="thead-dark">
+                        <tr>
+                            <th>${_('Entries')}</th>
+                            <th>${_('Hits')}</th>
+                            <th>${_('Misses')}</th>
+                            <th>${_('Hit Rate')}</th>
+                            <th>${_('Evictions')}</th>
+                        </tr>
+                        </thead>
+                        <tbody>
+                        <tr>
+                            <td>${cache_stats['size']} / ${cache_stats['max_size']}</td>
+                            <td>${cache_stats['hits']}</td>
+                            <td>${cache_stats['misses']}</td>
+                            <td>${'{:.1f}%'.format(100.0 * cache_stats['hits'] / max(cache_stats['hits'] + cache_stats['misses'], 1))}</td>
+                            <td>${cache_stats['evictions']}</td>
+                        </tr>
+                        </tbody>
+                    </table>
+                </div>
+            </div>
+        </div>
+    </div>
+
     <div class="row">
         <div class="col-lg-10 mx-auto">
             <div class="card mb-3">
@@ -110,6 +110,14 @@
                                         </div>
                                     </div>
                                 </div>
+                                <div class="row">
+                                    <div class="col text-center">
+                                        <small class="text-muted">
+                                            ${_('Average start delay:')} ${round(searchQueueLatency['average'], 2)}s
+                                            (${_('max')} ${round(searchQueueLatency['max'], 2)}s)
+                                        </small>
+                                    </div>
+                                </div>
                             </div>
                         </div>
 
@@ -130,6 +138,33 @@
                                             <i>${postProcessorQueueLength['manual']} ${_('pending items')}</i></div>
                                     </div>
                                 </div>
+                                <div class="row">
+                                    <div class="col text-center">
+                                        <small class="text-muted">
+                                            ${_('Average start delay:')} ${round(postProcessorQueueLatency['average'], 2)}s
+                                            (${_('max')} ${round(postProcessorQueueLatency['max'], 2)}s)
+                                        </small>
+                                    </div>
+                                </div>
+                            </div>
+                        </div>
+
+                        <div class="card bg-transparent mb-3">
+                            <div class="card-header text-center">
+                                <h3>${_('File Transfers')}</h3>
+                            </div>
+                            <div class="card-body">
+                                % if fileTransfers:
+                                    % for transfer in fileTransfers:
+                                        <div class="row">
+                                            <div class="col text-center"><i>${transfer.status()}</i></div>
+                                        </div>
+                                    % endfor
+                                % else:
+                                    <div class="row">
+                                        <div class="col text-center"><i>${_('No file transfers in progress')}</i></div>
+                                    </div>
+                                % endif
                             </div>
                         </div>
                     </div>
@@ -43,7 +43,7 @@ from sickrage.core.common import MULTI_EP_RESULT, Quality, SEASON_RESULT, cpu_pr
 from sickrage.core.helpers import chmod_as_parent, findCertainShow, sanitizeFileName, clean_url, bs4_parser, \
     validate_url, try_int, convert_size
 from sickrage.core.helpers.show_names import allPossibleShowNames
-from sickrage.core.nameparser import InvalidNameException, InvalidShowException, NameParser
+from sickrage.core.nameparser import NameParser
 from sickrage.core.scene_exceptions import get_scene_exceptions
 from sickrage.core.websession import WebSession
 
@@ -318,22 +318,23 @@ class GenericProvider(object):
             # extend the list with the unknown qualities, now sorted at the bottom of the list
             items_list.extend(unknown_items)
 
-        # filter results
-        for item in itemList:
-            result = self.getResult()
+        # ignore invalid urls
+        itemList = [(item, ) + tuple(self._get_title_and_url(item)) for item in itemList]
+        itemList = [x for x in itemList if validate_url(x[2]) or x[2].startswith('magnet')]
 
-            result.name, result.url = self._get_title_and_url(item)
+        # parse all release names as one batch
+        parse_results = NameParser(showObj=show).parse_many([name for __, name, __ in itemList])
 
-            # ignore invalid urls
-            if not validate_url(result.url) and not result.url.startswith('magnet'):
+        # filter results, results are added to the cache as one batch once filtered
+        cache_items = []
+        for item, name, url in itemList:
+            if name not in parse_results:
                 continue
 
-            try:
-                parse_result = NameParser(showObj=show).parse(result.name)
-            except (InvalidNameException, InvalidShowException) as e:
-                sickrage.app.log.debug("{}".format(e))
-                continue
+            parse_result = parse_results[name]
 
+            result = self.getResult()
+            result.name, result.url = name, url
             result.show = parse_result.show
             result.quality = parse_result.quality
             result.release_group = parse_result.release_group
@@ -342,7 +343,7 @@ class GenericProvider(object):
             result.seeders, result.leechers = self._get_result_stats(item)
 
             sickrage.app.log.debug("Adding item from search to cache: {}".format(result.name))
-            self.cache.addCacheEntry(result.name, result.url, result.seeders, result.leechers, result.size)
+            cache_items.append((result.name, result.url, result.seeders, result.leechers, result.size))
 
             if not result.show:
                 continue
@@ -382,8 +383,8 @@ class GenericProvider(object):
                     continue
                 else:
                     airdate = parse_result.air_date.toordinal()
-                    dbData = [x for x in sickrage.app.main_db.get_many('tv_episodes', result.show.indexerid)
-                              if x['airdate'] == airdate]
+                    dbData = list(sickrage.app.main_db.get_many('tv_episodes_airdate',
+                                                                (result.show.indexerid, airdate)))
 
                     if len(dbData) != 1:
                         sickrage.app.log.warning(
@@ -432,6 +433,8 @@ class GenericProvider(object):
             else:
                 results[epNum] += [result]
 
+        self.cache.add_cache_entries(cache_items)
+
         return results
 
     def find_propers(self, episodes):
@@ -87,10 +87,13 @@ class BinSearchCache(TVCache):
             # set updated
             self.last_update = datetime.datetime.today()
 
+            cache_items = []
             for group in ['alt.binaries.hdtv', 'alt.binaries.hdtv.x264', 'alt.binaries.tv', 'alt.binaries.tvseries']:
                 search_params = {'max': 50, 'g': group}
                 for item in self.get_rss_feed(self.provider.urls['rss'], search_params).get('entries', []):
-                    self._parseItem(item)
+                    cache_items.append(self._parseItem(item))
+
+            self.add_cache_entries(filter(None, cache_items))
 
         return True
 
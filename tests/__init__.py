@@ -47,7 +47,10 @@ import sickrage
 from sickrage.core.databases.cache import CacheDB
 from sickrage.core.databases.main import MainDB
 from sickrage.core.tv import episode
-from sickrage.core import Core, Config, NameCache, Logger
+from sickrage.core import Core, Config, NameCache, Logger, ShowStatsCache
+from sickrage.core.caches.quicksearch_cache import QuicksearchCache
+from sickrage.core.scene_exceptions import exceptions_cache
+from sickrage.core.scene_numbering import scene_numbering_cache, xem_havemap_cache
 from sickrage.providers import SearchProviders
 
 
@@ -75,10 +78,12 @@ class SiCKRAGETestCase(unittest.TestCase):
         sickrage.app = Core()
         sickrage.app.search_providers = SearchProviders()
         sickrage.app.name_cache = NameCache()
+        sickrage.app.show_stats_cache = ShowStatsCache()
         sickrage.app.log = Logger()
         sickrage.app.config = Config()
 
         sickrage.app.data_dir = self.TESTDIR
+        sickrage.app.cache_dir = os.path.join(self.TESTDIR, 'cache')
         sickrage.app.config_file = self.TEST_CONFIG
 
         sickrage.app.config.load()
@@ -131,6 +136,11 @@ class SiCKRAGETestDBCase(SiCKRAGETestCase):
         for db in [sickrage.app.main_db, sickrage.app.cache_db]:
             db.initialize()
 
+        sickrage.app.quicksearch_cache = QuicksearchCache()
+        exceptions_cache.clear()
+        scene_numbering_cache.clear()
+        xem_havemap_cache.clear()
+
     def tearDown(self):
         super(SiCKRAGETestDBCase, self).tearDown()
         for db in [sickrage.app.main_db, sickrage.app.cache_db]:
@@ -22,11 +22,15 @@ from __future__ import print_function, unicode_literals
 import datetime
 import unittest
 
+from dateutil import tz
+
 import sickrage
 import tests
 from sickrage.core import TVShow, helpers
-from sickrage.core.common import UNAIRED
+from sickrage.core.caches.quicksearch_cache import QuicksearchCache
+from sickrage.core.common import UNAIRED, WANTED, DOWNLOADED, Quality
 from sickrage.core.tv.episode import TVEpisode
+from sickrage.core.updaters.tz_updater import TimeZoneUpdater
 
 
 class DBBasicTests(tests.SiCKRAGETestDBCase):
@@ -55,6 +59,11 @@ class DBBasicTests(tests.SiCKRAGETestDBCase):
         ep.status = UNAIRED
         ep.save_to_db()
 
+    def _load_episode(self, season, episode):
+        ep = TVEpisode(sickrage.app.showlist[0], season, episode)
+        ep.load_from_db(season, episode)
+        return ep
+
     def test_unaired(self):
         count = 0
 
@@ -74,6 +83,175 @@ class DBBasicTests(tests.SiCKRAGETestDBCase):
 
         self.assertEqual(count, 3)
 
+    def test_episode_indexes(self):
+        dbData = list(sickrage.app.main_db.get_many('tv_episodes_season_episode', (1, 1, 2)))
+        self.assertEqual(len(dbData), 1)
+        self.assertEqual(dbData[0]['indexerid'], 2)
+
+        dbData = list(sickrage.app.main_db.get_many('tv_episodes_airdate', (1, 733832)))
+        self.assertEqual(len(dbData), 3)
+
+        self.assertEqual(len(list(sickrage.app.main_db.get_many('tv_episodes_season_episode', (1, 2, 1)))), 0)
+
+    def test_episode_airdate_range(self):
+        self.assertEqual(len(list(sickrage.app.main_db.get_episodes_by_airdate(733832, 733833))), 3)
+        self.assertEqual(len(list(sickrage.app.main_db.get_episodes_by_airdate(733833))), 0)
+        self.assertEqual(len(list(sickrage.app.main_db.get_episodes_by_airdate(733800, 733832))), 0)
+        self.assertEqual(len(list(sickrage.app.main_db.get_episodes_by_airdate(733832, statuses=[UNAIRED]))), 3)
+        self.assertEqual(len(list(sickrage.app.main_db.get_episodes_by_airdate(733832, statuses=[WANTED]))), 0)
+
+    def test_episode_status_index(self):
+        ep = self._load_episode(1, 1)
+        ep.status = Quality.compositeStatus(DOWNLOADED, Quality.HDTV)
+        ep.save_to_db()
+
+        self.assertEqual(len(list(sickrage.app.main_db.all('tv_episodes'))), 3)
+        self.assertEqual(len(list(sickrage.app.main_db.get_episodes_by_status([UNAIRED]))), 2)
+        self.assertEqual(len(list(sickrage.app.main_db.get_episodes_by_status([UNAIRED, DOWNLOADED]))), 3)
+        self.assertEqual(len(list(sickrage.app.main_db.get_episodes_by_status([DOWNLOADED], showid=1))), 1)
+        self.assertEqual(len(list(sickrage.app.main_db.get_episodes_by_status([DOWNLOADED], showid=2))), 0)
+        self.assertEqual(len(list(sickrage.app.main_db.get_episodes_by_status([UNAIRED], 733832, 733833))), 2)
+        self.assertEqual(len(list(sickrage.app.main_db.get_episodes_by_status([UNAIRED], 733833))), 0)
+        self.assertEqual(len(list(sickrage.app.main_db.get_episodes_by_status([WANTED]))), 0)
+
+    def test_provider_cache_index(self):
+        for season, episodes in [(1, '|1|'), (1, '|2|3|'), (2, '|1|')]:
+            sickrage.app.cache_db.insert({'_t': 'providers', 'provider': 'test', 'indexerid': 1, 'season': season,
+                                          'episodes': episodes, 'url': 'http://test/{}'.format(episodes),
+                                          'quality': 1})
+
+        self.assertEqual(len(list(sickrage.app.cache_db.get_many('providers_season', ('test', 1, 1)))), 2)
+        self.assertEqual(len(list(sickrage.app.cache_db.get_many('providers_season', ('test', 1, 2)))), 1)
+        self.assertEqual(len(list(sickrage.app.cache_db.get_many('providers_season', ('test', 2, 1)))), 0)
+        self.assertEqual(len(list(sickrage.app.cache_db.get_many('providers_season', ('t\xe9st', 1, 1)))), 0)
+
+        self.assertEqual(sickrage.app.cache_db.get('providers_url', ('test', 'http://test/|2|3|'))['season'], 1)
+        self.assertIsNone(sickrage.app.cache_db.get('providers_url', ('test', 'http://test/|4|')))
+
+        sickrage.app.cache_db.insert({'_t': 'providers', 'provider': 'test', 'indexerid': 1, 'season': 3,
+                                      'episodes': '|1|', 'url': 'http://test/\xe9', 'quality': 1})
+        self.assertEqual(sickrage.app.cache_db.get('providers_url', ('test', 'http://test/\xe9'))['season'], 3)
+
+    def test_network_timezones(self):
+        sickrage.app.cache_db.insert({'_t': 'network_timezones', 'network_name': 'Test Network',
+                                      'timezone': 'US/Eastern'})
+
+        tz_updater = TimeZoneUpdater()
+        self.assertEqual(tz_updater.get_network_timezone('Test Network'), tz.gettz('US/Eastern'))
+        self.assertEqual(tz_updater.get_network_timezone('Unknown Network'), sickrage.app.tz)
+
+        air_time = tz_updater.parse_date_time(733832, '8:30 PM', 'Test Network')
+        self.assertEqual((air_time.hour, air_time.minute), (20, 30))
+        self.assertEqual(tz_updater.air_times['8:30 PM'], (20, 30))
+
+        # cached output built from the timezones can tell they were reloaded
+        version = tz_updater.network_timezones_version
+        tz_updater.load_network_timezones()
+        self.assertEqual(tz_updater.network_timezones_version, version + 1)
+
+    def test_processed_release_lookups(self):
+        ep = self._load_episode(1, 1)
+        ep.release_name = "Show.Name.S01E01.720p-GRP"
+        ep.save_to_db()
+
+        self.assertEqual(len(list(sickrage.app.main_db.all('tv_episodes'))), 3)
+        self.assertEqual(len(sickrage.app.main_db.get_episodes_by_release_name('show.name.s01e01.720p-grp')), 1)
+        self.assertEqual(sickrage.app.main_db.get_episodes_by_release_name('Show.Name.S01E01.720p-GRP')[0]['name'],
+                         "test episode 1")
+
+        ep.release_name = "Show.Name.S01E01.1080p-GRP"
+        ep.save_to_db()
+        self.assertEqual(len(sickrage.app.main_db.get_episodes_by_release_name('Show.Name.S01E01.720p-GRP')), 0)
+        self.assertEqual(len(sickrage.app.main_db.get_episodes_by_release_name('Show.Name.S01E01.1080p-GRP')), 1)
+        self.assertEqual(len(sickrage.app.main_db.get_episodes_by_release_name('Show.Name.S01E01')), 0)
+
+        for date, resource in [(1, 'Show.Name.S01E02.720p-GRP'), (2, '/tv/Show Name/Show.Name.S01E02.720p-GRP.mkv')]:
+            sickrage.app.main_db.insert({'_t': 'history', 'action': 0, 'date': date, 'showid': 1, 'season': 1,
+                                         'episode': 2, 'quality': 0, 'resource': resource, 'provider': '',
+                                         'version': -1})
+
+        self.assertEqual(len(sickrage.app.main_db.get_history_by_resource('Show.Name.S01E02.720p-GRP')), 2)
+        self.assertEqual(len(sickrage.app.main_db.get_history_by_resource('show.name.s01e02.720p-grp.mkv')), 1)
+        self.assertEqual(sickrage.app.main_db.get_history_by_resource('Show.Name.S01E02.720p-GRP')[0]['date'], 1)
+        self.assertEqual(len(sickrage.app.main_db.get_history_by_resource('Show.Name.S01E03.720p-GRP')), 0)
+
+    def test_name_cache(self):
+        sickrage.app.name_cache.load()
+        sickrage.app.name_cache.put('Show Name', 1)
+        sickrage.app.name_cache.put('Show Name Alias', 1)
+        self.assertEqual(sickrage.app.name_cache.get('show name'), 1)
+        self.assertEqual(len(list(sickrage.app.cache_db.all('scene_names'))), 0)
+
+        sickrage.app.name_cache.save()
+        self.assertEqual(len(list(sickrage.app.cache_db.get_many('scene_names_indexer_id', 1))), 2)
+
+        sickrage.app.name_cache.clear(1)
+        self.assertIsNone(sickrage.app.name_cache.get('show name'))
+
+        sickrage.app.name_cache.save()
+        self.assertEqual(len(list(sickrage.app.cache_db.all('scene_names'))), 0)
+
+        # changes of a failed save are written by the next one
+        sickrage.app.name_cache.put('Show Name', 1)
+
+        def insert(*args):
+            raise ValueError
+
+        sickrage.app.cache_db.insert = insert
+        try:
+            self.assertRaises(ValueError, sickrage.app.name_cache.save)
+        finally:
+            del sickrage.app.cache_db.insert
+
+        sickrage.app.name_cache.save()
+        self.assertEqual(len(list(sickrage.app.cache_db.get_many('scene_names_indexer_id', 1))), 1)
+
+    def test_bulk_writes(self):
+        dbData = sickrage.app.cache_db.insert({'_t': 'scene_names', 'indexer_id': 1, 'name': 'show name'})
+        updated = sickrage.app.cache_db.get('id', dbData['_id'])
+
+        try:
+            with sickrage.app.cache_db.bulk():
+                sickrage.app.cache_db.insert({'_t': 'scene_names', 'indexer_id': 2, 'name': 'other show'})
+                updated['name'] = 'renamed show'
+                sickrage.app.cache_db.update(updated)
+                sickrage.app.cache_db.delete(sickrage.app.cache_db.get('id', dbData['_id']))
+                raise ValueError
+        except ValueError:
+            pass
+
+        names = [x['name'] for x in sickrage.app.cache_db.all('scene_names')]
+        self.assertEqual(names, ['show name'])
+
+        with sickrage.app.cache_db.bulk():
+            with sickrage.app.cache_db.bulk():
+                sickrage.app.cache_db.insert({'_t': 'scene_names', 'indexer_id': 2, 'name': 'other show'})
+
+        self.assertEqual(len(list(sickrage.app.cache_db.get_many('scene_names_indexer_id', 2))), 1)
+
+    def test_quicksearch_cache(self):
+        sickrage.app.quicksearch_cache.add_show(1)
+        self.assertEqual(len(sickrage.app.quicksearch_cache.get_episodes('Episode 2')), 1)
+        self.assertEqual(len(sickrage.app.quicksearch_cache.get_episodes('episode')), 3)
+        self.assertEqual(len(sickrage.app.quicksearch_cache.get_episodes('pisod', limit=2)), 2)
+        self.assertEqual(len(sickrage.app.quicksearch_cache.get_episodes('episode 4')), 0)
+
+        ep = self._load_episode(1, 2)
+        ep.name = "renamed"
+        ep.save_to_db()
+        sickrage.app.quicksearch_cache.update_show(1)
+        self.assertEqual(len(sickrage.app.quicksearch_cache.get_episodes('episode')), 2)
+        self.assertEqual(len(list(sickrage.app.cache_db.get_many('quicksearch', 1))), 4)
+
+        quicksearch_cache = QuicksearchCache()
+        quicksearch_cache.load()
+        self.assertEqual(quicksearch_cache.get_episodes('renamed')[0]['episode'], 2)
+
+        sickrage.app.quicksearch_cache.del_show(1)
+        self.assertEqual(len(sickrage.app.quicksearch_cache.get_episodes('e')), 0)
+        self.assertEqual(len(list(sickrage.app.cache_db.get_many('quicksearch', 1))), 0)
+
+
 if __name__ == '__main__':
     print("==================")
     print("STARTING - DB TESTS")
@@ -21,12 +21,14 @@ from __future__ import print_function
 from __future__ import unicode_literals
 
 import os.path
+import time
 import unittest
 from datetime import date
 
 import sickrage
 import tests
-from sickrage.core.nameparser import ParseResult, NameParser, InvalidNameException, InvalidShowException
+from sickrage.core.nameparser import ParseResult, NameParser, InvalidNameException, InvalidShowException, \
+    NameParserCache
 from sickrage.core.tv.show import TVShow
 
 sickrage.app.sys_encoding = 'UTF-8'
@@ -444,6 +446,66 @@ class BasicTests(tests.SiCKRAGETestDBCase):
         pass
 
 
+class ParseManyTests(tests.SiCKRAGETestDBCase):
+    def test_parse_many(self):
+        names = ['Show.Name.S01E02.Source.Quality.Etc-Group', 'Show.Name.S01E02.Source.Quality.Etc-Group',
+                 'Show.Name.S01E03.Source.Quality.Etc-Group', 'Show.Name.Source.Quality.Etc-Group']
+
+        for processes in (1, 2):
+            results = NameParser(True, validate_show=False).parse_many(names, processes=processes)
+            self.assertEqual(list(results.keys()), names[:1] + names[2:3])
+            self.assertEqual(results[names[0]].episode_numbers, [2])
+            self.assertEqual(results[names[2]].episode_numbers, [3])
+
+
+class BenchmarkTests(tests.SiCKRAGETestDBCase):
+    def test_parse_speed(self):
+        names = [name for section in simple_test_cases.values() for name in section]
+        names += [name for section in anime_test_cases.values() for name in section]
+        names += [os.path.normpath(name) for (name, __, __) in combination_test_cases]
+
+        loops = 10
+        parses = 0
+
+        start = time.time()
+        for __ in range(loops):
+            for name in names:
+                try:
+                    NameParser(True, validate_show=False).parse(name, cache_result=False)
+                except (InvalidNameException, InvalidShowException):
+                    pass
+                parses += 1
+        elapsed = time.time() - start
+
+        print('Parsed {} names in {:.2f}s, {:.0f} parses per second'.format(parses, elapsed,
+                                                                            parses / max(elapsed, 0.000001)))
+
+
+class NameParserCacheTests(tests.SiCKRAGETestCase):
+    def test_lru(self):
+        self.addCleanup(setattr, sickrage.app.config, 'name_parser_cache_size',
+                        sickrage.app.config.name_parser_cache_size)
+        sickrage.app.config.name_parser_cache_size = 2
+
+        cache = NameParserCache()
+        cache.add('a', 1)
+        cache.add('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+
+        # b is now the least recently used entry
+        cache.add('c', 3)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.get('c'), 3)
+
+        self.assertEqual(cache.stats['hits'], 3)
+        self.assertEqual(cache.stats['misses'], 1)
+        self.assertEqual(cache.stats['evictions'], 1)
+
+        cache.clear()
+        self.assertIsNone(cache.get('a'))
+
+
 if __name__ == '__main__':
     print("==================")
     print("STARTING - NAME PARSER TESTS")
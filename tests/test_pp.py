@@ -21,14 +21,21 @@ from __future__ import print_function, unicode_literals
 
 import io
 import os
+import threading
+import time
 import unittest
 
 import sickrage
 import tests
-from sickrage.core.helpers import make_dirs
+from sickrage.core import process_tv
+from sickrage.core.exceptions import NoFreeSpaceException
+from sickrage.core.helpers import make_dirs, transfer
+from sickrage.core.helpers.transfer import transfer_file
+from sickrage.core.nameparser import name_parser_cache
 from sickrage.core.processors.post_processor import PostProcessor
 from sickrage.core.tv.episode import TVEpisode
 from sickrage.core.tv.show import TVShow
+from sickrage.core.ui import ProgressIndicators
 
 
 def _log(message, level=None):
@@ -82,6 +89,123 @@ class PPMultiEPTests(tests.SiCKRAGETestDBCase):
         self.assertTrue(self.post_processor.process)
 
 
+class PPScanTests(tests.SiCKRAGETestCase):
+    def test_file_changed(self):
+        process_tv.scanned_files.clear()
+        self.assertTrue(process_tv.file_changed(self.FILEPATH))
+        self.assertFalse(process_tv.file_changed(self.FILEPATH))
+
+        with io.open(self.FILEPATH, 'ab') as f:
+            f.write(b"more")
+        self.assertTrue(process_tv.file_changed(self.FILEPATH))
+
+
+class PPWorkerTests(tests.SiCKRAGETestDBCase):
+    def setUp(self):
+        super(PPWorkerTests, self).setUp()
+        sickrage.app.config.processor_workers = 2
+        process_tv.scanned_files.clear()
+        name_parser_cache.clear()
+        self.process_video_file = process_tv.process_video_file
+        self.PostProcessor = process_tv.post_processor.PostProcessor
+
+        for indexerid, name in [(3, self.SHOWNAME), (4, 'other show')]:
+            show = TVShow(1, indexerid)
+            show.name = name
+            show.location = self.SHOWDIR
+            show.save_to_db()
+            sickrage.app.showlist.append(show)
+            sickrage.app.name_cache.put(name, indexerid)
+
+    def tearDown(self):
+        process_tv.process_video_file = self.process_video_file
+        process_tv.post_processor.PostProcessor = self.PostProcessor
+        super(PPWorkerTests, self).tearDown()
+
+    def test_show_locks(self):
+        lock = process_tv.get_show_lock(self.FILEDIR, 'show name - s04e02.mkv')
+        self.assertIs(process_tv.get_show_lock(self.FILEDIR, 'show name - s04e03.mkv'), lock)
+        self.assertIsNot(process_tv.get_show_lock(self.FILEDIR, 'other show - s01e01.mkv'), lock)
+        self.assertIsNot(process_tv.get_show_lock(self.FILEDIR, 'unknown show - s01e01.mkv'),
+                         process_tv.get_show_lock(self.FILEDIR, 'unknown show - s01e02.mkv'))
+
+        # the post processor finds the parse result of the file name in the cache
+        self.assertEqual(name_parser_cache.get('show name - s04e02').indexerid, 3)
+
+    def test_worker_pool(self):
+        lock = threading.Lock()
+        running = {}
+        peak = {}
+
+        def process_video_file(processPath, cur_video_file, nzbName, process_method, force, is_priority, result):
+            show = cur_video_file.split(' - ')[0]
+            with lock:
+                running[show] = running.get(show, 0) + 1
+                peak[show] = max(peak.get(show, 0), running[show])
+                peak['total'] = max(peak.get('total', 0), sum(running.values()))
+
+            time.sleep(0.1)
+
+            with lock:
+                running[show] -= 1
+
+            if cur_video_file == 'other show - s01e02.mkv':
+                raise NoFreeSpaceException
+            result.output += cur_video_file + '\n'
+
+        process_tv.process_video_file = process_video_file
+
+        video_files = ['show name - s04e02.mkv', 'other show - s01e01.mkv', 'show name - s04e03.mkv',
+                       'other show - s01e02.mkv']
+
+        # episodes of the same show are never processed together, the output of every file is kept on errors
+        result = process_tv.ProcessResult()
+        self.assertRaises(NoFreeSpaceException, process_tv.process_media, self.FILEDIR, video_files, None, 'copy',
+                          False, False, result)
+        self.assertEqual(result.output, ''.join(x + '\n' for x in video_files[:3]))
+        self.assertEqual(peak, {self.SHOWNAME: 1, 'other show': 1, 'total': 2})
+
+    def test_failed_files_rescanned(self):
+        class PostProcessor(object):
+            def __init__(self, *args, **kwargs):
+                raise NoFreeSpaceException
+
+        process_tv.post_processor.PostProcessor = PostProcessor
+
+        self.assertTrue(process_tv.file_changed(self.FILEPATH))
+        self.assertRaises(NoFreeSpaceException, process_tv.process_video_file, self.FILEDIR, self.FILENAME, None,
+                          'copy', False, False, process_tv.ProcessResult())
+        self.assertTrue(process_tv.file_changed(self.FILEPATH))
+
+
+class PPTransferTests(tests.SiCKRAGETestCase):
+    def test_transfer_file(self):
+        dest_file = os.path.join(self.SHOWDIR, self.FILENAME)
+
+        transfer_file(self.FILEPATH, dest_file)
+        with io.open(dest_file, 'rb') as f:
+            self.assertEqual(f.read(), b"foo bar")
+        self.assertFalse(os.path.exists(dest_file + '.sr_transfer'))
+        self.assertEqual(ProgressIndicators.getIndicator('fileTransfers'), [])
+
+        os.remove(dest_file)
+        transfer_file(self.FILEPATH, dest_file, move=True)
+        self.assertTrue(os.path.isfile(dest_file))
+        self.assertFalse(os.path.exists(self.FILEPATH))
+
+    def test_transfer_file_no_free_space(self):
+        dest_file = os.path.join(self.SHOWDIR, self.FILENAME)
+
+        original, transfer.free_space = transfer.free_space, lambda path: 0
+        try:
+            self.assertRaises(NoFreeSpaceException, transfer_file, self.FILEPATH, dest_file)
+        finally:
+            transfer.free_space = original
+
+        self.assertFalse(os.path.exists(dest_file))
+        self.assertFalse(os.path.exists(dest_file + '.sr_transfer'))
+
+
 class ListAssociatedFiles(tests.SiCKRAGETestCase):
     def setUp(self):
         super(ListAssociatedFiles, self).setUp()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python2.7
+# Author: echel0n <echel0n@sickrage.ca>
+# URL: https://sickrage.ca
+#
+# This file is part of SickRage.
+#
+# SickRage is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# SickRage is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with SickRage.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import print_function, unicode_literals
+
+import threading
+import unittest
+
+import sickrage
+import tests
+from sickrage.core.queues import srQueue, srQueueItem, srQueuePriorities
+from sickrage.core.queues.search import SearchQueue
+from sickrage.core.queues.show import ShowQueue, ShowQueueActions, ShowQueueItem
+from sickrage.core.tv.show import TVShow
+
+
+class FakeQueueItem(srQueueItem):
+    def __init__(self, name, priority=srQueuePriorities.NORMAL, release=None, show=None):
+        super(FakeQueueItem, self).__init__(name)
+        self.priority = priority
+        self.release = release
+        self.show = show
+        self.started = threading.Event()
+
+    def run(self):
+        self.started.set()
+        if self.release:
+            self.release.wait(5)
+
+
+class QueueTests(tests.SiCKRAGETestCase):
+    def setUp(self):
+        super(QueueTests, self).setUp()
+        self.release = threading.Event()
+        self.queue = srQueue()
+        self.queue.start()
+
+    def tearDown(self):
+        self.release.set()
+        self.queue.shutdown()
+        super(QueueTests, self).tearDown()
+
+    def test_next_item_started_when_item_finishes(self):
+        for __ in range(20):
+            items = [self.queue.put(FakeQueueItem('item {}'.format(i))) for i in range(2)]
+            for item in items:
+                self.assertTrue(item.started.wait(2))
+                item.join(2)
+
+        self.assertFalse(self.queue.is_busy)
+
+    def test_preemption(self):
+        running = self.queue.put(FakeQueueItem('running', release=self.release))
+        self.assertTrue(running.started.wait(2))
+
+        # one higher priority item may run alongside the running one, not more
+        high = [self.queue.put(FakeQueueItem('high {}'.format(i), srQueuePriorities.HIGH, self.release))
+                for i in range(2)]
+        self.assertTrue(high[0].started.wait(2))
+        self.assertFalse(high[1].started.wait(0.2))
+        self.assertEqual(len(self.queue.current_items), 2)
+
+        self.release.set()
+        self.assertTrue(high[1].started.wait(2))
+
+
+class SearchQueueTests(tests.SiCKRAGETestDBCase):
+    def setUp(self):
+        super(SearchQueueTests, self).setUp()
+        sickrage.app.config.search_queue_workers = 2
+        self.release = threading.Event()
+        self.queue = SearchQueue()
+        self.queue.start()
+
+    def tearDown(self):
+        self.release.set()
+        self.queue.shutdown()
+        super(SearchQueueTests, self).tearDown()
+
+    def test_workers_and_show_exclusion(self):
+        shows = [TVShow(1, indexerid, "en") for indexerid in (1, 2, 3)]
+
+        # SearchQueue.put only takes real searches, the worker limit and show exclusion come from srQueue
+        items = [srQueue.put(self.queue, FakeQueueItem('search {}'.format(i), release=self.release, show=show))
+                 for i, show in enumerate([shows[0], shows[0], shows[1], shows[2]])]
+
+        self.assertTrue(items[0].started.wait(2))
+        self.assertTrue(items[2].started.wait(2))
+
+        # second search of the same show waits for the first, the last one waits for a free worker
+        self.assertFalse(items[1].started.wait(0.2))
+        self.assertFalse(items[3].started.is_set())
+        self.assertEqual(len(self.queue.current_items), 2)
+
+        self.release.set()
+        self.assertTrue(items[1].started.wait(2))
+        self.assertTrue(items[3].started.wait(2))
+
+    def test_item_keys(self):
+        show = TVShow(1, 1, "en")
+
+        self.assertEqual(self.queue.item_key(FakeQueueItem('search', show=show)), 1)
+        self.assertIsNone(self.queue.item_key(FakeQueueItem('search')))
+
+        show_queue = ShowQueue()
+        self.assertEqual(show_queue.item_key(ShowQueueItem(show, ShowQueueActions.REFRESH)), 1)
+
+        # shows being added are known by their indexer id only
+        item = ShowQueueItem(None, ShowQueueActions.ADD)
+        item.indexer_id = 2
+        self.assertEqual(show_queue.item_key(item), 2)
+
+
+if __name__ == '__main__':
+    print("==================")
+    print("STARTING - QUEUE TESTS")
+    print("==================")
+    print("######################################################################")
+    unittest.main()
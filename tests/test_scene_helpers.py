@@ -19,16 +19,24 @@
 
 from __future__ import print_function, unicode_literals
 
+import threading
+import time
 import unittest
+from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
 
 import sickrage
 import tests
-from sickrage.core import scene_exceptions
+from sickrage.core import scene_exceptions, scene_numbering
 from sickrage.core.common import countryList
 from sickrage.core.helpers import show_names
-from sickrage.core.scene_exceptions import exceptionsCache, get_scene_exceptions, \
-    get_scene_exception_by_name
+from sickrage.core.scene_exceptions import exceptions_cache, get_scene_exceptions, \
+    get_scene_exception_by_name, update_scene_exceptions, fetch_exceptions_list, setLastRefresh, \
+    update_source_exceptions
+from sickrage.core.scene_numbering import find_scene_numbering, get_indexer_numbering, set_scene_numbering, \
+    find_scene_absolute_numbering, get_indexer_absolute_numbering
+from sickrage.core.tv.episode import TVEpisode
 from sickrage.core.tv.show import TVShow
+from sickrage.indexers import IndexerApi
 
 
 class SceneTests(tests.SiCKRAGETestDBCase):
@@ -98,7 +106,7 @@ class SceneTests(tests.SiCKRAGETestDBCase):
             'season': -1
         })
 
-        exceptionsCache[-1] = ['Exception Test']
+        exceptions_cache.clear()
         countryList['Full Country Name'] = 'FCN'
 
         self._test_allPossibleShowNames('Show Name', expected=['Show Name'])
@@ -111,6 +119,16 @@ class SceneTests(tests.SiCKRAGETestDBCase):
         self._test_allPossibleShowNames('Show Name (Full Country Name)',
                                         expected=['Show Name (Full Country Name)', 'Show Name (FCN)'])
 
+    def test_sceneExceptionsCache(self):
+        update_scene_exceptions(1, ['Show: Name'], season=2)
+        self.assertEqual(get_scene_exceptions(1, season=2), ['Show: Name'])
+        self.assertEqual(get_scene_exception_by_name('show: name'), (1, 2))
+        self.assertEqual(get_scene_exception_by_name('Show Name'), (1, 2))
+
+        update_scene_exceptions(1, [], season=2)
+        self.assertEqual(get_scene_exceptions(1, season=2), [])
+        self.assertEqual(get_scene_exception_by_name('show: name'), (None, None))
+
     def test_filterBadReleases(self):
         self._test_filterBadReleases('Show.S02.German.Stuff-Grp', False)
         self._test_filterBadReleases('Show.S02.Some.Stuff-Core2HD', False)
@@ -148,6 +166,147 @@ class SceneExceptionTestCase(tests.SiCKRAGETestDBCase):
         self.assertEqual(sickrage.app.name_cache.get('Cached Name'), 0)
 
 
+class SceneNumberingTests(tests.SiCKRAGETestDBCase):
+    def setUp(self):
+        super(SceneNumberingTests, self).setUp()
+        show = TVShow(1, 1)
+        show.save_to_db()
+        sickrage.app.showlist += [show]
+
+    def test_scene_numbering(self):
+        self.assertIsNone(find_scene_numbering(1, 1, 1, 2))
+        self.assertEqual(get_indexer_numbering(1, 1, 2, 1, fallback_to_xem=False), (2, 1))
+
+        set_scene_numbering(1, 1, season=1, episode=2, sceneSeason=2, sceneEpisode=1)
+        self.assertEqual(find_scene_numbering(1, 1, 1, 2), (2, 1))
+        self.assertEqual(get_indexer_numbering(1, 1, 2, 1, fallback_to_xem=False), (1, 2))
+
+        set_scene_numbering(1, 1, season=1, episode=2, sceneSeason=3, sceneEpisode=1)
+        self.assertEqual(find_scene_numbering(1, 1, 1, 2), (3, 1))
+        self.assertEqual(get_indexer_numbering(1, 1, 2, 1, fallback_to_xem=False), (2, 1))
+
+    def test_scene_absolute_numbering(self):
+        set_scene_numbering(1, 1, absolute_number=10, sceneAbsolute=12)
+        self.assertEqual(find_scene_absolute_numbering(1, 1, 10), 12)
+        self.assertEqual(get_indexer_absolute_numbering(1, 1, 12, fallback_to_xem=False), 10)
+        self.assertEqual(get_indexer_absolute_numbering(1, 1, 13, fallback_to_xem=False), 13)
+
+    def test_xem_refresh_unmapped(self):
+        ep = TVEpisode(sickrage.app.showlist[0], 1, 1)
+        ep.scene_season, ep.scene_episode = 2, 2
+        ep.save_to_db()
+
+        scene_numbering.xem_havemap_cache[IndexerApi(1).config['xem_origin']] = (time.time() + 60, set())
+
+        # never mapped, nothing is written
+        scene_numbering.xem_refresh(1, 1)
+        self.assertEqual(sickrage.app.main_db.get('xem_refresh', 1)['mapped'], False)
+        self.assertEqual(sickrage.app.main_db.get('tv_episodes', 1)['scene_season'], 2)
+
+        # no longer mapped, the XEM numbers are cleared
+        xemData = sickrage.app.main_db.get('xem_refresh', 1)
+        xemData['mapped'] = True
+        sickrage.app.main_db.update(xemData)
+
+        scene_numbering.xem_refresh(1, 1, force=True)
+        self.assertEqual(sickrage.app.main_db.get('tv_episodes', 1)['scene_season'], 0)
+
+    def test_xem_havemap_failure(self):
+        requests = []
+
+        class FailingSession(object):
+            def get(self, url, *args, **kwargs):
+                requests.append(url)
+                raise Exception('XEM is down')
+
+        # failures are cached too, XEM isn't asked again for every episode lookup
+        original, scene_numbering.WebSession = scene_numbering.WebSession, FailingSession
+        try:
+            self.assertIsNone(scene_numbering.get_xem_mapped_ids(1))
+            self.assertIsNone(scene_numbering.get_xem_mapped_ids(1))
+        finally:
+            scene_numbering.WebSession = original
+
+        self.assertEqual(len(requests), 1)
+
+
+class SceneExceptionSourceTests(tests.SiCKRAGETestDBCase):
+    class ExceptionsHandler(BaseHTTPRequestHandler):
+        requests = []
+
+        def do_GET(self):
+            self.requests.append(self.headers.get('If-None-Match'))
+
+            if self.headers.get('If-None-Match') == '"v1"':
+                self.send_response(304)
+                self.end_headers()
+                return
+
+            self.send_response(200)
+            self.send_header('ETag', '"v1"')
+            self.end_headers()
+            self.wfile.write(b"1: 'Show Name', 'Show\\'s Name'\n")
+
+        def log_message(self, *args):
+            pass
+
+    def setUp(self):
+        super(SceneExceptionSourceTests, self).setUp()
+        self.ExceptionsHandler.requests = []
+        self.server = HTTPServer(('127.0.0.1', 0), self.ExceptionsHandler)
+        self.url = 'http://127.0.0.1:{}/'.format(self.server.server_port)
+        threading.Thread(target=self.server.serve_forever).start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        super(SceneExceptionSourceTests, self).tearDown()
+
+    def test_conditional_fetch(self):
+        resp = fetch_exceptions_list('test', self.url)
+        self.assertIn("'Show Name'", resp.text)
+        setLastRefresh('test', resp.headers)
+
+        self.assertIsNone(fetch_exceptions_list('test', self.url))
+        self.assertEqual(self.ExceptionsHandler.requests, [None, '"v1"'])
+
+    def test_update_source_exceptions(self):
+        update_scene_exceptions(2, ['Custom Name'])
+        update_source_exceptions({'test': {1: {('Show Name', -1), ('Show Name 2', 1)}, 2: {('Custom Name', -1)}}})
+        self.assertEqual(get_scene_exception_by_name('show name'), (1, -1))
+        self.assertEqual(len(list(sickrage.app.cache_db.all('scene_exceptions'))), 3)
+
+        # the user's exception is kept even though the source no longer returns it
+        update_source_exceptions({'test': {1: {('Show Name', -1)}}})
+        self.assertEqual(get_scene_exception_by_name('show name 2'), (None, None))
+        self.assertEqual(get_scene_exception_by_name('custom name'), (2, -1))
+        self.assertEqual(len(list(sickrage.app.cache_db.all('scene_exceptions'))), 2)
+
+        update_scene_exceptions(2, ['Custom Name'])
+        update_source_exceptions({'other': {1: {('Show Name', -1)}}})
+        self.assertEqual(get_scene_exceptions(1), ['Show Name'])
+        self.assertEqual(get_scene_exceptions(2), ['Custom Name'])
+
+    def test_anidb_lookup_failure(self):
+        show = TVShow(1, 1)
+        show.name = 'Show Name'
+        show.anime = 1
+        sickrage.app.showlist = [show]
+        update_source_exceptions({'anidb': {1: {('Anime Name', -1)}}})
+
+        def anime(*args, **kwargs):
+            raise Exception('AniDB is down')
+
+        # a show that can't be looked up keeps its stored exceptions
+        original, scene_exceptions.Anime = scene_exceptions.Anime, anime
+        try:
+            update_source_exceptions(dict([scene_exceptions._anidb_exceptions_fetcher()]))
+        finally:
+            scene_exceptions.Anime = original
+
+        self.assertEqual(get_scene_exception_by_name('anime name'), (1, -1))
+
+
 if __name__ == '__main__':
     print("==================")
     print("STARTING - SCENE HELPER TESTS")
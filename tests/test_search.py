@@ -0,0 +1,75 @@
+#!/usr/bin/env python2.7
+# Author: echel0n <echel0n@sickrage.ca>
+# URL: https://sickrage.ca
+#
+# This file is part of SickRage.
+#
+# SickRage is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# SickRage is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with SickRage.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import print_function, unicode_literals
+
+import threading
+import time
+import unittest
+
+import sickrage
+import tests
+from sickrage.core.search import search_providers_concurrent
+
+
+class FakeProvider(object):
+    def __init__(self, name, delay=0):
+        self.name = name
+        self.delay = delay
+
+
+class SearchProvidersConcurrentTests(tests.SiCKRAGETestCase):
+    def setUp(self):
+        super(SearchProvidersConcurrentTests, self).setUp()
+        sickrage.app.config.search_provider_threads = 3
+        sickrage.app.config.search_provider_timeout = 1
+        self.release = threading.Event()
+
+    def tearDown(self):
+        self.release.set()
+        super(SearchProvidersConcurrentTests, self).tearDown()
+
+    def search(self, providerObj):
+        if providerObj.delay:
+            self.release.wait(providerObj.delay)
+        return {1: [providerObj.name]}
+
+    def test_results_in_provider_order(self):
+        providers = [FakeProvider('slow', delay=0.2), FakeProvider('fast')]
+
+        results = list(search_providers_concurrent(providers, self.search))
+        self.assertEqual([(p.name, r) for p, r in results], [('slow', {1: ['slow']}), ('fast', {1: ['fast']})])
+
+    def test_slow_providers_share_one_deadline(self):
+        providers = [FakeProvider('slow1', delay=10), FakeProvider('slow2', delay=10), FakeProvider('fast')]
+
+        start_time = time.time()
+        results = dict((p.name, r) for p, r in search_providers_concurrent(providers, self.search))
+
+        # the second slow provider is only given what is left of the timeout
+        self.assertLess(time.time() - start_time, 1.9)
+        self.assertEqual(results, {'slow1': {}, 'slow2': {}, 'fast': {1: ['fast']}})
+
+
+if __name__ == '__main__':
+    print("==================")
+    print("STARTING - SEARCH TESTS")
+    print("==================")
+    print("######################################################################")
+    unittest.main()
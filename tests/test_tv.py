@@ -19,10 +19,13 @@
 
 from __future__ import unicode_literals
 
+import datetime
 import unittest
 
 import sickrage
 import tests
+from sickrage.core.common import DOWNLOADED, WANTED, Quality
+from sickrage.core.helpers import findCertainShow, search_showlist_by_name
 from sickrage.core.tv.episode import TVEpisode
 from sickrage.core.tv.show import TVShow
 
@@ -53,6 +56,20 @@ class TVShowTests(tests.SiCKRAGETestDBCase):
         show.save_to_db()
         self.assertEqual(show.name, "newName")
 
+    def test_load_shows_header_only(self):
+        show = TVShow(1, 0001, "en")
+        show.name = "show name"
+        show.save_to_db()
+
+        sickrage.app.showlist = []
+        sickrage.app.load_shows(header_only=True)
+        self.assertEqual(len(sickrage.app.showlist), 1)
+        self.assertEqual(sickrage.app.showlist[0].name, "show name")
+
+        sickrage.app.load_show_details()
+        self.assertEqual(sickrage.app.showlist[0].name, "show name")
+        self.assertEqual(len(sickrage.app.quicksearch_cache.get_shows("show name")), 1)
+
 
 class TVEpisodeTests(tests.SiCKRAGETestDBCase):
     def test_init_empty_db(self):
@@ -64,6 +81,36 @@ class TVEpisodeTests(tests.SiCKRAGETestDBCase):
         ep.load_from_db(1, 1)
         self.assertEqual(ep.name, "asdasdasdajkaj")
 
+    def test_show_stats(self):
+        show = TVShow(1, 0001, "en")
+        show.save_to_db()
+
+        for episode in (1, 2):
+            ep = TVEpisode(show, 1, episode)
+            ep.indexerid = episode
+            ep.airdate = datetime.date.fromordinal(733832)
+            ep.status = Quality.compositeStatus(DOWNLOADED, Quality.SDTV)
+            ep.file_size = 100
+            ep.save_to_db()
+
+        stats = sickrage.app.show_stats_cache.get(show.indexerid)
+        self.assertEqual(stats['ep_downloaded'], 2)
+        self.assertEqual(stats['total_size'], 200)
+        self.assertEqual(stats['ep_airs_prev'], 733832)
+
+        # changes to episodes are applied to the stats without rebuilding them
+        ep.status = WANTED
+        ep.file_size = 0
+        ep.save_to_db()
+
+        stats = sickrage.app.show_stats_cache.get(show.indexerid)
+        self.assertEqual(stats['ep_downloaded'], 1)
+        self.assertEqual(stats['ep_total'], 2)
+        self.assertEqual(stats['total_size'], 100)
+
+        sickrage.app.show_stats_cache.build(show.indexerid)
+        self.assertEqual(sickrage.app.show_stats_cache.get(show.indexerid), stats)
+
 
 class TVTests(tests.SiCKRAGETestDBCase):
     def test_getEpisode(self):
@@ -79,6 +126,21 @@ class TVTests(tests.SiCKRAGETestDBCase):
         show.save_to_db()
         sickrage.app.showlist = [show]
 
+    def test_showlist_lookup(self):
+        show = TVShow(1, 0001, "en")
+        show.name = "show name"
+        sickrage.app.showlist = [show]
+
+        self.assertIs(findCertainShow(0001), show)
+        self.assertIs(search_showlist_by_name("Show Name"), show)
+
+        show.name = "new show name"
+        self.assertIsNone(search_showlist_by_name("show name"))
+        self.assertIs(search_showlist_by_name("new show name"), show)
+
+        sickrage.app.showlist.remove(show)
+        self.assertIsNone(findCertainShow(0001))
+
 
 if __name__ == '__main__':
     print "=================="